@@ -0,0 +1,79 @@
+"""Time diff_assets array strategies on a large synthetic asset.
+
+Usage: python benchmarks/bench_diff.py [--controls N] [--edits N] [--iterations N]
+
+Builds an asset with N controls whose elements differ only deep inside, moves
+``--edits`` of them around, and reports time and patch size for whole-array
+replace, element-level ``lcs``, ``lcs`` with hashed element matching, and
+``lcs`` with move/copy detection. A second run regroups ``--edits`` controls
+under new parent objects, which ``moves`` turns into ``move`` ops.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mcp.diff import diff_assets  # noqa: E402
+
+
+def _control(i: int) -> dict:
+    params = {f"p{j}": {"min": 0, "max": j, "label": f"param {j}", "step": 0} for j in range(8)}
+    params["p7"]["step"] = i  # elements only differ in their last field
+    return {"type": "slider", "params": params}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--controls", type=int, default=1000)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    base = {"$schema": "asset.schema.json", "controls": [_control(i) for i in range(args.controls)]}
+    new = copy.deepcopy(base)
+    for _ in range(args.edits):
+        del new["controls"][rng.randrange(len(new["controls"]))]
+        new["controls"].insert(rng.randrange(len(new["controls"]) + 1), _control(rng.randrange(10**6)))
+
+    size = len(json.dumps(new))
+    limit = 2 * args.controls
+    print(f"{args.controls} controls, {args.edits} edits, asset {size} bytes")
+    for label, kwargs in (
+        ("replace", {"arrays": "replace"}),
+        ("lcs", {"arrays": "lcs", "array_max": limit}),
+        ("lcs+hash", {"arrays": "lcs", "array_max": limit, "hashed": True}),
+        ("lcs+moves", {"arrays": "lcs", "array_max": limit, "moves": True}),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            patch = diff_assets(base, new, **kwargs)["patch"]
+        elapsed = (time.perf_counter() - start) / args.iterations
+        print(f"{label:>10}: {elapsed * 1e3:8.1f} ms  {len(patch):5d} ops  {len(json.dumps(patch)):9d} bytes")
+
+    base = {"$schema": "asset.schema.json", "blocks": {f"b{i}": _control(i) for i in range(args.controls)}}
+    new = copy.deepcopy(base)
+    for i in rng.sample(range(args.controls), min(args.edits, args.controls)):
+        new.setdefault(f"group{i % 10}", {})[f"b{i}"] = new["blocks"].pop(f"b{i}")
+    print(f"regrouped {min(args.edits, args.controls)} of {args.controls} blocks")
+    for label, kwargs in (("plain", {}), ("moves", {"moves": True})):
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            patch = diff_assets(base, new, **kwargs)["patch"]
+        elapsed = (time.perf_counter() - start) / args.iterations
+        print(f"{label:>10}: {elapsed * 1e3:8.1f} ms  {len(patch):5d} ops  {len(json.dumps(patch)):9d} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
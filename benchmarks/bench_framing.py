@@ -0,0 +1,65 @@
+"""Compare the shared FrameBuffer with the old ``buffer += chunk`` framing.
+
+Usage: python benchmarks/bench_framing.py [--rounds N]
+
+Feeds two streams through both splitters in 4 KiB (old) and 64 KiB (new)
+chunks: one near-limit 1 MiB frame, and 20k pipelined small frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mcp.framing import FrameBuffer  # noqa: E402
+
+
+def _legacy(stream: bytes, chunk: int) -> int:
+    # The loop tcp_main/socket_main used before the shared reader.
+    buffer = b""
+    count = 0
+    for start in range(0, len(stream), chunk):
+        buffer += stream[start : start + chunk]
+        while b"\n" in buffer:
+            _line, buffer = buffer.split(b"\n", 1)
+            count += 1
+    return count
+
+
+def _shared(stream: bytes, chunk: int) -> int:
+    frames = FrameBuffer()
+    view = memoryview(stream)
+    count = 0
+    for start in range(0, len(stream), chunk):
+        count += len(frames.feed(view[start : start + chunk]))
+    return count
+
+
+def _time(fn, stream: bytes, chunk: int, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(stream, chunk)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    large = b'{"blob": "' + b"x" * (1024 * 1024 - 32) + b'"}\n'
+    small = b'{"jsonrpc": "2.0", "id": 1, "method": "list_schemas"}\n' * 20000
+    for label, stream in (("1 MiB frame", large), ("20k small frames", small)):
+        legacy = _time(_legacy, stream, 4096, args.rounds)
+        shared = _time(_shared, stream, 65536, args.rounds)
+        print(f"{label:<18} legacy={legacy:9.2f}ms shared={shared:9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
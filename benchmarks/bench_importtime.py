@@ -0,0 +1,109 @@
+"""Measure the import cost of the CLI and STDIO start-up paths.
+
+Usage: python benchmarks/bench_importtime.py [--runs N] [--max-ms MS]
+
+Each scenario runs in a fresh interpreter under ``-X importtime``; the time
+reported is the cumulative import time of every top-level import the scenario
+adds on top of a bare ``python -c pass``, taking the median over the runs.
+The script also fails when a scenario loads a module it should not need
+(``httpx``, ``asyncio``, the socket/TCP transports), and with ``--max-ms``
+when any median exceeds the given budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "tests" / "fixtures"
+
+HEAVY = ("httpx", "asyncio", "mcp.async_main", "mcp.socket_main", "mcp.tcp_main", "mcp.watch")
+
+SCENARIOS = {
+    # python -m mcp --validate with a local schema.
+    "validate": (
+        "import mcp.__main__ as m; m._run_validation({path!r})",
+        HEAVY,
+    ),
+    # What a STDIO session loads before reading its first request.
+    "stdio": (
+        "import mcp.stdio_main",
+        HEAVY + ("jsonschema", "referencing"),
+    ),
+    "cli": (
+        "import mcp.__main__",
+        HEAVY + ("jsonschema", "referencing"),
+    ),
+}
+
+_REPORT = "import sys; print('loaded=' + ','.join(m for m in {heavy!r} if m in sys.modules))"
+
+
+def _top_level_ms(stderr: str) -> float:
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == "package" or not cumulative.strip().isdigit():
+            continue  # header line
+        if name.startswith(" ") and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1000.0
+
+
+def _run(code: str, env: dict) -> tuple[float, str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"scenario failed:\n{proc.stderr}")
+    return _top_level_ms(proc.stderr), proc.stdout.strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    env = os.environ.copy()
+    env.setdefault("SYN_SCHEMAS_DIR", str(FIXTURES / "schemas"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    path = str(FIXTURES / "examples" / "AssetExample.json")
+
+    _run("pass", env)  # populate __pycache__ before timing anything
+    baseline = statistics.median(_run("pass", env)[0] for _ in range(args.runs))
+
+    failed = False
+    for name, (template, forbidden) in SCENARIOS.items():
+        code = template.format(path=path) + "\n" + _REPORT.format(heavy=forbidden)
+        _run(code, env)
+        samples = []
+        loaded = ""
+        for _ in range(args.runs):
+            ms, out = _run(code, env)
+            samples.append(ms - baseline)
+            loaded = out.rpartition("loaded=")[2]
+        median = statistics.median(samples)
+        print(f"{name:>9}: {median:7.1f} ms imports (min {min(samples):.1f})"
+              f"  unexpected: {loaded or '-'}")
+        if loaded:
+            failed = True
+        if args.max_ms is not None and median > args.max_ms:
+            print(f"{name:>9}: over budget of {args.max_ms:.1f} ms", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
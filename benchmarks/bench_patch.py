@@ -0,0 +1,129 @@
+"""Time apply_patch on a large asset against a deep-copying baseline.
+
+Usage: python benchmarks/bench_patch.py [--controls N] [--ops N] [--iterations N]
+
+The patch comes from ``diff_assets(arrays="lcs")`` between a large asset and a
+copy with ``--ops`` scattered edits. ``deepcopy`` copies the base and then
+applies the patch in place, which is what a naive non-mutating apply does.
+The second table compares ``validate_patch`` (base verdict cached) with a full
+``validate_asset`` of the patched asset, against a schema written to a
+temporary ``SYN_SCHEMAS_DIR``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mcp.diff import diff_assets  # noqa: E402
+from mcp.patch import apply_patch, patch_document, validate_patch  # noqa: E402
+from mcp.validate import invalidate_result_cache, validate_asset  # noqa: E402
+
+SCHEMA_URL = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/asset.schema.json"
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "controls": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "params"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "params": {"additionalProperties": {"$ref": "#/$defs/param"}},
+                },
+            },
+        }
+    },
+    "$defs": {
+        "param": {
+            "type": "object",
+            "required": ["min", "max", "value"],
+            "properties": {"min": {"type": "number"}, "max": {"type": "number"}, "value": {"type": "number"}},
+        }
+    },
+}
+
+
+def _asset(controls: int) -> dict:
+    return {
+        "$schema": SCHEMA_URL,
+        "controls": [
+            {"id": f"c{i}", "params": {f"p{j}": {"min": 0, "max": j, "value": i} for j in range(6)}}
+            for i in range(controls)
+        ],
+    }
+
+
+def _time(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--controls", type=int, default=2000)
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    base = _asset(args.controls)
+    new = copy.deepcopy(base)
+    for _ in range(args.ops):
+        control = rng.choice(new["controls"])
+        control["params"][f"p{rng.randrange(6)}"]["value"] = rng.randrange(10**6)
+    patch = diff_assets(base, new, arrays="lcs", array_max=4 * args.controls)["patch"]
+    assert apply_patch(base, patch)["asset"] == new
+
+    print(f"{args.controls} controls, {len(patch)} ops")
+    results = {
+        "copy-on-write": _time(lambda: apply_patch(base, patch), args.iterations),
+        "deepcopy": _time(
+            lambda: patch_document(copy.deepcopy(base), patch, in_place=True), args.iterations
+        ),
+    }
+    # Keep the patched copies alive so their deallocation is not timed.
+    copies = [copy.deepcopy(base) for _ in range(args.iterations)]
+    done = []
+    results["in place"] = _time(
+        lambda: done.append(apply_patch(copies.pop(), patch, in_place=True)), args.iterations
+    )
+    for label, elapsed in results.items():
+        print(f"{label:>14}: {elapsed * 1e3:8.2f} ms")
+
+    with tempfile.TemporaryDirectory() as schemas:
+        with open(os.path.join(schemas, "asset.schema.json"), "w") as fh:
+            json.dump(SCHEMA, fh)
+        os.environ["SYN_SCHEMAS_DIR"] = schemas
+        full = local = 0.0
+        for _ in range(args.iterations):
+            invalidate_result_cache()
+            start = time.perf_counter()
+            validate_asset(new)
+            full += time.perf_counter() - start
+            invalidate_result_cache()
+            validate_asset(base)  # the verdict an editor already holds
+            start = time.perf_counter()
+            assert validate_patch(base, patch)["scope"] == "local"
+            local += time.perf_counter() - start
+    print(f"{'validate_asset':>14}: {full / args.iterations * 1e3:8.2f} ms")
+    print(f"{'validate_patch':>14}: {local / args.iterations * 1e3:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Compare validate_asset throughput across validator engines.
+
+Usage: python benchmarks/bench_validate.py [--iterations N] [PATH ...]
+
+Defaults to the SynestheticAsset_* examples from the schemas submodule and
+falls back to the test fixtures when the submodule is not checked out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mcp.validate import (  # noqa: E402
+    _schema_target,
+    _validator_for_target,
+    invalidate_validator_cache,
+    validate_asset,
+)
+
+SUBMODULE_EXAMPLES = ROOT / "libs" / "synesthetic-schemas" / "examples"
+FIXTURES = ROOT / "tests" / "fixtures"
+
+
+def _default_paths() -> list[Path]:
+    paths = sorted(SUBMODULE_EXAMPLES.glob("SynestheticAsset_*.json"))
+    if paths:
+        return paths
+    return sorted((FIXTURES / "examples").glob("*.json"))
+
+
+def _run(engine: str, assets: list, iterations: int) -> tuple[float, float, list]:
+    os.environ["MCP_VALIDATOR_ENGINE"] = engine
+    invalidate_validator_cache()
+    results = [validate_asset(asset) for asset in assets]  # warm the cache
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for asset in assets:
+            validate_asset(asset)
+    end_to_end = time.perf_counter() - start
+
+    # Engine-only: the iter_errors cost without marker/size/cache bookkeeping.
+    pairs = []
+    for asset in assets:
+        validator = _validator_for_target(*_schema_target(asset["$schema"]))
+        payload = {k: v for k, v in asset.items() if k != "$schema"}
+        pairs.append((validator, payload))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for validator, payload in pairs:
+            for _err in validator.iter_errors(payload):
+                pass
+    engine_only = time.perf_counter() - start
+    return end_to_end, engine_only, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("paths", nargs="*", type=Path)
+    args = parser.parse_args(argv)
+
+    # Measure the engines, not the result cache.
+    os.environ["MCP_RESULT_CACHE"] = "0"
+    if not SUBMODULE_EXAMPLES.is_dir():
+        os.environ.setdefault("SYN_SCHEMAS_DIR", str(FIXTURES / "schemas"))
+    paths = args.paths or _default_paths()
+    assets = [json.loads(path.read_text()) for path in paths]
+    if not assets:
+        print("no assets to benchmark", file=sys.stderr)
+        return 1
+
+    timings = {}
+    outputs = {}
+    for engine in ("reference", "compiled"):
+        *timings[engine], outputs[engine] = _run(engine, assets, args.iterations)
+
+    calls = len(assets) * args.iterations
+    print(f"{len(assets)} assets x {args.iterations} iterations")
+    for engine, (end_to_end, engine_only) in timings.items():
+        print(
+            f"{engine:>9}: validate_asset {end_to_end * 1e6 / calls:8.1f} us"
+            f"  iter_errors {engine_only * 1e6 / calls:8.1f} us"
+        )
+    ref, comp = timings["reference"], timings["compiled"]
+    print(f"  speedup: validate_asset {ref[0] / comp[0]:.1f}x  iter_errors {ref[1] / comp[1]:.1f}x")
+    print(f"   parity: {outputs['reference'] == outputs['compiled']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
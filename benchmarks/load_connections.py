@@ -0,0 +1,94 @@
+"""Compare connection scaling of the threaded and asyncio TCP servers.
+
+Usage: python benchmarks/load_connections.py [--clients N ...] [--requests N]
+
+For each client count, opens that many concurrent connections against an
+in-process server, sends ``--requests`` ``get_schema`` calls on each and
+reports how many clients completed, wall time and p50/p99 request latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mcp.async_main import AsyncTCPServer  # noqa: E402
+from mcp.stdio_main import dispatch  # noqa: E402
+from mcp.tcp_main import TCPServer  # noqa: E402
+
+REQUEST = (
+    json.dumps({"jsonrpc": "2.0", "id": 1, "method": "get_schema", "params": {"name": "missing"}})
+    + "\n"
+).encode("utf-8")
+
+
+async def _client(host: str, port: int, requests: int, timeout: float) -> list[float]:
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    latencies = []
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            writer.write(REQUEST)
+            await writer.drain()
+            await asyncio.wait_for(reader.readline(), timeout)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+    return latencies
+
+
+async def _load(host: str, port: int, clients: int, requests: int, timeout: float):
+    tasks = [_client(host, port, requests, timeout) for _ in range(clients)]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _run(label: str, server, clients: int, requests: int, timeout: float) -> None:
+    host, port = server.start()
+    thread = threading.Thread(target=server.serve_forever, args=(dispatch,), daemon=True)
+    thread.start()
+    started = time.perf_counter()
+    outcomes = asyncio.run(_load(host, port, clients, requests, timeout))
+    wall = time.perf_counter() - started
+    server.close()
+    thread.join(timeout=5)
+
+    latencies = sorted(v for o in outcomes if isinstance(o, list) for v in o)
+    completed = sum(1 for o in outcomes if isinstance(o, list))
+    p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else float("nan")
+    print(
+        f"{label:<10} clients={clients:<5} ok={completed:<5} "
+        f"wall={wall:7.3f}s p50={p50:7.2f}ms p99={p99:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="*", default=[50, 200, 1000])
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # Each client costs one descriptor on both ends of the connection.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(soft, 2 * max(args.clients) + 64))
+    resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+
+    for clients in args.clients:
+        _run("threaded", TCPServer("127.0.0.1", 0), clients, args.requests, args.timeout)
+        _run("asyncio", AsyncTCPServer("127.0.0.1", 0), clients, args.requests, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,15 +14,22 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, List, Tuple
 
-from . import socket_main, stdio_main, tcp_main
+from .bundle import bundle_path, load_configured_bundle, write_bundle
 from .core import (
     SUBMODULE_SCHEMAS_DIR,
     _examples_dir,
+    _infer_schema_name_from_example,
+    get_example,
     labs_schema_base,
     labs_schema_cache_dir,
     labs_schema_version,
+    list_examples,
+    schema_catalog,
 )
-from .validate import validate_asset
+from .validate import _SCHEMA_ALIASES, local_registry, prewarm_validators, validate_asset
+
+# Transports and the watcher are imported by the code paths that use them, so
+# ``--validate`` and ``--build-bundle`` never load asyncio, sockets or ctypes.
 
 DEFAULT_READY_FILE = "/tmp/mcp.ready"
 DEFAULT_SOCKET_PATH = "/tmp/mcp.sock"
@@ -71,11 +78,59 @@ def _log_event(event: str, **fields: object) -> None:
 
 def _schema_log_fields() -> dict[str, object]:
     cache_dir = labs_schema_cache_dir()
-    return {
+    fields: dict[str, object] = {
         "schemas_base": labs_schema_base(),
         "schema_version": labs_schema_version(),
         "cache_dir": str(cache_dir) if cache_dir else "none",
     }
+    bundle = bundle_path()
+    if bundle is not None:
+        fields["bundle"] = bundle
+    return fields
+
+
+def _prewarm_enabled() -> bool:
+    raw = os.environ.get("MCP_PREWARM")
+    if raw is None or not raw.strip():
+        return False
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _prewarm() -> dict[str, object]:
+    """Load the catalog and registry, compile every validator and validate
+    one example per schema so the first requests skip the cold path."""
+    started = time.perf_counter()
+    schema_catalog()
+    local_registry()
+    warmed = prewarm_validators()
+    # Examples are named freely, so match them to schemas by their $schema
+    # marker (or filename fallback) and take the first one for each schema.
+    pending = set(warmed)
+    examples = 0
+    root = _examples_dir()
+    for item in list_examples().get("examples", []):
+        if not pending:
+            break
+        path = Path(item["path"])
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if not isinstance(data, dict):
+                continue
+            name = _infer_schema_name_from_example(path, data)
+            name = _SCHEMA_ALIASES.get(name, name)
+            if name not in pending:
+                continue
+            pending.discard(name)
+            get_example(os.path.relpath(path, root))
+            examples += 1
+        except Exception:
+            logging.warning("mcp:warning reason=prewarm_failed example=%s", path, exc_info=True)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return {
+        "prewarm_ms": f"{elapsed_ms:.1f}",
+        "prewarm_validators": len(warmed),
+        "prewarm_examples": examples,
+    }
 
 
 class _SignalShutdown(BaseException):
@@ -119,6 +174,10 @@ def _normalize_mode(raw: str) -> str:
         return "socket"
     if value == "tcp":
         return "tcp"
+    if value in {"tcp-async", "tcp_async"}:
+        return "tcp-async"
+    if value in {"socket-async", "socket_async", "unix-async"}:
+        return "socket-async"
     raise RuntimeError
 
 
@@ -129,7 +188,8 @@ def _endpoint() -> str:
             return _normalize_mode(raw_mode)
         except RuntimeError as exc:
             raise RuntimeError(
-                "Unsupported MCP transport; set MCP_MODE to 'stdio', 'socket', or 'tcp'"
+                "Unsupported MCP transport; set MCP_MODE to 'stdio', 'socket', 'tcp', "
+                "'socket-async', or 'tcp-async'"
             ) from exc
 
     raw_endpoint = os.environ.get("MCP_ENDPOINT")
@@ -138,7 +198,8 @@ def _endpoint() -> str:
             return _normalize_mode(raw_endpoint)
         except RuntimeError as exc:
             raise RuntimeError(
-                "Unsupported MCP transport; set MCP_MODE or MCP_ENDPOINT to 'stdio', 'socket', or 'tcp'"
+                "Unsupported MCP transport; set MCP_MODE or MCP_ENDPOINT to 'stdio', "
+                "'socket', 'tcp', 'socket-async', or 'tcp-async'"
             ) from exc
 
     return "tcp"
@@ -208,7 +269,11 @@ def _clear_ready_file(path: Path | None) -> None:
         path.unlink()
 
 
-def _run_stdio(schemas_dir: str, ready_file: Path | None) -> int:
+def _run_stdio(
+    schemas_dir: str,
+    ready_file: Path | None,
+    ready_fields: dict[str, object] | None = None,
+) -> int:
     handlers = _install_signal_handlers()
 
     examples_dir = _examples_dir_for_log()
@@ -218,7 +283,10 @@ def _run_stdio(schemas_dir: str, ready_file: Path | None) -> int:
         schemas_dir=schemas_dir,
         examples_dir=examples_dir,
         **_schema_log_fields(),
+        **(ready_fields or {}),
     )
+    from . import stdio_main
+
     _write_ready_file(ready_file)
     exit_code = 0
     try:
@@ -237,6 +305,7 @@ def _run_stdio(schemas_dir: str, ready_file: Path | None) -> int:
             schemas_dir=schemas_dir,
             examples_dir=examples_dir,
             **_schema_log_fields(),
+            **(ready_fields or {}),
         )
         with contextlib.suppress(Exception):
             sys.stderr.flush()
@@ -249,11 +318,25 @@ def _run_stdio(schemas_dir: str, ready_file: Path | None) -> int:
 
 
 def _run_socket(
-    socket_path: Path, mode: int, ready_file: Path | None, schemas_dir: str
+    socket_path: Path,
+    mode: int,
+    ready_file: Path | None,
+    schemas_dir: str,
+    transport: str = "socket",
+    ready_fields: dict[str, object] | None = None,
 ) -> int:
+    from . import stdio_main
+
     handlers = _install_signal_handlers()
 
-    server = socket_main.SocketServer(socket_path, mode)
+    if transport == "socket-async":
+        from . import async_main
+
+        server = async_main.AsyncSocketServer(socket_path, mode)
+    else:
+        from . import socket_main
+
+        server = socket_main.SocketServer(socket_path, mode)
     exit_code = 0
     examples_dir = _examples_dir_for_log()
     try:
@@ -264,11 +347,12 @@ def _run_socket(
     else:
         _log_event(
             "ready",
-            mode="socket",
+            mode=transport,
             path=socket_path,
             schemas_dir=schemas_dir,
             examples_dir=examples_dir,
             **_schema_log_fields(),
+            **(ready_fields or {}),
         )
         _write_ready_file(ready_file)
         try:
@@ -278,16 +362,17 @@ def _run_socket(
         except KeyboardInterrupt:
             exit_code = 0
         except Exception:
-            logging.exception("mcp:error reason=runtime_failure mode=socket")
+            logging.exception("mcp:error reason=runtime_failure mode=%s", transport)
             exit_code = 1
         finally:
             _log_event(
                 "shutdown",
-                mode="socket",
+                mode=transport,
                 path=socket_path,
                 schemas_dir=schemas_dir,
                 examples_dir=examples_dir,
                 **_schema_log_fields(),
+                **(ready_fields or {}),
             )
             with contextlib.suppress(Exception):
                 sys.stderr.flush()
@@ -301,10 +386,26 @@ def _run_socket(
     return exit_code
 
 
-def _run_tcp(host: str, port: int, ready_file: Path | None, schemas_dir: str) -> int:
+def _run_tcp(
+    host: str,
+    port: int,
+    ready_file: Path | None,
+    schemas_dir: str,
+    transport: str = "tcp",
+    ready_fields: dict[str, object] | None = None,
+) -> int:
+    from . import stdio_main
+
     handlers = _install_signal_handlers()
 
-    server = tcp_main.TCPServer(host, port)
+    if transport == "tcp-async":
+        from . import async_main
+
+        server = async_main.AsyncTCPServer(host, port)
+    else:
+        from . import tcp_main
+
+        server = tcp_main.TCPServer(host, port)
     exit_code = 0
     examples_dir = _examples_dir_for_log()
     try:
@@ -317,12 +418,13 @@ def _run_tcp(host: str, port: int, ready_file: Path | None, schemas_dir: str) ->
     else:
         _log_event(
             "ready",
-            mode="tcp",
+            mode=transport,
             host=bound_host,
             port=bound_port,
             schemas_dir=schemas_dir,
             examples_dir=examples_dir,
             **_schema_log_fields(),
+            **(ready_fields or {}),
         )
         _write_ready_file(ready_file)
         try:
@@ -332,17 +434,18 @@ def _run_tcp(host: str, port: int, ready_file: Path | None, schemas_dir: str) ->
         except KeyboardInterrupt:
             exit_code = 0
         except Exception:
-            logging.exception("mcp:error reason=runtime_failure mode=tcp")
+            logging.exception("mcp:error reason=runtime_failure mode=%s", transport)
             exit_code = 1
         finally:
             _log_event(
                 "shutdown",
-                mode="tcp",
+                mode=transport,
                 host=bound_host,
                 port=bound_port,
                 schemas_dir=schemas_dir,
                 examples_dir=examples_dir,
                 **_schema_log_fields(),
+                **(ready_fields or {}),
             )
             with contextlib.suppress(Exception):
                 sys.stderr.flush()
@@ -409,6 +512,21 @@ def _run_validation(path: str) -> int:
     return 0 if validation.get("ok", False) else 1
 
 
+def _run_build_bundle(path: str) -> int:
+    try:
+        summary = write_bundle(Path(path))
+    except Exception as exc:
+        result = {
+            "ok": False,
+            "reason": "io_error",
+            "errors": [{"path": "/", "msg": f"bundle_failed: {exc}"}],
+        }
+        print(json.dumps(result))
+        return 2
+    print(json.dumps({"ok": True, "path": path, **summary}))
+    return 0
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Synesthetic MCP server")
     parser.add_argument(
@@ -416,10 +534,24 @@ def main(argv: list[str] | None = None) -> None:
         metavar="PATH",
         help="Validate a JSON asset file and print the result",
     )
+    parser.add_argument(
+        "--build-bundle",
+        metavar="PATH",
+        help="Write a schema bundle for MCP_SCHEMA_BUNDLE and exit",
+    )
     args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+    if args.build_bundle:
+        sys.exit(_run_build_bundle(args.build_bundle))
+
+    try:
+        bundle = load_configured_bundle()
+    except Exception as exc:
+        logging.error("mcp:error reason=setup_failed detail=%s", exc)
+        sys.exit(2)
+
     if args.validate:
         code = _run_validation(args.validate)
         sys.exit(code)
@@ -427,8 +559,11 @@ def main(argv: list[str] | None = None) -> None:
     try:
         schemas_dir = _resolve_schemas_dir()
     except Exception as exc:
-        logging.error("mcp:error reason=setup_failed detail=%s", exc)
-        sys.exit(2)
+        if bundle is None:
+            logging.error("mcp:error reason=setup_failed detail=%s", exc)
+            sys.exit(2)
+        # The bundle carries every schema; the directory need not exist.
+        schemas_dir = str(bundle["schemas_dir"])
 
     try:
         endpoint = _endpoint()
@@ -438,31 +573,48 @@ def main(argv: list[str] | None = None) -> None:
 
     ready_file = _ready_file_path()
 
+    try:
+        from .watch import start_watcher
+
+        watcher = start_watcher()
+    except Exception as exc:
+        logging.error("mcp:error reason=setup_failed detail=%s", exc)
+        sys.exit(2)
+
+    ready_fields: dict[str, object] = {}
+    if _prewarm_enabled():
+        # Warm caches before anything reports ready.
+        ready_fields = _prewarm()
+
     code = 0
     try:
         if endpoint == "stdio":
-            code = _run_stdio(schemas_dir, ready_file)
-        elif endpoint == "socket":
+            code = _run_stdio(schemas_dir, ready_file, ready_fields)
+        elif endpoint in {"socket", "socket-async"}:
             socket_path = _socket_path()
             try:
                 mode = _socket_mode()
             except Exception as exc:
                 logging.error("mcp:error reason=setup_failed detail=%s", exc)
                 sys.exit(2)
-            code = _run_socket(socket_path, mode, ready_file, schemas_dir)
-        else:  # tcp
+            code = _run_socket(
+                socket_path, mode, ready_file, schemas_dir, endpoint, ready_fields
+            )
+        else:  # tcp, tcp-async
             host = _tcp_host()
             try:
                 port = _tcp_port()
             except Exception as exc:
                 logging.error("mcp:error reason=setup_failed detail=%s", exc)
                 sys.exit(2)
-            code = _run_tcp(host, port, ready_file, schemas_dir)
+            code = _run_tcp(host, port, ready_file, schemas_dir, endpoint, ready_fields)
     except _SignalShutdown as exc:
         code = -exc.signum
     except KeyboardInterrupt:
         code = 0
     finally:
+        if watcher is not None:
+            watcher.stop()
         _clear_ready_file(ready_file)
 
         # HACK: A small delay to mitigate race conditions during shutdown in
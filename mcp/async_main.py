@@ -0,0 +1,259 @@
+"""Asyncio TCP and Unix-domain socket servers for MCP JSON-RPC over NDJSON."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import os
+import signal
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Set, Tuple
+
+from .framing import (
+    FRAME_TOO_LARGE,
+    FrameBuffer,
+    pipeline_depth,
+    pipeline_enabled,
+    recv_size,
+)
+from .transport import payload_too_large_bytes, process_frame
+
+Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+_BACKLOG = 1024
+_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+_READ_SIZE = 65536
+
+
+def _async_workers() -> int:
+    raw = os.environ.get("MCP_ASYNC_WORKERS")
+    if raw is None or not raw.strip():
+        return min(32, (os.cpu_count() or 1) + 4)
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_ASYNC_WORKERS '{raw}'") from exc
+    if value <= 0:
+        raise RuntimeError("MCP_ASYNC_WORKERS must be a positive integer")
+    return value
+
+
+class _AsyncServer(abc.ABC):
+    """Serves every connection on one event loop; tools run on a thread pool."""
+
+    def __init__(self) -> None:
+        self._server: socket.socket | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop: asyncio.Event | None = None
+        self._lock = threading.Lock()
+        self._closing = False
+        self._signum: int | None = None
+
+    @abc.abstractmethod
+    def _bind(self) -> socket.socket:
+        """Create the bound, listening socket."""
+
+    @abc.abstractmethod
+    async def _listen(self, client: Any, server: socket.socket) -> asyncio.AbstractServer:
+        """Start serving ``client`` connections accepted on ``server``."""
+
+    def _cleanup(self) -> None:
+        """Hook for transport-specific teardown after the listener closes."""
+
+    def _open(self) -> None:
+        if self._server is not None:
+            return
+        server = self._bind()
+        server.listen(_BACKLOG)
+        server.setblocking(False)
+        self._server = server
+
+    def close(self) -> None:
+        with self._lock:
+            self._closing = True
+            loop, stop = self._loop, self._stop
+            if loop is not None and stop is not None:
+                # The loop owns the listener; serve_forever closes it on exit.
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(stop.set)
+                return
+            server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            self._cleanup()
+
+    def serve_forever(self, handler: Handler) -> None:
+        self._open()
+        # Signals raising out of a Python handler mid-loop can wedge asyncio,
+        # so the loop catches them and the caller's handler runs afterwards.
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            previous = {sig: signal.getsignal(sig) for sig in _SIGNALS}
+        self._signum = None
+        try:
+            asyncio.run(self._serve(handler, tuple(previous)))
+        finally:
+            for sig, installed in previous.items():
+                signal.signal(sig, installed)
+            self.close()
+        signum = self._signum
+        if signum is not None:
+            installed = previous.get(signum)
+            if callable(installed):
+                installed(signum, None)
+            else:
+                signal.raise_signal(signum)
+
+    def _interrupt(self, signum: int) -> None:
+        self._signum = signum
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _serve(self, handler: Handler, signals: Tuple[int, ...] = ()) -> None:
+        stop = asyncio.Event()
+        with self._lock:
+            if self._closing or self._server is None:
+                return
+            loop = self._loop = asyncio.get_running_loop()
+            self._stop = stop
+            server = self._server
+        for sig in signals:
+            loop.add_signal_handler(sig, self._interrupt, sig)
+        executor = ThreadPoolExecutor(
+            max_workers=_async_workers(), thread_name_prefix="mcp-async"
+        )
+        try:
+            client = partial(_serve_stream, handler, executor)
+            listener = await self._listen(client, server)
+            async with listener:
+                await stop.wait()
+        finally:
+            for sig in signals:
+                loop.remove_signal_handler(sig)
+            with self._lock:
+                self._loop = None
+                self._stop = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncTCPServer(_AsyncServer):
+    """Asyncio TCP server for MCP JSON-RPC requests over NDJSON."""
+
+    def __init__(self, host: str, port: int) -> None:
+        super().__init__()
+        self._host = host
+        self._requested_port = port
+
+    def start(self) -> Tuple[str, int]:
+        self._open()
+        return self.address
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        server = self._server
+        if server is None:
+            return self._host, self._requested_port
+        host, port = server.getsockname()[:2]
+        return str(host), int(port)
+
+    def _bind(self) -> socket.socket:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((self._host, self._requested_port))
+        return server
+
+    async def _listen(
+        self, client: Any, server: socket.socket
+    ) -> asyncio.AbstractServer:
+        return await asyncio.start_server(client, sock=server, limit=_READ_SIZE)
+
+
+class AsyncSocketServer(_AsyncServer):
+    """Asyncio Unix-domain socket server for MCP JSON-RPC requests."""
+
+    def __init__(self, path: Path, mode: int) -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._mode = mode
+
+    def start(self) -> None:
+        self._open()
+
+    def _bind(self) -> socket.socket:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            self._path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self._path))
+        os.chmod(str(self._path), self._mode)
+        return server
+
+    async def _listen(
+        self, client: Any, server: socket.socket
+    ) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(client, sock=server, limit=_READ_SIZE)
+
+    def _cleanup(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._path.unlink()
+
+
+async def _serve_stream(
+    handler: Handler,
+    executor: ThreadPoolExecutor,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    # Same framing as the threaded servers: one response per line, in order
+    # unless pipelining lets frames finish out of order.
+    loop = asyncio.get_running_loop()
+    frames = FrameBuffer()
+    size = recv_size()
+    pipelined = pipeline_enabled()
+    slots = asyncio.Semaphore(pipeline_depth() if pipelined else 1)
+    write_lock = asyncio.Lock()
+    tasks: Set[asyncio.Task] = set()
+
+    async def send(frame: bytes) -> None:
+        async with write_lock:
+            writer.write(frame)
+            await writer.drain()
+
+    async def run(raw_line: bytes) -> None:
+        try:
+            frame = await loop.run_in_executor(
+                executor, process_frame, raw_line, handler
+            )
+            if frame is not None:
+                await send(frame)
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            chunk = await reader.read(size)
+            if not chunk:
+                break
+            for raw_line in frames.feed(chunk):
+                if raw_line is FRAME_TOO_LARGE:
+                    await send(payload_too_large_bytes())
+                    continue
+                await slots.acquire()
+                if not pipelined:
+                    await run(raw_line)
+                    continue
+                task = loop.create_task(run(raw_line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    except ConnectionError:  # pragma: no cover - client vanished
+        pass
+    finally:
+        with contextlib.suppress(Exception):
+            writer.close()
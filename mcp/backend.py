@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import httpx
+from .validate import _size_okay, validate_asset
 
-from .validate import validate_asset, MAX_BYTES
+if TYPE_CHECKING:
+    import httpx
 
 
 def _backend_url() -> Optional[str]:
@@ -24,6 +24,7 @@ def populate_backend(
     validate_first: bool = True,
     *,
     client: Optional[httpx.Client] = None,
+    size_hint: Optional[int] = None,
 ) -> Dict[str, Any]:
     url = _backend_url()
     if not url:
@@ -33,7 +34,7 @@ def populate_backend(
             "detail": "backend disabled",
         }
 
-    if len(json.dumps(asset).encode("utf-8")) > MAX_BYTES:
+    if not _size_okay(asset, size_hint):
         return {
             "ok": False,
             "reason": "validation_failed",
@@ -41,10 +42,12 @@ def populate_backend(
         }
 
     if validate_first:
-        v = validate_asset(asset)
+        v = validate_asset(asset, size_hint=size_hint)
         if not v.get("ok", False):
             return {"ok": False, "reason": "validation_failed", "errors": v["errors"]}
 
+    import httpx  # deferred: most sessions never populate the backend
+
     need_close = False
     if client is None:
         client = httpx.Client(base_url=url, timeout=5.0)
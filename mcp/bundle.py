@@ -0,0 +1,173 @@
+"""Schema bundles: one file holding every schema the server resolves.
+
+``python -m mcp --build-bundle PATH`` snapshots the schema catalog, the local
+``$ref`` registry, the ``$schema`` aliases and any canonical schemas already in
+``LABS_SCHEMA_CACHE_DIR``. Setting ``MCP_SCHEMA_BUNDLE=PATH`` loads it with a
+single read at startup, so no schema directory is walked and nothing is
+fetched. A bundle is a snapshot: rebuild it to pick up schema changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from . import codec, validate
+from .core import (
+    SchemaEntry,
+    _schemas_dir,
+    labs_schema_base,
+    labs_schema_cache_dir,
+    labs_schema_prefix,
+    labs_schema_version,
+    pin_schema_catalog,
+    schema_catalog,
+)
+
+BUNDLE_FORMAT = "synesthetic-mcp-bundle"
+BUNDLE_VERSION = 1
+
+# ``$schema`` aliases as they stood before the first install_bundle call.
+_ALIASES_BEFORE: Dict[str, str] | None = None
+
+
+def bundle_path() -> Path | None:
+    raw = os.environ.get("MCP_SCHEMA_BUNDLE")
+    if raw is None or not raw.strip():
+        return None
+    return Path(raw.strip()).expanduser()
+
+
+def _fingerprint(body: Dict[str, Any]) -> str:
+    text = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_bundle() -> Dict[str, Any]:
+    """Collect the bundle contents from the configured directories."""
+    schemas = sorted(
+        (entry for entry in schema_catalog() if entry.inside and entry.data is not None),
+        key=lambda entry: entry.name,
+    )
+    records = [entry.to_record() for entry in schemas]
+
+    # One group per document, listing every URI it is registered under.
+    groups: Dict[int, Dict[str, Any]] = {}
+    for uri, contents in validate._local_registry_contents().items():
+        group = groups.setdefault(id(contents), {"uris": [], "schema": contents})
+        group["uris"].append(uri)
+
+    remote: Dict[str, Any] = {}
+    cache_dir = labs_schema_cache_dir()
+    if cache_dir is not None and cache_dir.is_dir():
+        prefix = labs_schema_prefix()
+        for path in sorted(cache_dir.glob("*.json")):
+            try:
+                remote[f"{prefix}{path.name}"] = json.loads(path.read_text())
+            except Exception:
+                continue
+
+    body = {
+        "schema_version": labs_schema_version(),
+        "schemas_base": labs_schema_base(),
+        "schemas_dir": str(_schemas_dir().resolve(strict=False)),
+        "aliases": dict(validate._SCHEMA_ALIASES),
+        "schemas": records,
+        "registry": list(groups.values()),
+        "remote": remote,
+    }
+    return {
+        "format": BUNDLE_FORMAT,
+        "bundle_version": BUNDLE_VERSION,
+        "fingerprint": _fingerprint(body),
+        **body,
+    }
+
+
+def bundle_summary(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "fingerprint": bundle["fingerprint"],
+        "schema_version": bundle["schema_version"],
+        "schemas": len(bundle["schemas"]),
+        "resources": sum(len(group["uris"]) for group in bundle["registry"]),
+        "remote": len(bundle["remote"]),
+    }
+
+
+def write_bundle(path: Path) -> Dict[str, Any]:
+    bundle = build_bundle()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(codec.dumps(bundle, newline=True))
+    os.replace(tmp, path)
+    return bundle_summary(bundle)
+
+
+def read_bundle(path: Path) -> Dict[str, Any]:
+    data = codec.loads(Path(path).read_bytes())
+    if not isinstance(data, dict) or data.get("format") != BUNDLE_FORMAT:
+        raise RuntimeError(f"{path} is not a schema bundle")
+    if data.get("bundle_version") != BUNDLE_VERSION:
+        raise RuntimeError(
+            f"Unsupported schema bundle version {data.get('bundle_version')!r}; rebuild it"
+        )
+    if data.get("schema_version") != labs_schema_version():
+        raise RuntimeError(
+            f"Schema bundle targets version {data.get('schema_version')!r} but "
+            f"LABS_SCHEMA_VERSION is {labs_schema_version()!r}"
+        )
+    # Bundled remote schemas are keyed by the base they were built against.
+    if data.get("schemas_base") != labs_schema_base():
+        raise RuntimeError(
+            f"Schema bundle targets base {data.get('schemas_base')!r} but "
+            f"LABS_SCHEMA_BASE is {labs_schema_base()!r}"
+        )
+    return data
+
+
+def install_bundle(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """Serve schema lookups, ``$ref`` resolution and remote fetches from ``bundle``."""
+    global _ALIASES_BEFORE
+    entries: List[SchemaEntry] = [SchemaEntry.from_record(r) for r in bundle["schemas"]]
+    contents = {uri: group["schema"] for group in bundle["registry"] for uri in group["uris"]}
+    if _ALIASES_BEFORE is None:
+        _ALIASES_BEFORE = dict(validate._SCHEMA_ALIASES)
+    _replace_aliases({**_ALIASES_BEFORE, **bundle.get("aliases", {})})
+    pin_schema_catalog(entries)
+    validate.pin_local_registry(contents)
+    validate.pin_remote_schemas(bundle["remote"])
+    validate.invalidate_validator_cache()
+    return bundle_summary(bundle)
+
+
+def uninstall_bundle() -> None:
+    global _ALIASES_BEFORE
+    if _ALIASES_BEFORE is not None:
+        _replace_aliases(_ALIASES_BEFORE)
+        _ALIASES_BEFORE = None
+    pin_schema_catalog(None)
+    validate.pin_local_registry(None)
+    validate.pin_remote_schemas(None)
+    validate.invalidate_validator_cache()
+
+
+def _replace_aliases(aliases: Dict[str, str]) -> None:
+    # In place, since other modules hold a reference to the dict itself.
+    validate._SCHEMA_ALIASES.clear()
+    validate._SCHEMA_ALIASES.update(aliases)
+
+
+def load_configured_bundle() -> Dict[str, Any] | None:
+    """Install the bundle named by ``MCP_SCHEMA_BUNDLE``, if any."""
+    path = bundle_path()
+    if path is None:
+        return None
+    bundle = read_bundle(path)
+    summary = install_bundle(bundle)
+    summary["path"] = str(path)
+    summary["schemas_dir"] = bundle.get("schemas_dir")
+    return summary
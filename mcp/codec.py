@@ -0,0 +1,96 @@
+"""JSON codec for wire frames: stdlib ``json`` by default, orjson on request.
+
+The default ``json`` codec emits exactly what ``json.dumps`` always has, so
+frames are byte-identical to earlier releases. ``MCP_JSON_CODEC=orjson``
+trades that for speed: frames are compact UTF-8 and float formatting follows
+orjson (``1e16`` rather than ``1e+16``). Input orjson would not parse exactly
+(integers beyond 64 bits, ``NaN``, malformed frames) is always handed to the
+stdlib, so values and error messages do not depend on the codec.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+_CODECS = {"json", "orjson"}
+# orjson decodes integers beyond 64 bits as floats; any run of 19+ digits
+# (including long fractions, which is harmless) goes to the stdlib instead.
+_LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+def codec_name() -> str:
+    raw = os.environ.get("MCP_JSON_CODEC")
+    if raw is None or not raw.strip():
+        return "json"
+    value = raw.strip().lower()
+    if value not in _CODECS:
+        raise RuntimeError(f"Invalid MCP_JSON_CODEC '{raw}'")
+    if value == "orjson" and orjson is None:
+        raise RuntimeError("MCP_JSON_CODEC=orjson requires the orjson package")
+    return value
+
+
+def _orjson_loads(data: bytes | str) -> Any:
+    raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+    if _LONG_NUMBER.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    raise ValueError
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode ``data``; invalid UTF-8 raises ``UnicodeDecodeError``."""
+    if codec_name() == "orjson":
+        try:
+            return _orjson_loads(data)
+        except ValueError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any, newline: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON, optionally newline-terminated."""
+    end = "\n" if newline else ""
+    if codec_name() == "orjson":
+        option = orjson.OPT_APPEND_NEWLINE if newline else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Integers beyond 64 bits, non-string keys, lone surrogates.
+            return _compact(obj, sort_keys) + end.encode("ascii")
+    return (json.dumps(obj, sort_keys=sort_keys) + end).encode("ascii")
+
+
+def canonical(obj: Any) -> bytes:
+    """A stable sorted-key encoding of ``obj`` for hashing, never for the wire.
+
+    Uses orjson whenever it is installed, whatever ``MCP_JSON_CODEC`` says.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return _compact(obj, True)
+
+
+def _compact(obj: Any, sort_keys: bool) -> bytes:
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode("ascii")
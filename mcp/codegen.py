@@ -0,0 +1,395 @@
+"""Code-generating fast path for Draft 2020-12 validators.
+
+A compiled predicate only answers "is this instance valid?"; invalid
+instances are re-run through the reference validator so error lists match
+it exactly. Keywords the compiler does not handle are delegated to the
+reference validator for that subschema only.
+"""
+
+from __future__ import annotations
+
+import numbers
+import re
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterator, List
+
+from jsonschema._utils import equal, uniq
+
+try:
+    from referencing.jsonschema import DRAFT202012  # type: ignore
+except Exception:  # pragma: no cover
+    DRAFT202012 = None  # type: ignore
+
+
+class CompileError(Exception):
+    """Raised when a schema cannot be compiled at all."""
+
+
+_TYPE_EXPRESSIONS = {
+    "object": "isinstance(x, dict)",
+    "array": "isinstance(x, list)",
+    "string": "isinstance(x, str)",
+    "boolean": "isinstance(x, bool)",
+    "null": "x is None",
+    "number": "(not isinstance(x, bool) and isinstance(x, Number))",
+    "integer": (
+        "(not isinstance(x, bool) and (isinstance(x, int)"
+        " or (isinstance(x, float) and x.is_integer())))"
+    ),
+}
+
+_OBJECT_KEYWORDS = (
+    "properties",
+    "patternProperties",
+    "additionalProperties",
+    "required",
+    "minProperties",
+    "maxProperties",
+    "dependentRequired",
+    "dependentSchemas",
+    "propertyNames",
+)
+_ARRAY_KEYWORDS = (
+    "prefixItems",
+    "items",
+    "minItems",
+    "maxItems",
+    "uniqueItems",
+    "contains",
+)
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+_NUMBER_KEYWORDS = (
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "multipleOf",
+)
+_GENERIC_KEYWORDS = (
+    "type",
+    "enum",
+    "const",
+    "$ref",
+    "allOf",
+    "anyOf",
+    "oneOf",
+    "not",
+    "if",
+)
+# Keywords known to the reference validator but missing here (e.g.
+# unevaluatedProperties, $dynamicRef) force a per-subschema fallback.
+_COMPILED_KEYWORDS = frozenset(
+    _OBJECT_KEYWORDS
+    + _ARRAY_KEYWORDS
+    + _STRING_KEYWORDS
+    + _NUMBER_KEYWORDS
+    + _GENERIC_KEYWORDS
+    + ("format",)
+)
+
+
+def _multiple_of(instance: Any, dB: Any) -> bool:
+    # Mirrors jsonschema._keywords.multipleOf.
+    if isinstance(dB, float):
+        quotient = instance / dB
+        try:
+            return int(quotient) == quotient
+        except OverflowError:
+            return (Fraction(instance) / Fraction(dB)).denominator == 1
+    return not instance % dB
+
+
+def _true(x: Any) -> bool:
+    return True
+
+
+def _false(x: Any) -> bool:
+    return False
+
+
+class _Compiler:
+    def __init__(self, root: Any) -> None:
+        self._root = root
+        self._names: Dict[int, str] = {}
+        self._sources: List[str] = []
+        self._keep: List[Any] = []
+        self.fallbacks = 0
+        self.namespace: Dict[str, Any] = {
+            "Number": numbers.Number,
+            "equal": equal,
+            "uniq": uniq,
+            "multiple_of": _multiple_of,
+            "_true": _true,
+            "_false": _false,
+        }
+
+    # -- helpers -----------------------------------------------------------
+
+    def _const(self, value: Any) -> str:
+        name = f"_k{len(self._keep)}"
+        self._keep.append(value)
+        self.namespace[name] = value
+        return name
+
+    def _fallback(self, schema: Any, resolver: Any) -> str:
+        self.fallbacks += 1
+        validator = self._root.evolve(schema=schema, _resolver=resolver)
+        return self._const(validator.is_valid)
+
+    def _enter(self, schema: Any, resolver: Any) -> Any:
+        if DRAFT202012 is None or not isinstance(schema, dict):
+            return resolver
+        return resolver.in_subresource(DRAFT202012.create_resource(schema))
+
+    # -- compilation -------------------------------------------------------
+
+    def function_for(self, schema: Any, resolver: Any) -> str:
+        if schema is True:
+            return "_true"
+        if schema is False:
+            return "_false"
+        if not isinstance(schema, dict):
+            raise CompileError(f"unsupported schema node: {schema!r}")
+        key = id(schema)
+        name = self._names.get(key)
+        if name is not None:
+            return name
+        name = f"_s{len(self._names)}"
+        self._names[key] = name
+        self._keep.append(schema)
+        try:
+            body = self._body(schema, resolver)
+        except CompileError:
+            body = [f"if not {self._fallback(schema, resolver)}(x): return False"]
+        lines = [f"def {name}(x):"]
+        lines.extend(f"    {line}" for line in body)
+        lines.append("    return True")
+        self._sources.append("\n".join(lines))
+        return name
+
+    def _child(self, schema: Any, resolver: Any) -> str:
+        return self.function_for(schema, self._enter(schema, resolver))
+
+    def _body(self, schema: Dict[str, Any], resolver: Any) -> List[str]:
+        known = self._root.VALIDATORS
+        for keyword in schema:
+            if keyword in known and keyword not in _COMPILED_KEYWORDS:
+                raise CompileError(keyword)
+        if "format" in schema and self._root.format_checker is not None:
+            raise CompileError("format")
+
+        lines: List[str] = []
+        lines.extend(self._generic(schema, resolver))
+
+        obj = self._object(schema, resolver)
+        if obj:
+            lines.append("if isinstance(x, dict):")
+            lines.extend(f"    {line}" for line in obj)
+        arr = self._array(schema, resolver)
+        if arr:
+            lines.append("if isinstance(x, list):")
+            lines.extend(f"    {line}" for line in arr)
+        text = self._string(schema)
+        if text:
+            lines.append("if isinstance(x, str):")
+            lines.extend(f"    {line}" for line in text)
+        num = self._number(schema)
+        if num:
+            lines.append(f"if {_TYPE_EXPRESSIONS['number']}:")
+            lines.extend(f"    {line}" for line in num)
+        return lines
+
+    def _generic(self, schema: Dict[str, Any], resolver: Any) -> List[str]:
+        lines: List[str] = []
+        if "type" in schema:
+            types = schema["type"]
+            if isinstance(types, str):
+                types = [types]
+            exprs = []
+            for each in types:
+                expr = _TYPE_EXPRESSIONS.get(each)
+                if expr is None:
+                    raise CompileError(f"type {each!r}")
+                exprs.append(expr)
+            lines.append(f"if not ({' or '.join(exprs) or 'False'}): return False")
+        if "enum" in schema:
+            enums = self._const(schema["enum"])
+            lines.append(
+                f"if all(not equal(each, x) for each in {enums}): return False"
+            )
+        if "const" in schema:
+            lines.append(f"if not equal(x, {self._const(schema['const'])}): return False")
+        if "$ref" in schema:
+            try:
+                resolved = resolver.lookup(schema["$ref"])
+            except Exception as exc:
+                raise CompileError(f"$ref {schema['$ref']!r}") from exc
+            target = self.function_for(resolved.contents, resolved.resolver)
+            lines.append(f"if not {target}(x): return False")
+        for subschema in schema.get("allOf", ()):
+            lines.append(f"if not {self._child(subschema, resolver)}(x): return False")
+        if "anyOf" in schema:
+            names = [self._child(s, resolver) for s in schema["anyOf"]]
+            lines.append(
+                f"if not ({' or '.join(f'{n}(x)' for n in names) or 'False'}): return False"
+            )
+        if "oneOf" in schema:
+            names = [self._child(s, resolver) for s in schema["oneOf"]]
+            calls = ", ".join(f"{n}(x)" for n in names)
+            lines.append(f"if sum(({calls},)) != 1: return False")
+        if "not" in schema:
+            lines.append(f"if {self.function_for(schema['not'], resolver)}(x): return False")
+        if "if" in schema:
+            cond = self.function_for(schema["if"], resolver)
+            then = self._child(schema["then"], resolver) if "then" in schema else None
+            else_ = self._child(schema["else"], resolver) if "else" in schema else None
+            if then is not None and else_ is not None:
+                lines.append(f"if not ({then}(x) if {cond}(x) else {else_}(x)): return False")
+            elif then is not None:
+                lines.append(f"if {cond}(x) and not {then}(x): return False")
+            elif else_ is not None:
+                lines.append(f"if not {cond}(x) and not {else_}(x): return False")
+        return lines
+
+    def _object(self, schema: Dict[str, Any], resolver: Any) -> List[str]:
+        lines: List[str] = []
+        for prop in schema.get("required", ()):
+            lines.append(f"if {prop!r} not in x: return False")
+        if "minProperties" in schema:
+            lines.append(f"if len(x) < {schema['minProperties']!r}: return False")
+        if "maxProperties" in schema:
+            lines.append(f"if len(x) > {schema['maxProperties']!r}: return False")
+        properties = schema.get("properties", {})
+        for prop, subschema in properties.items():
+            name = self._child(subschema, resolver)
+            lines.append(f"if {prop!r} in x and not {name}(x[{prop!r}]): return False")
+        patterns = schema.get("patternProperties", {})
+        for pattern, subschema in patterns.items():
+            regex = self._regex(pattern)
+            name = self._child(subschema, resolver)
+            lines.append("for k, v in x.items():")
+            lines.append(f"    if {regex}.search(k) and not {name}(v): return False")
+        if "additionalProperties" in schema:
+            aP = schema["additionalProperties"]
+            known = self._const(frozenset(properties))
+            extra = f"k not in {known}"
+            if patterns:
+                joined = self._regex("|".join(patterns))
+                extra = f"{extra} and not {joined}.search(k)"
+            if isinstance(aP, dict):
+                name = self._child(aP, resolver)
+                lines.append("for k, v in x.items():")
+                lines.append(f"    if {extra} and not {name}(v): return False")
+            elif not aP:
+                lines.append("for k in x:")
+                lines.append(f"    if {extra}: return False")
+        for prop, deps in schema.get("dependentRequired", {}).items():
+            needed = self._const(tuple(deps))
+            lines.append(
+                f"if {prop!r} in x and any(d not in x for d in {needed}): return False"
+            )
+        for prop, subschema in schema.get("dependentSchemas", {}).items():
+            name = self._child(subschema, resolver)
+            lines.append(f"if {prop!r} in x and not {name}(x): return False")
+        if "propertyNames" in schema:
+            name = self._child(schema["propertyNames"], resolver)
+            lines.append("for k in x:")
+            lines.append(f"    if not {name}(k): return False")
+        return lines
+
+    def _array(self, schema: Dict[str, Any], resolver: Any) -> List[str]:
+        lines: List[str] = []
+        if "minItems" in schema:
+            lines.append(f"if len(x) < {schema['minItems']!r}: return False")
+        if "maxItems" in schema:
+            lines.append(f"if len(x) > {schema['maxItems']!r}: return False")
+        prefix = schema.get("prefixItems", [])
+        for index, subschema in enumerate(prefix):
+            name = self._child(subschema, resolver)
+            lines.append(f"if len(x) > {index} and not {name}(x[{index}]): return False")
+        if "items" in schema:
+            items = schema["items"]
+            if items is False:
+                lines.append(f"if len(x) > {len(prefix)}: return False")
+            elif items is not True:
+                name = self._child(items, resolver)
+                source = f"x[{len(prefix)}:]" if prefix else "x"
+                lines.append(f"for v in {source}:")
+                lines.append(f"    if not {name}(v): return False")
+        if schema.get("uniqueItems"):
+            lines.append("if not uniq(x): return False")
+        if "contains" in schema:
+            name = self.function_for(schema["contains"], resolver)
+            lines.append(f"n = sum(1 for v in x if {name}(v))")
+            minimum = schema.get("minContains", 1)
+            lines.append(f"if n < {minimum!r}: return False")
+            if "maxContains" in schema:
+                lines.append(f"if n > {schema['maxContains']!r}: return False")
+        return lines
+
+    def _string(self, schema: Dict[str, Any]) -> List[str]:
+        lines: List[str] = []
+        if "minLength" in schema:
+            lines.append(f"if len(x) < {schema['minLength']!r}: return False")
+        if "maxLength" in schema:
+            lines.append(f"if len(x) > {schema['maxLength']!r}: return False")
+        if "pattern" in schema:
+            lines.append(f"if not {self._regex(schema['pattern'])}.search(x): return False")
+        return lines
+
+    def _number(self, schema: Dict[str, Any]) -> List[str]:
+        lines: List[str] = []
+        bounds = (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        )
+        for keyword, op in bounds:
+            if keyword in schema:
+                lines.append(
+                    f"if x {op} {self._const(schema[keyword])}: return False"
+                )
+        if "multipleOf" in schema:
+            dB = self._const(schema["multipleOf"])
+            lines.append(f"if not multiple_of(x, {dB}): return False")
+        return lines
+
+    def _regex(self, pattern: str) -> str:
+        try:
+            return self._const(re.compile(pattern))
+        except re.error as exc:
+            raise CompileError(f"pattern {pattern!r}") from exc
+
+    def build(self) -> Callable[[Any], bool]:
+        root = self._root
+        entry = self.function_for(root.schema, root._resolver)
+        source = "\n\n".join(self._sources)
+        exec(compile(source, f"<mcp.codegen {entry}>", "exec"), self.namespace)
+        self.source = source
+        return self.namespace[entry]
+
+
+class CompiledValidator:
+    """Drop-in for ``Draft202012Validator`` backed by a generated predicate."""
+
+    def __init__(self, reference: Any) -> None:
+        compiler = _Compiler(reference)
+        self.reference = reference
+        self.schema = reference.schema
+        self.check = compiler.build()
+        self.source = compiler.source
+        self.fallbacks = compiler.fallbacks
+
+    def is_valid(self, instance: Any) -> bool:
+        return self.check(instance)
+
+    def iter_errors(self, instance: Any) -> Iterator[Any]:
+        if self.check(instance):
+            return iter(())
+        return self.reference.iter_errors(instance)
+
+
+def compile_validator(reference: Any) -> CompiledValidator:
+    """Compile ``reference`` (a Draft 2020-12 validator) into a fast predicate."""
+    return CompiledValidator(reference)
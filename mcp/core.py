@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
 import json
 import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+from . import codec
 
 SUBMODULE_SCHEMAS_DIR = "libs/synesthetic-schemas/jsonschema"
 SUBMODULE_EXAMPLES_DIR = "libs/synesthetic-schemas/examples"
@@ -12,6 +21,12 @@ DEFAULT_LABS_SCHEMA_BASE = "https://delk73.github.io/synesthetic-schemas/schema/
 DEFAULT_LABS_SCHEMA_VERSION = "0.7.3"
 DEFAULT_LABS_SCHEMA_CACHE_DIR = ".cache/synesthetic-schemas"
 
+# Timestamps this close to "now" may be followed by another change within the
+# same mtime tick, so they are never trusted as a cache fingerprint.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_DEFAULT_EXAMPLE_CACHE_BYTES = 32 * 1024 * 1024
+
 
 def labs_schema_base() -> str:
     raw = os.environ.get("LABS_SCHEMA_BASE", DEFAULT_LABS_SCHEMA_BASE)
@@ -101,27 +116,304 @@ def _example_file_path(relative: str) -> Path:
     return _resolve_within_root(root, relative)
 
 
+class SchemaEntry:
+    """One indexed ``*.schema.json`` file; ``data`` must be treated as read-only."""
+
+    __slots__ = (
+        "name", "path", "listed_path", "mtime_ns", "size",
+        "sha256", "schema_id", "version", "data", "inside",
+    )
+
+    def __init__(self, root: Path, file_name: str, stat: os.stat_result) -> None:
+        listed = root / file_name
+        self.name = file_name[: -len(".schema.json")]
+        self.listed_path = str(listed.with_name(f"{self.name}.json"))
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        resolved = listed.resolve(strict=False)
+        self.path = resolved
+        base = root.resolve(strict=False)
+        self.inside = base in resolved.parents
+        raw = listed.read_bytes()
+        self.sha256 = hashlib.sha256(raw).hexdigest()
+        try:
+            data = codec.loads(raw)
+        except Exception:
+            data = None
+        self.data = data if isinstance(data, dict) else None
+        self.version = str(self.data.get("version", "")) if self.data is not None else ""
+        schema_id = self.data.get("$id") if self.data is not None else None
+        self.schema_id = schema_id if isinstance(schema_id, str) else None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "SchemaEntry":
+        """Rebuild an entry from ``to_record`` output (schema bundles)."""
+        entry = cls.__new__(cls)
+        entry.name = record["name"]
+        entry.path = Path(record["path"])
+        entry.listed_path = record["listed_path"]
+        entry.mtime_ns = 0  # pinned entries are never re-checked
+        entry.size = record["size"]
+        entry.sha256 = record["sha256"]
+        entry.data = record["schema"]
+        entry.version = str(entry.data.get("version", ""))
+        schema_id = entry.data.get("$id")
+        entry.schema_id = schema_id if isinstance(schema_id, str) else None
+        entry.inside = True
+        return entry
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "listed_path": self.listed_path,
+            "size": self.size,
+            "sha256": self.sha256,
+            "$id": self.schema_id,
+            "schema": self.data,
+        }
+
+    def fresh(self, stat: os.stat_result) -> bool:
+        if self.mtime_ns != stat.st_mtime_ns or self.size != stat.st_size:
+            return False
+        return not _racy(self.mtime_ns)
+
+
+def _racy(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+
+def _json_copy(value: Any) -> Any:
+    """Deep copy of decoded JSON, far cheaper than ``copy.deepcopy``."""
+    if isinstance(value, dict):
+        return {key: _json_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_copy(item) for item in value]
+    return value
+
+
+_WATCH_LOCK = threading.Lock()
+_WATCHERS = 0
+
+
+def watching() -> bool:
+    """True while a filesystem watcher publishes changes (see ``mcp.watch``).
+
+    Caches then trust their last refresh until notified instead of
+    stat-checking files on every request.
+    """
+    return _WATCHERS > 0
+
+
+def set_watching(active: bool) -> None:
+    global _WATCHERS
+    with _WATCH_LOCK:
+        _WATCHERS = max(0, _WATCHERS + (1 if active else -1))
+
+
+class _SchemaCatalog:
+    """Index of the schemas directory, refreshed from directory and file mtimes.
+
+    Only files whose mtime or size changed are re-read, so ``list_schemas``
+    and ``get_schema`` are dictionary lookups once the index is warm.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._root: str | None = None
+        self._dir_mtime_ns: int | None = None
+        self._entries: Dict[str, SchemaEntry] = {}
+        self._listing: List[Dict[str, str]] | None = None
+        self._generation = 0
+        self._reads = 0
+        # Bumped by notify(); a refresh taken at the current epoch is trusted
+        # without stat calls while a watcher is running.
+        self._epoch = 0
+        self._synced: int | None = None
+        # Entries pinned from a schema bundle replace the directory entirely.
+        self._pinned = False
+
+    def _reset(self, root: str) -> None:
+        self._root = root
+        self._dir_mtime_ns = None
+        self._entries = {}
+        self._listing = None
+        self._generation += 1
+
+    def _sync_directory(self, root: Path) -> None:
+        # Caller holds the lock. Rescans names only when the directory changed.
+        key = str(root)
+        if key != self._root:
+            self._reset(key)
+        try:
+            dir_mtime = root.stat().st_mtime_ns
+        except OSError:
+            if self._entries or self._dir_mtime_ns is not None:
+                self._reset(key)
+            return
+        if dir_mtime == self._dir_mtime_ns:
+            return
+        names = set()
+        with os.scandir(root) as scan:
+            for item in scan:
+                if item.name.endswith(".schema.json"):
+                    names.add(item.name[: -len(".schema.json")])
+        for name in list(self._entries):
+            if name not in names:
+                del self._entries[name]
+                self._changed()
+        for name in names - set(self._entries):
+            self._sync_entry(root, name)
+        self._dir_mtime_ns = None if _racy(dir_mtime) else dir_mtime
+
+    def _sync_entry(self, root: Path, name: str) -> SchemaEntry | None:
+        file_name = f"{name}.schema.json"
+        entry = self._entries.get(name)
+        try:
+            stat = os.stat(root / file_name)
+        except OSError:
+            if entry is not None:
+                del self._entries[name]
+                self._changed()
+            return None
+        if entry is not None and entry.fresh(stat):
+            return entry
+        try:
+            fresh = SchemaEntry(root, file_name, stat)
+        except OSError:
+            return None
+        self._reads += 1
+        self._entries[name] = fresh
+        if entry is None or entry.sha256 != fresh.sha256 or entry.path != fresh.path:
+            self._changed()
+        return fresh
+
+    def _changed(self) -> None:
+        self._listing = None
+        self._generation += 1
+
+    def _trusted(self, root: Path) -> bool:
+        return watching() and self._synced == self._epoch and self._root == str(root)
+
+    def _sync_all(self, root: Path) -> None:
+        # Caller holds the lock.
+        epoch = self._epoch
+        self._sync_directory(root)
+        for name in list(self._entries):
+            self._sync_entry(root, name)
+        self._synced = epoch
+
+    def entries(self) -> Tuple[SchemaEntry, ...]:
+        if self._pinned:
+            with self._lock:
+                return tuple(self._entries.values())
+        root = _schemas_dir()
+        with self._lock:
+            if not self._trusted(root):
+                self._sync_all(root)
+            return tuple(self._entries.values())
+
+    def listing(self) -> List[Dict[str, str]]:
+        self.entries()
+        with self._lock:
+            if self._listing is None:
+                items = [
+                    {"name": e.name, "version": e.version, "path": e.listed_path}
+                    for e in self._entries.values()
+                    if e.data is not None
+                ]
+                items.sort(key=lambda x: (x["name"], x["version"], x["path"]))
+                self._listing = items
+            return self._listing
+
+    def get(self, name: str) -> SchemaEntry | None:
+        if self._pinned:
+            with self._lock:
+                return self._entries.get(name)
+        root = _schemas_dir()
+        with self._lock:
+            if watching():
+                if not self._trusted(root):
+                    self._sync_all(root)
+                return self._entries.get(name)
+            self._sync_directory(root)
+            if name not in self._entries:
+                return None
+            return self._sync_entry(root, name)
+
+    def notify(self) -> None:
+        with self._lock:
+            self._epoch += 1
+
+    def pin(self, entries: List[SchemaEntry] | None) -> None:
+        with self._lock:
+            self._reset("")
+            self._root = None
+            self._pinned = entries is not None
+            if entries is not None:
+                self._entries = {entry.name: entry for entry in entries}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            if self._pinned:
+                return
+            self._reset(self._root or "")
+            self._root = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "generation": self._generation,
+                "reads": self._reads,
+                "pinned": self._pinned,
+            }
+
+
+_CATALOG = _SchemaCatalog()
+
+
+def schema_entry(name: str) -> SchemaEntry | None:
+    """Return the indexed top-level schema called ``name``, if there is one."""
+    return _CATALOG.get(name)
+
+
+def schema_catalog() -> Tuple[SchemaEntry, ...]:
+    return _CATALOG.entries()
+
+
+def catalog_stats() -> Dict[str, Any]:
+    return _CATALOG.stats()
+
+
+def invalidate_schema_catalog() -> None:
+    _CATALOG.invalidate()
+
+
+def pin_schema_catalog(entries: List[SchemaEntry] | None) -> None:
+    """Serve the catalog from ``entries`` (a schema bundle) instead of the
+    schemas directory; ``None`` goes back to the directory."""
+    _CATALOG.pin(entries)
+
+
+def notify_schema_catalog() -> None:
+    """Mark the catalog stale so the next lookup re-checks the directory."""
+    _CATALOG.notify()
+
+
 def list_schemas() -> Dict[str, Any]:
-    d = _schemas_dir()
-    items: List[Dict[str, str]] = []
-    if d.is_dir():
-        for p in d.glob("*.schema.json"):
-            try:
-                data = json.loads(p.read_text())
-            except Exception:
-                continue
-            name = p.name.replace(".schema.json", "")
-            version = str(data.get("version", ""))
-            if p.name.endswith(".schema.json"):
-                listed_path = str(p.with_name(p.name.replace(".schema.json", ".json")))
-            else:
-                listed_path = str(p)
-            items.append({"name": name, "version": version, "path": listed_path})
-    items.sort(key=lambda x: (x["name"], x["version"], x["path"]))
+    items = [dict(item) for item in _CATALOG.listing()]
     return {"ok": True, "schemas": items}
 
 
 def get_schema(name: str) -> Dict[str, Any]:
+    entry = _CATALOG.get(name) if isinstance(name, str) else None
+    if entry is not None and entry.inside and entry.data is not None:
+        # ``entry.data`` also backs the validators; callers get their own copy.
+        return {"ok": True, "schema": _json_copy(entry.data), "version": entry.version}
+
+    # Names outside the index (nested paths, traversal attempts, unparsable
+    # files) take the original path-checked route.
     try:
         p = _schema_file_path(name)
     except PathOutsideConfiguredRoot:
@@ -138,24 +430,211 @@ def get_schema(name: str) -> Dict[str, Any]:
     return {"ok": True, "schema": data, "version": version}
 
 
-def list_examples(component: str | None = None) -> Dict[str, Any]:
-    d = _examples_dir()
-    items: List[Dict[str, str]] = []
+class _ExampleIndex:
+    """Sorted ``(component, path)`` index of the examples tree.
+
+    Every directory's listing is remembered with its mtime; a refresh only
+    stats directories and rescans the ones that changed, so listing a page
+    costs O(directories + page) instead of a full ``rglob`` and sort.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._root: str | None = None
+        self._dirs: Dict[str, Tuple[int | None, List[str], List[str]]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._by_component: Dict[str, List[Tuple[str, str]]] = {}
+        self._generation = 0
+        self._epoch = 0
+        self._synced: int | None = None
+
+    def _scan(self, directory: str) -> Tuple[int | None, List[str], List[str]]:
+        mtime = os.stat(directory).st_mtime_ns
+        files: List[str] = []
+        subdirs: List[str] = []
+        with os.scandir(directory) as scan:
+            for item in scan:
+                try:
+                    if item.is_dir():
+                        subdirs.append(item.path)
+                    elif item.name.endswith(".json") and item.is_file():
+                        files.append(item.path)
+                except OSError:
+                    continue
+        return (None if _racy(mtime) else mtime), files, subdirs
+
+    def _refresh(self) -> None:
+        # Caller holds the lock.
+        root = str(_examples_dir())
+        if root != self._root:
+            self._root = root
+            self._dirs = {}
+            self._keys = []
+            self._by_component = {}
+        if not os.path.isdir(root):
+            if self._keys or self._dirs:
+                self._dirs = {}
+                self._set_keys([])
+            return
+
+        changed = False
+        seen: Dict[str, Tuple[int | None, List[str], List[str]]] = {}
+        visited = set()
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                stat = os.stat(directory)
+            except OSError:
+                changed = True
+                continue
+            if (stat.st_dev, stat.st_ino) in visited:
+                continue  # symlink loop
+            visited.add((stat.st_dev, stat.st_ino))
+            cached = self._dirs.get(directory)
+            if cached is None or cached[0] is None or cached[0] != stat.st_mtime_ns:
+                try:
+                    cached = self._scan(directory)
+                except OSError:
+                    changed = True
+                    continue
+                changed = True
+            seen[directory] = cached
+            stack.extend(cached[2])
+        if len(seen) != len(self._dirs):
+            changed = True
+        self._dirs = seen
+        if changed:
+            files = [path for _, entries, _ in seen.values() for path in entries]
+            self._set_keys([(Path(path).name.split(".")[0], path) for path in files])
+
+    def _set_keys(self, keys: List[Tuple[str, str]]) -> None:
+        keys.sort()
+        if keys == self._keys:
+            return
+        by_component: Dict[str, List[Tuple[str, str]]] = {}
+        for key in keys:
+            by_component.setdefault(key[0], []).append(key)
+        self._keys = keys
+        self._by_component = by_component
+        self._generation += 1
+
+    def keys(self, component: str | None = None) -> List[Tuple[str, str]]:
+        with self._lock:
+            trusted = (
+                watching()
+                and self._synced == self._epoch
+                and self._root == str(_examples_dir())
+            )
+            if not trusted:
+                epoch = self._epoch
+                self._refresh()
+                self._synced = epoch
+            if component is None:
+                return self._keys
+            return self._by_component.get(component, [])
+
+    def notify(self) -> None:
+        with self._lock:
+            self._epoch += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._root = None
+            self._dirs = {}
+            self._keys = []
+            self._by_component = {}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._keys),
+                "directories": len(self._dirs),
+                "generation": self._generation,
+            }
+
+
+_EXAMPLES = _ExampleIndex()
+
+
+def example_index_stats() -> Dict[str, Any]:
+    return _EXAMPLES.stats()
+
+
+def invalidate_example_index() -> None:
+    _EXAMPLES.invalidate()
+
+
+def notify_example_index() -> None:
+    _EXAMPLES.notify()
+
+
+def _encode_cursor(key: Tuple[str, str]) -> str:
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeEncodeError) as exc:
+        raise ValueError(cursor) from exc
+    if (
+        not isinstance(value, list)
+        or len(value) != 2
+        or not all(isinstance(part, str) for part in value)
+    ):
+        raise ValueError(cursor)
+    return value[0], value[1]
+
+
+def list_examples(
+    component: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> Dict[str, Any]:
+    """List examples sorted by ``(component, path)``.
+
+    With ``limit``, at most that many entries are returned together with a
+    ``next_cursor`` (``None`` on the last page) to pass back as ``cursor``.
+    Cursors name the last entry returned, so pages stay stable while files
+    are added or removed.
+    """
     target = None
     if component:
         normalized = component.strip()
         if normalized not in {"*", "all"}:
             target = normalized
-    if d.is_dir():
-        for p in sorted(d.rglob("*.json")):
-            if not p.is_file():
-                continue
-            comp = p.name.split(".")[0]
-            if target is not None and comp != target:
-                continue
-            items.append({"component": comp, "path": str(p)})
-    items.sort(key=lambda x: (x["component"], x["path"]))
-    return {"ok": True, "examples": items}
+    if limit is not None and (
+        isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0
+    ):
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/limit", "msg": "limit must be a positive integer"}],
+        }
+    start_after = None
+    if cursor is not None:
+        try:
+            start_after = _decode_cursor(str(cursor))
+        except ValueError:
+            return {
+                "ok": False,
+                "reason": "validation_failed",
+                "errors": [{"path": "/cursor", "msg": "invalid_cursor"}],
+            }
+
+    keys = _EXAMPLES.keys(target)
+    start = 0 if start_after is None else bisect_right(keys, start_after)
+    end = len(keys) if limit is None else min(len(keys), start + limit)
+    page = keys[start:end]
+    result: Dict[str, Any] = {
+        "ok": True,
+        "examples": [{"component": comp, "path": path} for comp, path in page],
+    }
+    if limit is not None or cursor is not None:
+        result["next_cursor"] = _encode_cursor(page[-1]) if end < len(keys) else None
+    return result
 
 
 def _infer_schema_name_from_example(p: Path, data: Dict[str, Any]) -> str:
@@ -177,7 +656,164 @@ def _infer_schema_name_from_example(p: Path, data: Dict[str, Any]) -> str:
     return p.stem
 
 
+def _example_cache_budget() -> int:
+    raw = os.environ.get("MCP_EXAMPLE_CACHE_BYTES")
+    if raw is None or not raw.strip():
+        return _DEFAULT_EXAMPLE_CACHE_BYTES
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_EXAMPLE_CACHE_BYTES '{raw}'") from exc
+    if value < 0:
+        raise RuntimeError("MCP_EXAMPLE_CACHE_BYTES must be a non-negative integer")
+    return value
+
+
+class _ExampleCache:
+    """LRU of ``get_example`` responses, bounded by the example files' sizes.
+
+    An entry is reused while the file's mtime and size and the fingerprint
+    of the schema it validated against are unchanged; while a watcher runs
+    those checks are skipped until it publishes a change. Responses are kept
+    decoded and every hit hands out its own copy.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Tuple[str, str], Tuple[Any, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.epoch = 0
+
+    def trusted(self, key: Tuple[str, str]) -> Dict[str, Any] | None:
+        """Serve ``key`` without touching the filesystem while a watcher runs."""
+        if not watching():
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[-1] != self.epoch:
+                return None
+        return self._hit(key, entry[5])
+
+    def get(self, key: Tuple[str, str], resolved: Path) -> Dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            epoch = self.epoch
+        if entry is None:
+            self._count_miss()
+            return None
+        cached_path, mtime_ns, size, marker, fingerprint, response, _ = entry
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            stat = None
+        from .validate import schema_fingerprint
+
+        if (
+            stat is None
+            or str(resolved) != cached_path
+            or stat.st_mtime_ns != mtime_ns
+            or stat.st_size != size
+            or schema_fingerprint(marker) != fingerprint
+        ):
+            self.discard(key)
+            self._count_miss()
+            return None
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = entry[:-1] + (epoch,)
+        return self._hit(key, response)
+
+    def _hit(self, key: Tuple[str, str], response: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return _json_copy(response)
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def put(
+        self,
+        key: Tuple[str, str],
+        resolved: Path,
+        stat: os.stat_result,
+        marker: str,
+        fingerprint: Tuple[Any, ...],
+        response: Dict[str, Any],
+        epoch: int,
+    ) -> None:
+        budget = _example_cache_budget()
+        size = stat.st_size
+        if size > budget or _racy(stat.st_mtime_ns):
+            return
+        entry = (
+            str(resolved), stat.st_mtime_ns, size, marker, fingerprint, _json_copy(response), epoch,
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > budget and self._entries:
+                _, dropped = self._entries.popitem(last=False)
+                self._bytes -= dropped[2]
+                self.evictions += 1
+
+    def discard(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+
+    def notify(self) -> None:
+        with self._lock:
+            self.epoch += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_EXAMPLE_RESULTS = _ExampleCache()
+
+
+def example_cache_stats() -> Dict[str, Any]:
+    return _EXAMPLE_RESULTS.stats()
+
+
+def invalidate_example_cache() -> None:
+    _EXAMPLE_RESULTS.invalidate()
+
+
+def notify_example_cache() -> None:
+    """Make cached examples re-check their file and schema on next use."""
+    _EXAMPLE_RESULTS.notify()
+
+
 def get_example(path: str) -> Dict[str, Any]:
+    cache_key = (str(_examples_dir()), str(path))
+    epoch = _EXAMPLE_RESULTS.epoch
+    cached = _EXAMPLE_RESULTS.trusted(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         p = _example_file_path(path)
     except PathOutsideConfiguredRoot:
@@ -187,20 +823,34 @@ def get_example(path: str) -> Dict[str, Any]:
             "errors": [{"path": "/path", "msg": "invalid_path"}],
         }
 
-    if not p.exists():
+    cached = _EXAMPLE_RESULTS.get(cache_key, p)
+    if cached is not None:
+        return cached
+
+    try:
+        stat = p.stat()
+    except OSError:
         return {"ok": False, "reason": "not_found"}
-    data = json.loads(p.read_text())
+    raw = p.read_bytes()
+    data = json.loads(raw.decode())
     schema_name = _infer_schema_name_from_example(p, data)
     # validate lazily to avoid import cycles
     try:
-        from .validate import validate_asset
+        from .validate import schema_fingerprint, validate_asset
 
         res = validate_asset(data)
         if not res.get("ok", False):
-            return res
+            response = res
+        else:
+            response = {"ok": True, "example": data, "schema": schema_name, "validated": True}
     except Exception as e:
         return {"ok": False, "reason": "validation_failed", "errors": [{"path": "/", "msg": str(e)}]}
-    return {"ok": True, "example": data, "schema": schema_name, "validated": True}
+
+    marker = data.get("$schema") if isinstance(data, dict) else None
+    fingerprint = schema_fingerprint(marker)
+    if fingerprint is not None:
+        _EXAMPLE_RESULTS.put(cache_key, p, stat, marker, fingerprint, response, epoch)
+    return response
 
 
 def governance_audit() -> Dict[str, Any]:
@@ -208,10 +858,7 @@ def governance_audit() -> Dict[str, Any]:
     base = labs_schema_base()
     version = labs_schema_version()
 
-    examples_dir = _examples_dir()
-    example_paths = sorted(
-        p for p in examples_dir.rglob("*.json") if p.is_file()
-    )
+    example_paths = sorted(Path(path) for _, path in _EXAMPLES.keys())
 
     missing: List[str] = []
     for path in example_paths:
@@ -1,6 +1,121 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import os
+from hashlib import blake2b
+from typing import Any, Dict, List, Sequence, Tuple
+
+from . import codec
+from .patch import PatchError, _Document, parse_pointer, patch_document
+
+_ARRAY_MODES = ("replace", "lcs")
+_DEFAULT_ARRAY_MAX = 1000
+
+
+def diff_array_mode() -> str:
+    raw = os.environ.get("MCP_DIFF_ARRAYS")
+    if raw is None or not raw.strip():
+        return "replace"
+    mode = raw.strip().lower()
+    if mode not in _ARRAY_MODES:
+        raise RuntimeError(f"Invalid MCP_DIFF_ARRAYS '{raw}'")
+    return mode
+
+
+def _env_flag(name: str) -> bool:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return False
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise RuntimeError(f"Invalid {name} '{raw}'")
+
+
+def diff_hash_default() -> bool:
+    return _env_flag("MCP_DIFF_HASH")
+
+
+def diff_moves_default() -> bool:
+    return _env_flag("MCP_DIFF_MOVES")
+
+
+def diff_array_max() -> int:
+    raw = os.environ.get("MCP_DIFF_ARRAY_MAX")
+    if raw is None or not raw.strip():
+        return _DEFAULT_ARRAY_MAX
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_DIFF_ARRAY_MAX '{raw}'") from exc
+    if value <= 0:
+        raise RuntimeError("MCP_DIFF_ARRAY_MAX must be a positive integer")
+    return value
+
+
+class _Hashes:
+    """Content digests of containers in the diffed documents, keyed by ``id``.
+
+    A digest is taken over the canonical (sorted-key) encoding of the subtree,
+    produced by the codec in one C-level call, and computed at most once per
+    container. Scalars are their own key.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: Dict[int, Any] = {}
+
+    def cached(self, value: Any) -> Any:
+        return self._keys.get(id(value))
+
+    def key(self, value: Any) -> Any:
+        if not isinstance(value, (dict, list)):
+            return value
+        cached = self._keys.get(id(value))
+        if cached is not None:
+            return cached
+        try:
+            raw = codec.canonical(value)
+        except (TypeError, ValueError):
+            return value  # not JSON: fall back to ``==``
+        key = blake2b(raw, digest_size=16).digest()
+        self._keys[id(value)] = key
+        return key
+
+
+class _Options:
+    __slots__ = ("arrays", "array_max", "hashes", "budget")
+
+    def __init__(self, arrays: str, array_max: int, hashes: _Hashes | None = None) -> None:
+        self.arrays = arrays
+        self.array_max = array_max
+        self.hashes = hashes
+        # Edit-script steps left for the whole diff: one worst-case array of
+        # ``array_max`` elements fits, a thousand nested ones do not.
+        self.budget = array_max * array_max
+
+    def same(self, base: Any, new: Any) -> bool:
+        # Digests are only reused here, never computed: ``==`` stops at the
+        # first difference, which is cheaper than encoding both subtrees.
+        if self.hashes is not None and isinstance(base, (dict, list)):
+            base_key = self.hashes.cached(base)
+            if base_key is not None:
+                new_key = self.hashes.cached(new)
+                if new_key is not None:
+                    return base_key == new_key
+        return base == new
+
+
+class _Block:
+    """Element ops for one array; they only make sense in emission order."""
+
+    __slots__ = ("path", "ops")
+
+    def __init__(self, path: str, ops: List[Dict[str, Any]]) -> None:
+        self.path = path
+        self.ops = ops
 
 
 def _escape_token(tok: str) -> str:
@@ -13,9 +128,9 @@ def _join(path: str, key: str | int) -> str:
     return f"{path}/{_escape_token(str(key))}"
 
 
-def _collect(base: Any, new: Any, path: str, ops: List[Dict[str, Any]]):
+def _collect(base: Any, new: Any, path: str, ops: List[Any], opts: _Options):
     # identical
-    if base == new:
+    if opts.same(base, new):
         return
 
     # dicts: recurse by sorted keys
@@ -27,11 +142,16 @@ def _collect(base: Any, new: Any, path: str, ops: List[Dict[str, Any]]):
         for k in sorted(new_keys - base_keys):
             ops.append({"op": "add", "path": _join(path, k), "value": new[k]})
         for k in sorted(base_keys & new_keys):
-            _collect(base[k], new[k], _join(path, k), ops)
+            _collect(base[k], new[k], _join(path, k), ops, opts)
         return
 
-    # lists: deterministic single replace when different
+    # lists: element-level ops when enabled, else a single replace
     if isinstance(base, list) and isinstance(new, list):
+        if opts.arrays == "lcs":
+            block = _diff_list(base, new, path, opts)
+            if block is not None:
+                ops.append(_Block(path, block))
+                return
         ops.append({"op": "replace", "path": path, "value": new})
         return
 
@@ -39,14 +159,393 @@ def _collect(base: Any, new: Any, path: str, ops: List[Dict[str, Any]]):
     ops.append({"op": "replace", "path": path, "value": new})
 
 
-def diff_assets(base: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+def _edit_script(a: Sequence[Any], b: Sequence[Any], opts: _Options) -> List[str] | None:
+    """Shortest edit script turning ``a`` into ``b`` (Myers, O((N+M)D)).
+
+    Returns one of ``"="``, ``"-"`` (drop ``a[x]``) or ``"+"`` (take ``b[y]``)
+    per step, in order, or ``None`` once ``opts.budget`` is spent.
+    """
+    n, m = len(a), len(b)
+    v: Dict[int, int] = {1: 0}
+    trace: List[Dict[int, int]] = []
+    for d in range(n + m + 1):
+        opts.budget -= d + 1
+        if opts.budget < 0:
+            return None
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _backtrack(trace: List[Dict[int, int]], x: int, y: int) -> List[str]:
+    steps: List[str] = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            steps.append("=")
+            x -= 1
+            y -= 1
+        if d > 0:
+            steps.append("+" if x == prev_x else "-")
+        x, y = prev_x, prev_y
+    steps.reverse()
+    return steps
+
+
+def _diff_list(
+    base: List[Any], new: List[Any], path: str, opts: _Options
+) -> List[Dict[str, Any]] | None:
+    """Element ops turning ``base`` into ``new``; ``None`` to replace it whole.
+
+    Indices are those of the array as it stands when each op is applied.
+    """
+    start = 0
+    limit = min(len(base), len(new))
+    while start < limit and base[start] == new[start]:
+        start += 1
+    end_base, end_new = len(base), len(new)
+    while end_base > start and end_new > start and base[end_base - 1] == new[end_new - 1]:
+        end_base -= 1
+        end_new -= 1
+    middle_base = base[start:end_base]
+    middle_new = new[start:end_new]
+    if len(middle_base) + len(middle_new) > opts.array_max or opts.budget <= 0:
+        return None
+    # The edit script compares every element many times; with hashes each
+    # element is encoded once and compared by digest instead of deep ``==``.
+    if opts.hashes is not None:
+        cmp_base: Sequence[Any] = [opts.hashes.key(item) for item in middle_base]
+        cmp_new: Sequence[Any] = [opts.hashes.key(item) for item in middle_new]
+    else:
+        cmp_base, cmp_new = middle_base, middle_new
+
     ops: List[Dict[str, Any]] = []
-    _collect(base, new, "", ops)
-    # normalize root path to '/'
-    for op in ops:
-        if op["path"] == "":
-            op["path"] = "/"
+    index = start
+    removed: List[Any] = []
+    added: List[Any] = []
+
+    def flush() -> None:
+        nonlocal index
+        # Pair a run of removals with a run of additions as in-place edits.
+        for old, value in zip(removed, added):
+            sub: List[Any] = []
+            _collect(old, value, _join(path, index), sub, opts)
+            ops.extend(_finish(sub))
+            index += 1
+        paired = min(len(removed), len(added))
+        for _ in removed[paired:]:
+            ops.append({"op": "remove", "path": _join(path, index)})
+        for value in added[paired:]:
+            ops.append({"op": "add", "path": _join(path, index), "value": value})
+            index += 1
+        removed.clear()
+        added.clear()
+
+    script = _edit_script(cmp_base, cmp_new, opts)
+    if script is None:
+        return None
+    x = y = 0
+    for step in script:
+        if step == "=":
+            flush()
+            index += 1
+            x += 1
+            y += 1
+        elif step == "-":
+            removed.append(middle_base[x])
+            x += 1
+        else:
+            added.append(middle_new[y])
+            y += 1
+    flush()
+    if len(ops) > len(new):
+        return None  # more ops than elements: the whole array is smaller
+    return ops
+
+
+def _finish(ops: List[Any]) -> List[Dict[str, Any]]:
+    # Ops on distinct paths commute, so sorting only fixes the output order;
+    # array blocks stay whole because their ops depend on one another.
     order = {"remove": 0, "add": 1, "replace": 2}
-    ops.sort(key=lambda o: (o["path"], order.get(o["op"], 99)))
-    return {"ok": True, "patch": ops}
 
+    def key(item: Any) -> Tuple[str, int]:
+        if isinstance(item, _Block):
+            return (item.path, 99)
+        return (item["path"], order.get(item["op"], 99))
+
+    result: List[Dict[str, Any]] = []
+    for item in sorted(ops, key=key):
+        if isinstance(item, _Block):
+            result.extend(item.ops)
+        else:
+            result.append(item)
+    return result
+
+
+def _signature(value: Any) -> Tuple[Any, ...]:
+    # Cheap bucket key; only values sharing it are compared by digest.
+    if isinstance(value, dict):
+        return (len(value), tuple(sorted(value)))
+    return (len(value),)
+
+
+def _pointer(link: Any) -> str:
+    # ``link`` is ``(parent_link, key)``, ``None`` at the root.
+    parts: List[str] = []
+    while link is not None:
+        link, key = link
+        parts.append(_join("", key))
+    return "".join(reversed(parts))
+
+
+def _shapes(value: Any, out: set[Tuple[bool, int]]) -> None:
+    pending = [value]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (dict, list)) and node:
+            out.add((isinstance(node, dict), len(node)))
+            pending.extend(node.values() if isinstance(node, dict) else node)
+
+
+class _Relocator:
+    """Finds subtrees of added values that the base already holds elsewhere.
+
+    Move sources are object members the patch removes; copy sources are base
+    subtrees no op writes to or shifts. Both are bucketed by ``_signature``,
+    and digests are only taken for values that share a bucket.
+    """
+
+    def __init__(self, hashes: _Hashes) -> None:
+        self.hashes = hashes
+        self.moves: Dict[Any, Tuple[int, str]] = {}
+        self.move_buckets: set[Tuple[Any, ...]] = set()
+        self.copies: Dict[Tuple[Any, ...], List[Tuple[Any, Any]]] = {}
+        self.used: set[int] = set()
+
+    def add_move(self, index: int, path: str, value: Any) -> None:
+        if isinstance(value, (dict, list)) and value:
+            self.moves.setdefault(self.hashes.key(value), (index, path))
+            self.move_buckets.add(_signature(value))
+
+    def index_copies(
+        self,
+        base: Any,
+        touched: set[Tuple[str, ...]],
+        shifted: Dict[Tuple[str, ...], int],
+        wanted: set[Tuple[bool, int]],
+    ) -> None:
+        """Index the base subtrees that keep their value and path throughout.
+
+        ``touched`` holds the paths ops write to; ``shifted`` maps arrays that
+        gain or lose elements to the lowest index affected. Only subtrees whose
+        type and size appear in ``wanted`` (the added values) are indexed.
+        """
+        ancestors = {tokens[:n] for tokens in touched for n in range(len(tokens))}
+        ancestors.update(tokens[:n] for tokens in shifted for n in range(len(tokens) + 1))
+        # Paths are kept as tuples only on the way down to an edit; below that
+        # nothing changes and a parent link is enough to rebuild the pointer.
+        pending: List[Tuple[Any, Any, Tuple[str, ...] | None]] = [(base, None, ())]
+        while pending:
+            node, link, key = pending.pop()
+            if key is not None:
+                if key in touched:
+                    continue
+                if key not in ancestors:
+                    key = None
+            if key is None and (isinstance(node, dict), len(node)) in wanted:
+                self.copies.setdefault(_signature(node), []).append((link, node))
+            if isinstance(node, dict):
+                children: Any = node.items()
+            else:
+                # Elements at or after the first shifted index move during the patch.
+                stop = shifted.get(key, len(node)) if key is not None else len(node)
+                children = enumerate(node[:stop])
+            for name, child in children:
+                if isinstance(child, (dict, list)) and child:
+                    child_key = key + (str(name),) if key is not None else None
+                    pending.append((child, (link, name), child_key))
+
+    def find(self, value: Any) -> Dict[str, Any] | None:
+        """A ``move`` or ``copy`` op (without ``path``) producing ``value``."""
+        if not isinstance(value, (dict, list)) or not value:
+            return None
+        signature = _signature(value)
+        candidates = self.copies.get(signature, ())
+        if signature not in self.move_buckets and not candidates:
+            return None
+        digest = self.hashes.key(value)
+        found = None
+        moved = self.moves.get(digest)
+        if moved is not None and moved[0] not in self.used:
+            found = {"op": "move", "from": moved[1]}
+        else:
+            for link, node in candidates:
+                if self.hashes.key(node) == digest:
+                    found = {"op": "copy", "from": _pointer(link)}
+                    break
+        # Only worth it when the value is longer than the pointer to it.
+        if found is None or len(codec.canonical(value)) <= len(found["from"]):
+            return None
+        if found["op"] == "move":
+            self.used.add(moved[0])
+        return found
+
+    def split(self, value: Any, path: str, out: List[Dict[str, Any]]) -> Any:
+        """``value`` with relocatable subtrees cut out; their ops go to ``out``.
+
+        Ops are emitted in document order, so array elements are reinserted
+        at increasing indices and every path is valid when its op runs.
+        """
+        if isinstance(value, dict):
+            skeleton: Dict[str, Any] = {}
+            for name, child in value.items():
+                child_path = _join(path, name)
+                found = self.find(child)
+                if found is not None:
+                    out.append({**found, "path": child_path})
+                else:
+                    skeleton[name] = self.split(child, child_path, out)
+            return skeleton
+        if isinstance(value, list):
+            kept: List[Any] = []
+            for index, child in enumerate(value):
+                child_path = _join(path, index)
+                found = self.find(child)
+                if found is not None:
+                    out.append({**found, "path": child_path})
+                else:
+                    kept.append(self.split(child, child_path, out))
+            return kept
+        return value
+
+
+def _relocate(
+    base: Any, new: Any, ops: List[Dict[str, Any]], hashes: _Hashes
+) -> List[Dict[str, Any]]:
+    """``ops`` with added subtrees turned into ``move``/``copy`` ops where possible.
+
+    The rewritten patch is applied to ``base`` and kept only if it yields
+    ``new``; otherwise ``ops`` is returned unchanged.
+    """
+    relocator = _Relocator(hashes)
+    touched: set[Tuple[str, ...]] = set()
+    shifted: Dict[Tuple[str, ...], int] = {}
+    # Replay the patch to see removed members as they are when removed; ``doc``
+    # also keeps any copied containers alive while their digests are cached.
+    doc = _Document(base, in_place=False)
+    try:
+        for index, op in enumerate(ops):
+            tokens = parse_pointer(op["path"])
+            parent = doc.get(tokens[:-1]) if tokens else None
+            if isinstance(parent, list) and op["op"] != "replace":
+                # Inserting or removing shifts the elements from here on.
+                at = len(parent) if tokens[-1] == "-" else int(tokens[-1])
+                key = tuple(tokens[:-1])
+                shifted[key] = min(at, shifted.get(key, at))
+            else:
+                touched.add(tuple(tokens))
+            if op["op"] == "remove" and isinstance(parent, dict):
+                relocator.add_move(index, op["path"], parent[tokens[-1]])
+            doc.apply(op)
+    except (ValueError, IndexError, KeyError, TypeError):
+        return ops
+    wanted: set[Tuple[bool, int]] = set()
+    for op in ops:
+        if op["op"] in ("add", "replace"):
+            _shapes(op.get("value"), wanted)
+    relocator.index_copies(base, touched, shifted, wanted)
+
+    rewritten: List[Dict[str, Any]] = []
+    for op in ops:
+        value = op.get("value")
+        if op["op"] not in ("add", "replace") or not isinstance(value, (dict, list)):
+            rewritten.append(op)
+            continue
+        found = relocator.find(value) if op["path"] else None
+        if found is not None:
+            if op["op"] == "replace":
+                rewritten.append({"op": "remove", "path": op["path"]})
+            rewritten.append({**found, "path": op["path"]})
+            continue
+        extra: List[Dict[str, Any]] = []
+        skeleton = relocator.split(value, op["path"], extra)
+        rewritten.append({**op, "value": skeleton} if extra else op)
+        rewritten.extend(extra)
+    if len(rewritten) == len(ops) and all(a is b for a, b in zip(rewritten, ops)):
+        return ops
+    # Drop the removals that became moves, keeping the rewritten order.
+    drop = {id(ops[index]) for index in relocator.used}
+    rewritten = [op for op in rewritten if id(op) not in drop]
+    try:
+        if patch_document(base, rewritten) != new:
+            return ops
+    except PatchError:
+        return ops
+    return rewritten
+
+
+def diff_assets(
+    base: Dict[str, Any],
+    new: Dict[str, Any],
+    *,
+    arrays: str | None = None,
+    array_max: int | None = None,
+    hashed: bool | None = None,
+    moves: bool | None = None,
+) -> Dict[str, Any]:
+    """RFC 6902 patch from ``base`` to ``new``.
+
+    ``arrays="lcs"`` diffs changed arrays element by element (after trimming
+    their common prefix and suffix) instead of replacing them whole; arrays
+    whose differing middle exceeds ``array_max`` elements are still replaced,
+    as are all arrays left once the diff has done ``array_max ** 2`` steps of
+    element matching.
+    ``hashed=True`` matches array elements by content digest rather than deep
+    ``==``, which pays off when large arrays of similar objects are heavily
+    edited. ``moves=True`` emits ``move``/``copy`` ops for added subtrees that
+    the base already holds, e.g. a block moved under a new parent. Either way
+    the patch turns ``base`` into ``new``. Defaults come from
+    ``MCP_DIFF_ARRAYS``, ``MCP_DIFF_ARRAY_MAX``, ``MCP_DIFF_HASH`` and
+    ``MCP_DIFF_MOVES``.
+    """
+    if arrays is None:
+        arrays = diff_array_mode()
+    if arrays not in _ARRAY_MODES:
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/arrays", "msg": "arrays must be 'replace' or 'lcs'"}],
+        }
+    if array_max is None:
+        array_max = diff_array_max()
+    if hashed is None:
+        hashed = diff_hash_default()
+    if moves is None:
+        moves = diff_moves_default()
+
+    hashes = _Hashes() if hashed else None
+    ops: List[Any] = []
+    _collect(base, new, "", ops, _Options(arrays, array_max, hashes))
+    # Root ops keep the RFC 6901 root pointer "", since "/" names the key "".
+    patch = _finish(ops)
+    if moves and patch:
+        patch = _relocate(base, new, patch, hashes or _Hashes())
+    return {"ok": True, "patch": patch}
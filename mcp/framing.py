@@ -0,0 +1,222 @@
+"""Incremental NDJSON framing shared by the socket and TCP servers."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
+
+from .transport import SharedThreadPool, payload_too_large_bytes, process_frame
+from .validate import MAX_BYTES
+
+Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+_DEFAULT_RECV_SIZE = 65536
+_DEFAULT_PIPELINE_DEPTH = 16
+
+
+class _FrameTooLarge:
+    def __repr__(self) -> str:
+        return "FRAME_TOO_LARGE"
+
+
+# Yielded in place of a line whose content crossed the size limit.
+FRAME_TOO_LARGE: Any = _FrameTooLarge()
+
+
+def _positive_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid {name} '{raw}'") from exc
+    if value <= 0:
+        raise RuntimeError(f"{name} must be a positive integer")
+    return value
+
+
+def recv_size() -> int:
+    return _positive_int("MCP_RECV_SIZE", _DEFAULT_RECV_SIZE)
+
+
+def pipeline_enabled() -> bool:
+    raw = os.environ.get("MCP_PIPELINE")
+    if raw is None or not raw.strip():
+        return False
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def pipeline_depth() -> int:
+    """Maximum requests one connection may have in flight when pipelining."""
+    return _positive_int("MCP_PIPELINE_DEPTH", _DEFAULT_PIPELINE_DEPTH)
+
+
+def pipeline_workers() -> int:
+    return _positive_int("MCP_PIPELINE_WORKERS", min(32, (os.cpu_count() or 1) + 4))
+
+
+class FrameBuffer:
+    """Splits a byte stream into newline-terminated frames.
+
+    Bytes already scanned are never scanned again, and consumed lines are
+    dropped once per ``feed`` call, so the cost stays linear in the input.
+    The content span of the partial line (between its leading and trailing
+    whitespace) is tracked as bytes arrive. A partial line whose content or
+    trailing whitespace exceeds ``limit`` is reported as ``FRAME_TOO_LARGE``
+    straight away and the rest of it is discarded unbuffered up to its
+    newline; leading whitespace beyond ``limit`` is dropped, not buffered.
+    """
+
+    def __init__(self, limit: int = MAX_BYTES) -> None:
+        self._limit = limit
+        self._buffer = bytearray()
+        # Content span of the partial line; ``_lead`` is None while it is blank.
+        self._lead: int | None = None
+        self._end = 0
+        self._discarding = False
+
+    def feed(self, data: bytes | bytearray | memoryview) -> List[Any]:
+        frames: List[Any] = []
+        view = memoryview(data)
+        if self._discarding:
+            newline = view.tobytes().find(b"\n")
+            if newline < 0:
+                return frames
+            self._discarding = False
+            view = view[newline + 1 :]
+
+        buffer = self._buffer
+        kept = len(buffer)  # the retained tail never contains a newline
+        buffer += view
+        start = 0
+        newline = buffer.find(b"\n", kept)
+        if newline >= 0:
+            with memoryview(buffer) as lines:
+                while newline >= 0:
+                    frames.append(bytes(lines[start:newline]))
+                    start = newline + 1
+                    newline = buffer.find(b"\n", start)
+            del buffer[:start]
+            kept = 0
+            self._lead = None
+            self._end = 0
+
+        added = buffer[kept:]
+        if self._lead is None:
+            content = len(added.lstrip())
+            if content:
+                self._lead = len(buffer) - content
+        tail = len(added.rstrip())
+        if tail:
+            self._end = kept + tail
+
+        limit = self._limit
+        if self._lead is None:
+            if len(buffer) > limit:
+                buffer.clear()  # nothing but whitespace so far
+        elif self._lead > limit:
+            del buffer[: self._lead]
+            self._end -= self._lead
+            self._lead = 0
+        if self._lead is not None and (
+            self._end - self._lead > limit or len(buffer) - self._end > limit
+        ):
+            frames.append(FRAME_TOO_LARGE)
+            buffer.clear()
+            self._lead = None
+            self._end = 0
+            self._discarding = True
+        return frames
+
+
+def read_frames(conn: socket.socket, size: int | None = None) -> Iterator[Any]:
+    """Yield raw frames from ``conn`` until the peer closes the connection."""
+    chunk = bytearray(size or recv_size())
+    view = memoryview(chunk)
+    frames = FrameBuffer()
+    while True:
+        try:
+            received = conn.recv_into(chunk)
+        except InterruptedError:  # pragma: no cover - platform specific
+            continue
+        if not received:
+            return
+        yield from frames.feed(view[:received])
+
+
+_PIPELINE_POOL = SharedThreadPool("mcp-pipeline")
+
+
+def serve_connection(conn: socket.socket, handler: Handler) -> None:
+    if pipeline_enabled():
+        _serve_pipelined(conn, handler)
+        return
+    for raw_line in read_frames(conn):
+        if raw_line is FRAME_TOO_LARGE:
+            frame = payload_too_large_bytes()
+        else:
+            frame = process_frame(raw_line, handler)
+            if frame is None:
+                continue
+        try:
+            conn.sendall(frame)
+        except BrokenPipeError:  # pragma: no cover - client vanished mid-send
+            return
+
+
+def _serve_pipelined(conn: socket.socket, handler: Handler) -> None:
+    with _PIPELINE_POOL.lease(pipeline_workers()) as executor:
+        _run_pipelined(conn, handler, executor)
+
+
+def _run_pipelined(conn: socket.socket, handler: Handler, executor: ThreadPoolExecutor) -> None:
+    # Frames run concurrently; each response is written as soon as it is ready.
+    slots = threading.BoundedSemaphore(pipeline_depth())
+    write_lock = threading.Lock()
+    broken = threading.Event()
+    pending: Set[Future] = set()
+    pending_lock = threading.Lock()
+
+    def send(frame: bytes) -> None:
+        with write_lock:
+            if broken.is_set():
+                return
+            try:
+                conn.sendall(frame)
+            except OSError:  # pragma: no cover - client vanished mid-send
+                broken.set()
+
+    def run(raw_line: bytes) -> None:
+        try:
+            frame = process_frame(raw_line, handler)
+            if frame is not None:
+                send(frame)
+        finally:
+            slots.release()
+
+    def done(future: Future) -> None:
+        with pending_lock:
+            pending.discard(future)
+
+    for raw_line in read_frames(conn):
+        if broken.is_set():
+            break
+        if raw_line is FRAME_TOO_LARGE:
+            send(payload_too_large_bytes())
+            continue
+        if not raw_line.strip():
+            continue
+        # Stop reading once the connection has too many requests in flight.
+        slots.acquire()
+        future = executor.submit(run, raw_line)
+        with pending_lock:
+            pending.add(future)
+        future.add_done_callback(done)
+
+    with pending_lock:
+        outstanding: Tuple[Future, ...] = tuple(pending)
+    wait(outstanding)
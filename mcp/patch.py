@@ -0,0 +1,498 @@
+"""RFC 6902 JSON Patch application for ``apply_patch`` and ``validate_patch``.
+
+The base document is never deep-copied: a container is shallow-copied the
+first time an op writes through it, and untouched subtrees stay shared with
+the base. ``in_place=True`` skips even that for callers that own the base.
+A failing op leaves the base unchanged unless ``in_place`` is set.
+
+``validate_patch`` starts from the cached result for the base and only
+revalidates the containers the patch writes to.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from typing import Any, Dict, List, Tuple
+
+from .validate import (
+    _RESULTS,
+    _pointer_from_path,
+    _resolve_asset,
+    _result_key,
+    _size_okay,
+    validate_asset,
+)
+
+_OPS = ("add", "remove", "replace", "move", "copy", "test")
+
+# Keywords whose verdict on an object or array only depends on its own keys or
+# length, so editing inside one of its children cannot change it. Any other
+# keyword on the way down to an edited location forces a full revalidation.
+_LOCAL_KEYWORDS = frozenset({
+    "$schema", "$id", "$anchor", "$ref", "$defs", "definitions", "$comment",
+    "title", "description", "default", "examples", "deprecated", "readOnly",
+    "writeOnly", "format", "type", "properties", "patternProperties",
+    "additionalProperties", "propertyNames", "required", "dependentRequired",
+    "minProperties", "maxProperties", "items", "prefixItems", "minItems",
+    "maxItems",
+})
+_SHALLOW_KEYWORDS = (
+    "type", "required", "dependentRequired", "minProperties", "maxProperties",
+    "minItems", "maxItems", "propertyNames",
+)
+
+
+class PatchError(Exception):
+    """An op that cannot be applied; ``index`` is its position in the patch."""
+
+    def __init__(self, index: int, msg: str) -> None:
+        super().__init__(msg)
+        self.index = index
+        self.msg = msg
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def parse_pointer(pointer: Any) -> List[str]:
+    """Split a JSON Pointer; only ``""`` addresses the root (``"/"`` is the key ``""``)."""
+    if not isinstance(pointer, str):
+        raise ValueError("pointer must be a string")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"invalid pointer '{pointer}'")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def _index(token: str, size: int, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return size
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise ValueError(f"invalid array index '{token}'")
+    index = int(token)
+    if index > size or (index == size and not allow_end):
+        raise ValueError(f"array index {index} out of range")
+    return index
+
+
+class _Document:
+    """Copy-on-write view of the patched document."""
+
+    def __init__(self, root: Any, in_place: bool) -> None:
+        self.root = root
+        self._in_place = in_place
+        # Containers this application created, so they can be written in place.
+        # The list keeps them alive so their ids cannot be reused.
+        self._owned: set[int] = set()
+        self._keep: List[Any] = []
+
+    def _writable(self, container: Any) -> Any:
+        if self._in_place or id(container) in self._owned:
+            return container
+        copied = dict(container) if isinstance(container, dict) else list(container)
+        self._owned.add(id(copied))
+        self._keep.append(copied)
+        return copied
+
+    def share(self, value: Any) -> Any:
+        """``value`` made safe to reference from a second location."""
+        if self._in_place:
+            return copy.deepcopy(value)
+        self._disown(value)
+        return value
+
+    def _disown(self, value: Any) -> None:
+        # Shared containers may no longer be written in place through either
+        # location; the next write copies them like any base container.
+        if id(value) not in self._owned:
+            return
+        self._owned.discard(id(value))
+        children = value.values() if isinstance(value, dict) else value
+        for child in children:
+            if isinstance(child, (dict, list)):
+                self._disown(child)
+
+    def get(self, tokens: List[str]) -> Any:
+        node = self.root
+        for token in tokens:
+            if isinstance(node, dict):
+                if token not in node:
+                    raise ValueError(f"path segment '{token}' not found")
+                node = node[token]
+            elif isinstance(node, list):
+                node = node[_index(token, len(node), allow_end=False)]
+            else:
+                raise ValueError(f"cannot traverse into a scalar at '{token}'")
+        return node
+
+    def parent(self, tokens: List[str]) -> Any:
+        """The writable container holding ``tokens[-1]``, copying along the path."""
+        if not isinstance(self.root, (dict, list)):
+            raise ValueError("cannot traverse into a scalar root")
+        self.root = node = self._writable(self.root)
+        for token in tokens[:-1]:
+            if isinstance(node, dict):
+                if token not in node:
+                    raise ValueError(f"path segment '{token}' not found")
+                key: Any = token
+            elif isinstance(node, list):
+                key = _index(token, len(node), allow_end=False)
+            else:
+                raise ValueError(f"cannot traverse into a scalar at '{token}'")
+            child = node[key]
+            if not isinstance(child, (dict, list)):
+                raise ValueError(f"cannot traverse into a scalar at '{token}'")
+            child = self._writable(child)
+            node[key] = child
+            node = child
+        return node
+
+    def add(self, tokens: List[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            return
+        parent = self.parent(tokens)
+        if isinstance(parent, list):
+            parent.insert(_index(tokens[-1], len(parent), allow_end=True), value)
+        else:
+            parent[tokens[-1]] = value
+
+    def remove(self, tokens: List[str]) -> Any:
+        if not tokens:
+            raise ValueError("cannot remove the root")
+        parent = self.parent(tokens)
+        if isinstance(parent, list):
+            return parent.pop(_index(tokens[-1], len(parent), allow_end=False))
+        if tokens[-1] not in parent:
+            raise ValueError(f"path segment '{tokens[-1]}' not found")
+        return parent.pop(tokens[-1])
+
+    def replace(self, tokens: List[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            return
+        parent = self.parent(tokens)
+        if isinstance(parent, list):
+            parent[_index(tokens[-1], len(parent), allow_end=False)] = value
+        elif tokens[-1] not in parent:
+            raise ValueError(f"path segment '{tokens[-1]}' not found")
+        else:
+            parent[tokens[-1]] = value
+
+    def apply(self, op: Dict[str, Any]) -> None:
+        name = op.get("op")
+        if name not in _OPS:
+            raise ValueError(f"unknown op {name!r}")
+        tokens = parse_pointer(op.get("path"))
+        if name in ("add", "replace", "test") and "value" not in op:
+            raise ValueError(f"'{name}' requires a value")
+        if name == "add":
+            self.add(tokens, op["value"])
+        elif name == "remove":
+            self.remove(tokens)
+        elif name == "replace":
+            self.replace(tokens, op["value"])
+        elif name == "test":
+            if self.get(tokens) != op["value"]:
+                raise ValueError("test failed")
+        else:
+            source = parse_pointer(op.get("from"))
+            if name == "move":
+                if tokens[: len(source)] == source and len(tokens) > len(source):
+                    raise ValueError("cannot move a value into itself")
+                if tokens != source:
+                    self.add(tokens, self.remove(source))
+            else:
+                self.add(tokens, self.share(self.get(source)))
+
+
+def _check_patch(patch: Any) -> Tuple[bool, bool]:
+    """Whether ``patch`` is a list of op objects, and whether it copies."""
+    if not isinstance(patch, list) or not all(isinstance(op, dict) for op in patch):
+        return False, False
+    return True, any(op.get("op") == "copy" for op in patch)
+
+
+def patch_document(base: Any, patch: List[Dict[str, Any]], in_place: bool = False) -> Any:
+    """Apply ``patch`` to ``base`` and return the result; raises ``PatchError``."""
+    doc = _Document(base, in_place)
+    for index, op in enumerate(patch):
+        try:
+            doc.apply(op)
+        except (ValueError, IndexError, KeyError, TypeError) as exc:
+            raise PatchError(index, str(exc)) from exc
+    return doc.root
+
+
+def apply_patch(
+    base: Any,
+    patch: Any,
+    validate: bool = False,
+    *,
+    in_place: bool = False,
+) -> Dict[str, Any]:
+    ok, copies = _check_patch(patch)
+    if not ok:
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/patch", "msg": "patch must be an array of operations"}],
+        }
+    try:
+        asset = patch_document(base, patch, in_place=in_place)
+    except PatchError as exc:
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": f"/patch/{exc.index}", "msg": exc.msg}],
+        }
+    # Without copy ops the result is no larger than the frame that carried the
+    # base and the values; copies can duplicate subtrees past the limit.
+    if copies and not _size_okay(asset):
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/", "msg": "payload_too_large"}],
+        }
+    if validate:
+        v = validate_asset(asset)
+        if not v.get("ok", False):
+            return {"ok": False, "reason": "validation_failed", "errors": v["errors"]}
+    return {"ok": True, "asset": asset}
+
+
+def _touched(patch: List[Dict[str, Any]]) -> List[List[str]] | None:
+    """Outermost locations the patch rewrites; ``None`` if that is the root.
+
+    A ``replace`` only rewrites its target. Other writes count against the
+    parent, whose key set changes (or whose later indices shift).
+    """
+    locations: List[List[str]] = []
+    for op in patch:
+        name = op.get("op")
+        if name == "test":
+            continue
+        if name == "replace":
+            locations.append(parse_pointer(op.get("path")))
+            continue
+        pointers = [op.get("path")]
+        if name == "move":
+            pointers.append(op.get("from"))
+        for pointer in pointers:
+            locations.append(parse_pointer(pointer)[:-1])
+    if any(not tokens for tokens in locations):
+        return None
+    outermost: List[List[str]] = []
+    for tokens in sorted(locations, key=len):
+        if not any(tokens[: len(kept)] == kept for kept in outermost):
+            outermost.append(tokens)
+    return outermost
+
+
+def _shallow(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """The keywords of an ancestor ``schema`` that report at its own location.
+
+    Their verdicts cannot change, but messages such as ``... is too long``
+    quote the whole instance, so they are re-run on the patched value.
+    """
+    reduced = {key: schema[key] for key in _SHALLOW_KEYWORDS if key in schema}
+    if schema.get("additionalProperties") is False:
+        # The message depends on which of the two keywords are present.
+        for key in ("properties", "patternProperties"):
+            if key in schema:
+                reduced[key] = dict.fromkeys(schema[key], True)
+        reduced["additionalProperties"] = False
+    if schema.get("items") is False:
+        reduced["prefixItems"] = [True] * len(schema.get("prefixItems", ()))
+        reduced["items"] = False
+    return reduced
+
+
+def _scoped(schema: Any, resolver: Any) -> Any:
+    """``resolver`` as seen from inside ``schema``, which may set its own ``$id``."""
+    if isinstance(schema, dict) and "$id" in schema:
+        from referencing.jsonschema import DRAFT202012
+
+        return resolver.in_subresource(DRAFT202012.create_resource(schema))
+    return resolver
+
+
+def _walk(
+    validator: Any, payload: Any, tokens: List[str]
+) -> Tuple[List[Tuple[Any, Any]], List[Tuple[List[str], Any, Any]]] | None:
+    """Schemas applying at ``tokens`` and the ancestors' shallow checks.
+
+    Returns ``(schemas, checks)``: ``(subschema, resolver)`` pairs for the
+    location itself, and ``(ancestor tokens, schema, resolver)`` for every
+    schema met on the way down. ``None`` when the path cannot be localized.
+    """
+    current = [(validator.schema, validator._resolver)]
+    checks: List[Tuple[List[str], Any, Any]] = []
+    node = payload
+    for depth, token in enumerate(tokens):
+        children: List[Tuple[Any, Any]] = []
+        pending = list(current)
+        seen: set[int] = set()
+        while pending:
+            schema, resolver = pending.pop()
+            if schema is True:
+                continue
+            if not isinstance(schema, dict) or id(schema) in seen:
+                if schema is False:
+                    return None
+                continue
+            seen.add(id(schema))
+            if not _LOCAL_KEYWORDS.issuperset(schema):
+                return None
+            resolver = _scoped(schema, resolver)
+            if "$ref" in schema:
+                resolved = resolver.lookup(schema["$ref"])
+                pending.append((resolved.contents, resolved.resolver))
+            checks.append((tokens[:depth], schema, resolver))
+            if isinstance(node, dict):
+                matched = False
+                properties = schema.get("properties", {})
+                if token in properties:
+                    children.append((properties[token], resolver))
+                    matched = True
+                for pattern, sub in schema.get("patternProperties", {}).items():
+                    if re.search(pattern, token):
+                        children.append((sub, resolver))
+                        matched = True
+                # ``false`` here is reported on the parent by its shallow check.
+                extra = schema.get("additionalProperties", True)
+                if not matched and extra is not False:
+                    children.append((extra, resolver))
+            elif isinstance(node, list):
+                index = int(token)
+                prefix = schema.get("prefixItems", [])
+                if index < len(prefix):
+                    children.append((prefix[index], resolver))
+                elif schema.get("items", True) is not False:
+                    children.append((schema.get("items", True), resolver))
+        if isinstance(node, dict) and token in node:
+            node = node[token]
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return None
+        current = children
+    return current, checks
+
+
+def _instance_at(payload: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        payload = payload[int(token)] if isinstance(payload, list) else payload[token]
+    return payload
+
+
+def _revalidate(
+    validator: Any,
+    payload: Dict[str, Any],
+    base_result: Dict[str, Any],
+    locations: List[List[str]],
+) -> Dict[str, Any] | None:
+    """The result for ``payload`` from ``base_result`` plus the edited subtrees."""
+    validator = getattr(validator, "reference", validator)  # compiled engine
+    runs: List[Tuple[List[str], Any, Any]] = []
+    ancestors: Dict[str, List[Tuple[List[str], Any, Any]]] = {}
+    for tokens in locations:
+        walked = _walk(validator, payload, tokens)
+        if walked is None:
+            return None
+        schemas, checks = walked
+        runs.extend((tokens, schema, _scoped(schema, resolver)) for schema, resolver in schemas)
+        for check in checks:
+            bucket = ancestors.setdefault(_pointer_from_path(check[0]), [])
+            if not any(check[1] is seen[1] for seen in bucket):
+                bucket.append(check)
+    for bucket in ancestors.values():
+        runs.extend((tokens, _shallow(schema), resolver) for tokens, schema, resolver in bucket)
+
+    prefixes = [_pointer_from_path(tokens) for tokens in locations]
+
+    def stale(path: str) -> bool:
+        if path in ancestors:
+            return True
+        return any(path == p or path.startswith(p + "/") for p in prefixes)
+
+    errors = [dict(error) for error in base_result.get("errors", ()) if not stale(error["path"])]
+    for tokens, schema, resolver in runs:
+        sub = validator.evolve(schema=schema, _resolver=resolver)
+        for err in sub.iter_errors(_instance_at(payload, tokens)):
+            pointer = _pointer_from_path(list(tokens) + list(err.absolute_path))
+            errors.append({"path": pointer, "msg": err.message})
+
+    errors.sort(key=lambda e: (e["path"], e["msg"]))
+    if errors:
+        return {"ok": False, "reason": "validation_failed", "errors": errors}
+    return {"ok": True, "errors": []}
+
+
+def validate_patch(
+    base: Any,
+    patch: Any,
+    size_hint: int | None = None,
+) -> Dict[str, Any]:
+    """Validate ``base`` with ``patch`` applied, reusing ``base``'s cached result.
+
+    When ``base`` was validated recently (its verdict is in the result cache)
+    only the subtrees the patch touched are revalidated and ``scope`` is
+    ``"local"``; otherwise, or when the schema above an edit uses keywords
+    that look at whole subtrees, the result is a full validation (``"full"``).
+    """
+    ok, copies = _check_patch(patch)
+    if not ok:
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/patch", "msg": "patch must be an array of operations"}],
+        }
+    try:
+        asset = patch_document(base, patch)
+    except PatchError as exc:
+        return {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": f"/patch/{exc.index}", "msg": exc.msg}],
+        }
+    # ``size_hint`` measured base and patch together, which bounds the result
+    # unless copy ops duplicated subtrees.
+    hint = None if copies else size_hint
+
+    result = None
+    locations = _touched(patch)
+    if (
+        locations is not None
+        and isinstance(base, dict)
+        and isinstance(asset, dict)
+        and base.get("$schema") == asset.get("$schema")
+        and _size_okay(asset, hint)
+    ):
+        resolved, _ = _resolve_asset(base, None)
+        if resolved is not None:
+            base_payload, fingerprint, validator = resolved
+            base_key = _result_key(base_payload, fingerprint)
+            base_result = _RESULTS.get(base_key) if base_key is not None else None
+            if base_result is not None:
+                payload = dict(asset)
+                payload.pop("$schema", None)
+                from referencing.exceptions import Unresolvable
+
+                try:
+                    result = _revalidate(validator, payload, base_result, locations)
+                except Unresolvable:
+                    result = None  # let the full validation report it
+                if result is not None:
+                    key = _result_key(payload, fingerprint)
+                    if key is not None:
+                        _RESULTS.put(key, result)
+                    result["scope"] = "local"
+                    return result
+    result = validate_asset(asset, size_hint=hint)
+    result["scope"] = "full"
+    return result
+
@@ -0,0 +1,283 @@
+"""Canonical schema fetches: memory tier, disk cache and pooled HTTP.
+
+Fetched schemas are kept in memory and in ``LABS_SCHEMA_CACHE_DIR``, with
+the response's ``ETag``/``Last-Modified`` in a ``.meta`` sidecar. Entries
+younger than ``MCP_REMOTE_SCHEMA_TTL`` seconds are served without I/O; older
+ones are revalidated with a conditional request on a shared
+``httpx.Client``. Concurrent misses for one URL share a single fetch, and a
+failed revalidation keeps serving the stale copy for another TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
+
+from . import codec
+
+if TYPE_CHECKING:
+    import httpx
+
+_DEFAULT_TTL = 3600.0
+_TIMEOUT = 5.0
+
+
+class RemoteSchemaError(Exception):
+    """Raised when a schema cannot be fetched and no cached copy exists."""
+
+
+def remote_ttl() -> float:
+    raw = os.environ.get("MCP_REMOTE_SCHEMA_TTL")
+    if raw is None or not raw.strip():
+        return _DEFAULT_TTL
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_REMOTE_SCHEMA_TTL '{raw}'") from exc
+    if value < 0:
+        raise RuntimeError("MCP_REMOTE_SCHEMA_TTL must be a non-negative number")
+    return value
+
+
+def _digest(data: Any) -> str:
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RemoteSchema:
+    """One fetched schema; ``data`` must be treated as read-only."""
+
+    __slots__ = ("data", "sha256", "etag", "last_modified", "checked")
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+        checked: float | None = None,
+    ) -> None:
+        self.data = data
+        self.sha256 = _digest(data)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.checked = time.time() if checked is None else checked
+
+    def fresh(self, ttl: float) -> bool:
+        return time.time() - self.checked < ttl
+
+
+class _Client:
+    """Lazily created ``httpx.Client`` shared by every fetch.
+
+    ``httpx`` itself is imported here, on the first fetch, so processes that
+    only see local schemas never pay for it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+
+    def get(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                import httpx
+
+                self._client = httpx.Client(timeout=_TIMEOUT)
+            return self._client
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+_CLIENT = _Client()
+
+
+def close_http_client() -> None:
+    _CLIENT.close()
+
+
+def _meta_path(cache_path: Path) -> Path:
+    return cache_path.with_name(f"{cache_path.name}.meta")
+
+
+def _read_disk(cache_path: Path) -> RemoteSchema | None:
+    try:
+        data = codec.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        cache_path.unlink(missing_ok=True)
+        return None
+    if not isinstance(data, dict):
+        cache_path.unlink(missing_ok=True)
+        return None
+    try:
+        meta = json.loads(_meta_path(cache_path).read_text())
+    except Exception:
+        # Files written before revalidation existed: age them by mtime.
+        try:
+            meta = {"checked": cache_path.stat().st_mtime}
+        except OSError:
+            meta = {}
+    return RemoteSchema(
+        data,
+        etag=meta.get("etag"),
+        last_modified=meta.get("last_modified"),
+        checked=float(meta.get("checked", 0.0)),
+    )
+
+
+def _write_meta(cache_path: Path, url: str, entry: RemoteSchema) -> None:
+    meta = {
+        "url": url,
+        "etag": entry.etag,
+        "last_modified": entry.last_modified,
+        "checked": entry.checked,
+    }
+    try:
+        _meta_path(cache_path).write_text(json.dumps(meta))
+    except Exception:
+        pass
+
+
+def _write_disk(cache_path: Path, url: str, entry: RemoteSchema) -> None:
+    try:
+        cache_path.write_text(json.dumps(entry.data, indent=2))
+    except Exception:
+        return
+    _write_meta(cache_path, url, entry)
+
+
+class _RemoteSchemas:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, RemoteSchema] = {}
+        self._flights: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.disk_reads = 0
+        self.fetches = 0
+        self.not_modified = 0
+        self.stale = 0
+
+    def peek(self, url: str) -> RemoteSchema | None:
+        with self._lock:
+            return self._entries.get(url)
+
+    def _flight(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._flights.setdefault(url, threading.Lock())
+
+    def get(self, url: str, cache_path: Path | None) -> RemoteSchema:
+        ttl = remote_ttl()
+        entry = self.peek(url)
+        if entry is not None and entry.fresh(ttl):
+            with self._lock:
+                self.hits += 1
+            return entry
+        # Single flight: one caller per URL goes to disk or network, the
+        # rest wait here and pick up its result.
+        with self._flight(url):
+            entry = self.peek(url)
+            if entry is not None and entry.fresh(ttl):
+                with self._lock:
+                    self.hits += 1
+                return entry
+            if entry is None and cache_path is not None:
+                entry = _read_disk(cache_path)
+                if entry is not None:
+                    with self._lock:
+                        self.disk_reads += 1
+                        self._entries[url] = entry
+                    if entry.fresh(ttl):
+                        return entry
+            try:
+                fetched = self._request(url, entry, cache_path)
+            except RemoteSchemaError:
+                if entry is None:
+                    raise
+                logging.warning("mcp:warning reason=schema_revalidation_failed url=%s", url)
+                entry.checked = time.time()  # retry after another TTL
+                with self._lock:
+                    self.stale += 1
+                return entry
+            with self._lock:
+                self._entries[url] = fetched
+            return fetched
+
+    def _request(
+        self, url: str, entry: RemoteSchema | None, cache_path: Path | None
+    ) -> RemoteSchema:
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = _CLIENT.get().get(url, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                with self._lock:
+                    self.not_modified += 1
+                entry.checked = time.time()
+                if cache_path is not None:
+                    _write_meta(cache_path, url, entry)
+                return entry
+            response.raise_for_status()
+            data = codec.loads(response.content)
+        except Exception as exc:
+            raise RemoteSchemaError(str(exc)) from exc
+        if not isinstance(data, dict):
+            raise RemoteSchemaError(f"schema at {url} is not an object")
+        with self._lock:
+            self.fetches += 1
+        fetched = RemoteSchema(
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        if cache_path is not None:
+            _write_disk(cache_path, url, fetched)
+        return fetched
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_reads": self.disk_reads,
+                "fetches": self.fetches,
+                "not_modified": self.not_modified,
+                "stale": self.stale,
+            }
+
+
+_REMOTE = _RemoteSchemas()
+
+
+def fetch_schema(url: str, cache_path: Path | None) -> RemoteSchema:
+    return _REMOTE.get(url, cache_path)
+
+
+def cached_schema(url: str) -> RemoteSchema | None:
+    """The in-memory copy of ``url``, if any, without revalidating it."""
+    return _REMOTE.peek(url)
+
+
+def remote_schema_stats() -> Dict[str, Any]:
+    return _REMOTE.stats()
+
+
+def invalidate_remote_schemas() -> None:
+    _REMOTE.invalidate()
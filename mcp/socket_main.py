@@ -7,8 +7,7 @@ import threading
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
-from .transport import build_error_frame, payload_too_large_frame, process_line
-from .validate import MAX_BYTES
+from .framing import serve_connection
 
 Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
 
@@ -76,7 +75,7 @@ class SocketServer:
 
     def _handle_connection(self, conn: socket.socket, handler: Handler) -> None:
         try:
-            _serve_connection(conn, handler)
+            serve_connection(conn, handler)
         finally:
             conn.close()
             with self._lock:
@@ -90,34 +89,3 @@ class SocketServer:
             threads = list(self._client_threads)
             self._client_threads.clear()
             return threads
-
-
-def _serve_connection(conn: socket.socket, handler: Handler) -> None:
-    buffer = b""
-    while True:
-        try:
-            chunk = conn.recv(4096)
-        except InterruptedError:  # pragma: no cover - platform specific
-            continue
-        if not chunk:
-            break
-        buffer += chunk
-        while b"\n" in buffer:
-            raw_line, buffer = buffer.split(b"\n", 1)
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-            if len(stripped) > MAX_BYTES:
-                frame = payload_too_large_frame(None)
-            else:
-                try:
-                    line = stripped.decode("utf-8")
-                except UnicodeDecodeError as exc:
-                    frame = build_error_frame(None, f"decode_error: {exc}")
-                else:
-                    frame = process_line(line, handler)
-            payload = (frame + "\n").encode("utf-8")
-            try:
-                conn.sendall(payload)
-            except BrokenPipeError:  # pragma: no cover - client disappeared mid-send
-                return
@@ -6,6 +6,9 @@ from typing import Any, Dict
 
 from .backend import populate_backend
 from .core import (
+    catalog_stats,
+    example_cache_stats,
+    example_index_stats,
     get_example,
     get_schema,
     governance_audit,
@@ -13,8 +16,21 @@ from .core import (
     list_schemas,
 )
 from .diff import diff_assets
-from .transport import process_line
-from .validate import validate_asset, validate_many
+from .patch import apply_patch, validate_patch
+from .remote import remote_schema_stats
+from .transport import current_frame_size, process_line
+from .validate import (
+    registry_stats,
+    result_cache_stats,
+    validate_asset,
+    validate_many,
+    validator_cache_stats,
+)
+
+
+def _flag(value: Any) -> bool | None:
+    # Absent flags defer to the tool's environment default.
+    return None if value is None else bool(value)
 
 
 def dispatch(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -23,7 +39,9 @@ def dispatch(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
     if method == "get_schema":
         return get_schema(params.get("name", ""))
     if method == "list_examples":
-        return list_examples(params.get("component"))
+        return list_examples(
+            params.get("component"), params.get("limit"), params.get("cursor")
+        )
     if method == "get_example":
         return get_example(params.get("path", ""))
     if method in ("validate", "validate_asset"):
@@ -31,17 +49,54 @@ def dispatch(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if method == "validate":
             logging.warning("mcp:warning reason=deprecated_alias method=validate")
         asset = params.get("asset", {})
-        return validate_asset(asset)
+        return validate_asset(asset, size_hint=current_frame_size())
     if method == "validate_many":
-        return validate_many(params.get("assets"))
+        return validate_many(
+            params.get("assets"),
+            bool(params.get("debug", False)),
+            size_hint=current_frame_size(),
+        )
     if method == "diff_assets":
-        return diff_assets(params.get("base", {}), params.get("new", {}))
+        return diff_assets(
+            params.get("base", {}),
+            params.get("new", {}),
+            arrays=params.get("arrays"),
+            hashed=_flag(params.get("hashed")),
+            moves=_flag(params.get("moves")),
+        )
+    if method == "apply_patch":
+        # The params were decoded for this request alone, so patch them in place.
+        return apply_patch(
+            params.get("base", {}),
+            params.get("patch"),
+            bool(params.get("validate", False)),
+            in_place=True,
+        )
+    if method == "validate_patch":
+        return validate_patch(
+            params.get("base", {}),
+            params.get("patch"),
+            size_hint=current_frame_size(),
+        )
     if method == "populate_backend":
         return populate_backend(
-            params.get("asset", {}), bool(params.get("validate_first", True))
+            params.get("asset", {}),
+            bool(params.get("validate_first", True)),
+            size_hint=current_frame_size(),
         )
     if method == "governance_audit":
         return governance_audit()
+    if method == "cache_stats":
+        return {
+            "ok": True,
+            "validators": validator_cache_stats(),
+            "registry": registry_stats(),
+            "results": result_cache_stats(),
+            "catalog": catalog_stats(),
+            "examples": example_index_stats(),
+            "example_cache": example_cache_stats(),
+            "remote": remote_schema_stats(),
+        }
     return {
         "ok": False,
         "reason": "unsupported",
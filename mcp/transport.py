@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
-from typing import Any, Callable, Dict, List, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
+from . import codec
 from .validate import MAX_BYTES
 
+Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+# Byte size of the frame currently being dispatched, for tools' size guards.
+_FRAME_SIZE: ContextVar[int | None] = ContextVar("mcp_frame_size", default=None)
+
 
 class PayloadTooLarge(Exception):
     """Raised when a JSON-RPC frame exceeds the configured transport limit."""
@@ -23,11 +35,41 @@ class InvalidRequest(Exception):
         self.errors = errors
 
 
-def parse_line(line: str) -> Tuple[Any, str, Dict[str, Any]]:
-    encoded = line.encode("utf-8")
-    if len(encoded) > MAX_BYTES:
+def current_frame_size() -> int | None:
+    """Return the UTF-8 byte size of the frame being handled, if any."""
+    return _FRAME_SIZE.get()
+
+
+def batch_workers() -> int:
+    raw = os.environ.get("MCP_BATCH_WORKERS")
+    if raw is None or not raw.strip():
+        return 0
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_BATCH_WORKERS '{raw}'") from exc
+    if value < 0:
+        raise RuntimeError("MCP_BATCH_WORKERS must be a non-negative integer")
+    return value
+
+
+def parse_line(line: str, size: int | None = None) -> Tuple[Any, str, Dict[str, Any]]:
+    # ``size`` lets callers holding the raw bytes skip re-encoding the line.
+    if size is None:
+        size = len(line.encode("utf-8"))
+    if size > MAX_BYTES:
         raise PayloadTooLarge
-    data = json.loads(line)
+    return parse_request(codec.loads(line))
+
+
+def parse_request(data: Any) -> Tuple[Any, str, Dict[str, Any]]:
+    """Check one decoded JSON-RPC request and return ``(id, method, params)``."""
+    if not isinstance(data, dict):
+        raise InvalidRequest(
+            None,
+            "validation_failed",
+            [{"path": "/", "msg": "request must be an object"}],
+        )
     version = data.get("jsonrpc")
     if version != "2.0":
         raise InvalidRequest(
@@ -63,19 +105,36 @@ def parse_line(line: str) -> Tuple[Any, str, Dict[str, Any]]:
     return rid, method, params_raw
 
 
-def build_result_frame(rid: Any, result: Dict[str, Any]) -> str:
-    return json.dumps({"jsonrpc": "2.0", "id": rid, "result": result})
+def _result_object(rid: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": rid, "result": result}
 
 
-def build_error_frame(rid: Any, message: str, code: int = -32603) -> str:
-    return json.dumps({"jsonrpc": "2.0", "id": rid, "error": {"code": code, "message": message}})
+def _error_object(rid: Any, message: str, code: int = -32603) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": rid, "error": {"code": code, "message": message}}
 
 
-def payload_too_large_frame(rid: Any) -> str:
+def _too_large_object(rid: Any) -> Dict[str, Any]:
     result = build_failure_result(
         "validation_failed", [{"path": "", "msg": "payload_too_large"}]
     )
-    return build_result_frame(rid, result)
+    return _result_object(rid, result)
+
+
+def build_result_frame(rid: Any, result: Dict[str, Any]) -> str:
+    return codec.dumps(_result_object(rid, result)).decode("utf-8")
+
+
+def build_error_frame(rid: Any, message: str, code: int = -32603) -> str:
+    return codec.dumps(_error_object(rid, message, code)).decode("utf-8")
+
+
+def payload_too_large_frame(rid: Any) -> str:
+    return codec.dumps(_too_large_object(rid)).decode("utf-8")
+
+
+def payload_too_large_bytes(rid: Any = None) -> bytes:
+    """``payload_too_large_frame`` as newline-terminated wire bytes."""
+    return codec.dumps(_too_large_object(rid), newline=True)
 
 
 def build_failure_result(
@@ -89,22 +148,65 @@ def build_failure_result(
     return payload
 
 
-def process_line(
-    line: str, handler: Callable[[str, Dict[str, Any]], Dict[str, Any]]
-) -> str:
+def process_line(line: str, handler: Handler, size: int | None = None) -> str:
+    """Handle one frame: a request object or a JSON-RPC batch array.
+
+    The payload guard applies to the frame as a whole; a batch yields an
+    array holding one response per item, in item order.
+    """
+    if size is None:
+        size = len(line.encode("utf-8"))
+    return _process(line, size, handler, newline=False).decode("utf-8")
+
+
+def process_frame(raw_line: bytes, handler: Handler) -> bytes | None:
+    """Handle one NDJSON line read off a socket and return the wire bytes.
+
+    The line is decoded straight from bytes and the response comes back
+    newline-terminated, so servers never round-trip through ``str``.
+    Returns ``None`` for blank lines.
+    """
+    stripped = raw_line.strip()
+    if not stripped:
+        return None
+    return _process(stripped, len(stripped), handler, newline=True)
+
+
+def _process(
+    frame: bytes | str, size: int, handler: Handler, newline: bool
+) -> bytes:
+    token = _FRAME_SIZE.set(size)
+    try:
+        if size > MAX_BYTES:
+            return codec.dumps(_too_large_object(None), newline)
+        try:
+            data = codec.loads(frame)
+        except UnicodeDecodeError as exc:
+            return codec.dumps(_error_object(None, f"decode_error: {exc}"), newline)
+        except json.JSONDecodeError as exc:
+            return codec.dumps(_error_object(None, str(exc)), newline)
+        if not isinstance(data, list):
+            return codec.dumps(_respond(data, handler), newline)
+        if not data:
+            result = build_failure_result(
+                "validation_failed",
+                [{"path": "/", "msg": "batch must contain at least one request"}],
+            )
+            return codec.dumps(_result_object(None, result), newline)
+        return codec.dumps(_respond_batch(data, handler), newline)
+    finally:
+        _FRAME_SIZE.reset(token)
+
+
+def _respond(data: Any, handler: Handler) -> Dict[str, Any]:
     rid: Any = None
     try:
-        rid, method, params = parse_line(line)
-        result = handler(method, params)
-        return build_result_frame(rid, result)
-    except PayloadTooLarge:
-        return payload_too_large_frame(rid)
+        rid, method, params = parse_request(data)
+        return _result_object(rid, handler(method, params))
     except InvalidRequest as exc:
         if rid is None:
             rid = exc.rid
-        return build_result_frame(rid, build_failure_result(exc.reason, exc.errors))
-    except json.JSONDecodeError as exc:
-        return build_error_frame(rid, str(exc))
+        return _result_object(rid, build_failure_result(exc.reason, exc.errors))
     except Exception as exc:  # pragma: no cover - exercised via integration tests
         logging.exception("mcp:error reason=dispatch_failure")
         payload = build_failure_result(
@@ -112,4 +214,58 @@ def process_line(
             [{"path": "/", "msg": "unexpected_error"}],
             detail=str(exc),
         )
-        return build_result_frame(rid, payload)
+        return _result_object(rid, payload)
+
+
+class SharedThreadPool:
+    """Thread pool shared by concurrent callers, resized on demand.
+
+    Callers lease the executor for as long as they submit to it. A resize
+    only swaps in a new executor for later leases; the old one is shut down
+    once its last lease is returned.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._workers = 0
+        self._leases: Dict[ThreadPoolExecutor, int] = {}
+
+    @contextmanager
+    def lease(self, workers: int) -> Iterator[ThreadPoolExecutor]:
+        with self._lock:
+            if self._executor is None or self._workers != workers:
+                if self._executor is not None and self._executor not in self._leases:
+                    self._executor.shutdown(wait=False)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix=self._prefix
+                )
+                self._workers = workers
+            executor = self._executor
+            self._leases[executor] = self._leases.get(executor, 0) + 1
+        try:
+            yield executor
+        finally:
+            with self._lock:
+                self._leases[executor] -= 1
+                if not self._leases[executor]:
+                    del self._leases[executor]
+                    if executor is not self._executor:
+                        executor.shutdown(wait=False)
+
+
+_BATCH_POOL = SharedThreadPool("mcp-batch")
+
+
+def _respond_batch(items: List[Any], handler: Handler) -> List[Dict[str, Any]]:
+    workers = batch_workers()
+    if workers <= 1 or len(items) == 1:
+        return [_respond(item, handler) for item in items]
+    with _BATCH_POOL.lease(workers) as executor:
+        # Each item runs in a copy of this context so it sees the frame size.
+        futures = [
+            executor.submit(contextvars.copy_context().run, _respond, item, handler)
+            for item in items
+        ]
+        return [future.result() for future in futures]
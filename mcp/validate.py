@@ -1,27 +1,29 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from json.encoder import encode_basestring_ascii as _encode_string
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
-import httpx
-from jsonschema import Draft202012Validator
-try:
-    from referencing import Registry, Resource  # type: ignore
-except Exception:  # pragma: no cover
-    Registry = None  # type: ignore
-    Resource = None  # type: ignore
-
 from .core import (
     _schema_file_path,
+    schema_catalog,
+    schema_entry,
     PathOutsideConfiguredRoot,
     labs_schema_base,
     labs_schema_cache_dir,
     labs_schema_prefix,
     labs_schema_version,
+    watching,
 )
+from .remote import RemoteSchemaError, cached_schema, fetch_schema, remote_ttl
 
 # Alias mapping: accept nested alias but validate against canonical schema
 _SCHEMA_ALIASES = {
@@ -31,6 +33,12 @@ _SCHEMA_ALIASES = {
 
 MAX_BYTES = 1 * 1024 * 1024  # 1 MiB
 _DEFAULT_MAX_BATCH = 100
+_DEFAULT_VALIDATOR_CACHE_SIZE = 64
+_VALIDATOR_ENGINES = {"reference", "compiled"}
+_PARALLEL_MIN_BATCH = 8
+_DEFAULT_RESULT_CACHE_BYTES = 16 * 1024 * 1024
+_DEFAULT_RESULT_CACHE_TTL = 300.0
+_RESULT_ENTRY_OVERHEAD = 256
 
 
 def _max_batch() -> int:
@@ -46,6 +54,239 @@ def _max_batch() -> int:
     return value
 
 
+def _validator_cache_size() -> int:
+    raw = os.environ.get("MCP_VALIDATOR_CACHE_SIZE")
+    if raw is None or not raw.strip():
+        return _DEFAULT_VALIDATOR_CACHE_SIZE
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_VALIDATOR_CACHE_SIZE '{raw}'") from exc
+    if value < 0:
+        raise RuntimeError("MCP_VALIDATOR_CACHE_SIZE must be a non-negative integer")
+    return value
+
+
+def validate_workers() -> int:
+    raw = os.environ.get("MCP_VALIDATE_WORKERS")
+    if raw is None or not raw.strip():
+        return 0
+    value = raw.strip().lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        workers = int(value)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_VALIDATE_WORKERS '{raw}'") from exc
+    if workers < 0:
+        raise RuntimeError("MCP_VALIDATE_WORKERS must be a non-negative integer")
+    return workers
+
+
+def _validator_engine() -> str:
+    raw = os.environ.get("MCP_VALIDATOR_ENGINE")
+    if raw is None or not raw.strip():
+        return "reference"
+    value = raw.strip().lower()
+    if value not in _VALIDATOR_ENGINES:
+        raise RuntimeError(f"Invalid MCP_VALIDATOR_ENGINE '{raw}'")
+    return value
+
+
+class _ValidatorCache:
+    """Process-wide LRU of compiled validators keyed by schema fingerprint."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Any:
+        with self._lock:
+            validator = self._entries.get(key)
+            if validator is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return validator
+
+    def put(self, key: Tuple[Any, ...], validator: Any) -> None:
+        limit = _validator_cache_size()
+        with self._lock:
+            if limit == 0:
+                return
+            self._entries[key] = validator
+            self._entries.move_to_end(key)
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, canonical_url: str | None = None) -> int:
+        with self._lock:
+            if canonical_url is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            stale = [key for key in self._entries if key[0] == canonical_url]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "limit": _validator_cache_size(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_VALIDATORS = _ValidatorCache()
+
+
+def validator_cache_stats() -> Dict[str, int]:
+    return _VALIDATORS.stats()
+
+
+def invalidate_validator_cache(canonical_url: str | None = None) -> int:
+    """Drop cached validators for ``canonical_url`` (or all); returns the count.
+
+    Memoized results are dropped too since they were produced by those schemas.
+    """
+    _RESULTS.invalidate()
+    return _VALIDATORS.invalidate(canonical_url)
+
+
+def _result_cache_enabled() -> bool:
+    raw = os.environ.get("MCP_RESULT_CACHE")
+    if raw is None or not raw.strip():
+        return True
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid {name} '{raw}'") from exc
+    if value < 0:
+        raise RuntimeError(f"{name} must be non-negative")
+    return value
+
+
+def _result_size(result: Dict[str, Any]) -> int:
+    # Rough per-entry footprint: fixed overhead plus the error strings.
+    size = _RESULT_ENTRY_OVERHEAD
+    for error in result.get("errors", ()):
+        size += 64 + len(error["path"]) + len(error["msg"])
+    return size
+
+
+class _ResultCache:
+    """Memoized validation results keyed by schema fingerprint and asset hash."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], int, float]]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Dict[str, Any] | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            result, size, expires = entry
+            if expires and expires <= now:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_result(result)
+
+    def put(self, key: Tuple[Any, ...], result: Dict[str, Any]) -> None:
+        budget = int(_env_number("MCP_RESULT_CACHE_BYTES", _DEFAULT_RESULT_CACHE_BYTES))
+        ttl = _env_number("MCP_RESULT_CACHE_TTL", _DEFAULT_RESULT_CACHE_TTL)
+        size = _result_size(result)
+        if size > budget:
+            return
+        expires = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (_copy_result(result), size, expires)
+            self._bytes += size
+            while self._bytes > budget and self._entries:
+                _, (_, dropped, _) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self.evictions += 1
+
+    def invalidate(self) -> int:
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": _result_cache_enabled(),
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    copied = dict(result)
+    copied["errors"] = [dict(error) for error in result.get("errors", ())]
+    return copied
+
+
+_RESULTS = _ResultCache()
+
+
+def result_cache_stats() -> Dict[str, Any]:
+    return _RESULTS.stats()
+
+
+def invalidate_result_cache() -> int:
+    return _RESULTS.invalidate()
+
+
+def _asset_digest(payload: Dict[str, Any]) -> str | None:
+    try:
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    # Lone surrogates are valid JSON escapes; keep them distinct rather than fail.
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
 def _pointer_from_path(parts) -> str:
     # RFC6901 escaping
     def esc(s: str) -> str:
@@ -60,9 +301,78 @@ def _pointer_from_path(parts) -> str:
     return out or "/"
 
 
-def _size_okay(obj: Any) -> bool:
+def _json_key(key: Any) -> str:
+    # Mirrors the key coercion ``json.dumps`` applies to non-string keys.
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return _float_text(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _float_text(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _encoded_size(obj: Any, limit: int) -> int:
+    """Return the UTF-8 length of ``json.dumps(obj)`` without building the string.
+
+    Stops as soon as the running total exceeds ``limit``, so the returned
+    value is only exact when it is ``<= limit``. Raises ``TypeError`` for
+    values ``json.dumps`` cannot serialize.
+    """
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            total += len(_encode_string(item))
+        elif item is None or item is True:
+            total += 4
+        elif item is False:
+            total += 5
+        elif isinstance(item, int):
+            total += len(int.__repr__(item))
+        elif isinstance(item, float):
+            total += len(_float_text(item))
+        elif isinstance(item, (list, tuple)):
+            # Brackets plus ", " between items.
+            total += 2 + 2 * max(len(item) - 1, 0)
+            stack.extend(item)
+        elif isinstance(item, dict):
+            # Braces, ", " between members and ": " after each key.
+            total += 2 + 2 * max(len(item) - 1, 0) + 2 * len(item)
+            for key, value in item.items():
+                total += len(_encode_string(_json_key(key)))
+                stack.append(value)
+        else:
+            raise TypeError(f"Object of type {type(item).__name__} is not JSON serializable")
+        if total > limit:
+            # Self-referencing containers also end here instead of looping.
+            return total
+    return total
+
+
+def _size_okay(obj: Any, size_hint: int | None = None) -> bool:
+    # ``size_hint`` is the byte length the transport already measured.
+    if size_hint is not None:
+        return size_hint <= MAX_BYTES
     try:
-        return len(json.dumps(obj).encode("utf-8")) <= MAX_BYTES
+        return _encoded_size(obj, MAX_BYTES) <= MAX_BYTES
     except Exception:
         return False
 
@@ -128,27 +438,39 @@ def _cache_path(canonical_filename: str) -> Path | None:
     return cache_dir / canonical_filename
 
 
-def _fetch_canonical_schema(url: str, canonical_filename: str) -> Dict[str, Any]:
-    cache_path = _cache_path(canonical_filename)
-    if cache_path and cache_path.exists():
-        try:
-            return json.loads(cache_path.read_text())
-        except Exception:
-            cache_path.unlink(missing_ok=True)
+# Remote schemas shipped in a schema bundle, keyed by URL.
+_BUNDLED_REMOTE: Dict[str, Dict[str, Any]] = {}
+
 
+def pin_remote_schemas(schemas: Dict[str, Dict[str, Any]] | None) -> None:
+    _BUNDLED_REMOTE.clear()
+    if schemas:
+        _BUNDLED_REMOTE.update(schemas)
+
+
+def _fetch_canonical_schema(url: str, canonical_filename: str) -> Dict[str, Any]:
+    bundled = _BUNDLED_REMOTE.get(url)
+    if bundled is not None:
+        return bundled
     try:
-        response = httpx.get(url, timeout=5.0)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as exc:
+        return fetch_schema(url, _cache_path(canonical_filename)).data
+    except RemoteSchemaError as exc:
         raise SchemaResolutionError(str(exc)) from exc
 
-    if cache_path:
-        try:
-            cache_path.write_text(json.dumps(data, indent=2))
-        except Exception:
-            pass
-    return data
+
+def _remote_digest(*urls: str) -> str | None:
+    # Content hash of the schema already fetched for one of ``urls``;
+    # expired copies are revalidated first so upstream edits change it.
+    ttl = remote_ttl()
+    for url in urls:
+        entry = cached_schema(url)
+        if entry is None:
+            continue
+        if not entry.fresh(ttl):
+            filename = Path(urlparse(url).path or "").name
+            entry = fetch_schema(url, _cache_path(filename))
+        return entry.sha256
+    return None
 
 
 def _load_schema(
@@ -158,6 +480,9 @@ def _load_schema(
     canonical_url: str,
 ) -> tuple[Dict[str, Any], Path | None]:
     canonical = _SCHEMA_ALIASES.get(name, name)
+    entry = schema_entry(canonical)
+    if entry is not None and entry.inside and entry.data is not None:
+        return entry.data, entry.path
     try:
         path = _schema_file_path(canonical)
     except PathOutsideConfiguredRoot:
@@ -179,11 +504,22 @@ def _load_schema(
             raise primary_exc
     return schema, None
 
-def _build_local_registry():
-    if Registry is None or Resource is None:
-        return None
+_REGISTRY_BASE_DIR = Path("libs/synesthetic-schemas")
+
 
-    base_dir = Path("libs/synesthetic-schemas")
+def _registry_schema_dir(base_dir: Path) -> Path | None:
+    schema_dir = base_dir / "schemas"
+    if schema_dir.is_dir():
+        return schema_dir
+    alt = base_dir / "jsonschema"
+    if alt.is_dir():
+        return alt
+    return None
+
+
+def _local_registry_contents() -> Dict[str, Any]:
+    """``uri -> schema`` for every resource the local registry should hold."""
+    base_dir = _REGISTRY_BASE_DIR
     version_path = base_dir / "version.json"
     version: str | None = None
     try:
@@ -194,112 +530,386 @@ def _build_local_registry():
     except Exception:
         version = None
 
-    schema_dir = base_dir / "schemas"
-    if not schema_dir.is_dir():
-        alt = base_dir / "jsonschema"
-        if alt.is_dir():
-            schema_dir = alt
-        else:
-            schema_dir = None
-
-    registry = Registry()
+    schema_dir = _registry_schema_dir(base_dir)
     if schema_dir is None or not schema_dir.is_dir():
-        return registry
+        return {}
 
-    resources = {}
+    resources: Dict[str, Any] = {}
     for path in sorted(schema_dir.glob("*.json")):
         try:
             contents = json.loads(path.read_text())
         except Exception:
             continue
+        if not isinstance(contents, dict):
+            continue
         if version:
             url = f"https://schemas.synesthetic.dev/{version}/{path.name}"
         else:
             url = None
-        try:
-            resource = Resource.from_contents(contents)
-        except Exception:
-            continue
         if url:
-            resources[url] = resource
+            resources[url] = contents
         schema_id = contents.get("$id")
         if isinstance(schema_id, str) and schema_id:
-            resources.setdefault(schema_id, resource)
+            resources.setdefault(schema_id, contents)
+    return resources
+
+
+def _referencing():
+    # Imported on first use: ``jsonschema``/``referencing`` dominate the
+    # import time of this module and most CLI paths never build a validator.
+    try:
+        from referencing import Registry, Resource  # type: ignore
+    except Exception:  # pragma: no cover
+        return None, None
+    return Registry, Resource
 
-    if resources:
-        registry = registry.with_resources(resources.items())
 
+def _registry_from_contents(contents: Dict[str, Any]):
+    Registry, Resource = _referencing()
+    if Registry is None or Resource is None:
+        return None
+    registry = Registry()
+    built: Dict[int, Any] = {}
+    resources = []
+    for uri, schema in contents.items():
+        if id(schema) not in built:
+            try:
+                built[id(schema)] = Resource.from_contents(schema)
+            except Exception:
+                built[id(schema)] = None
+        resource = built[id(schema)]
+        if resource is not None:
+            resources.append((uri, resource))
+    if resources:
+        registry = registry.with_resources(resources)
     return registry
 
 
+def _build_local_registry():
+    if _referencing()[0] is None:
+        return None
+    return _registry_from_contents(_local_registry_contents())
 
-def validate_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
-    if not _size_okay(asset):
-        return {
-            "ok": False,
-            "reason": "validation_failed",
-            "errors": [{"path": "/", "msg": "payload_too_large"}],
-        }
 
-    if not isinstance(asset, dict):
-        return _validation_error("/", "asset must be an object")
+def _registry_signature() -> Tuple[Any, ...]:
+    # Cheap stat-only fingerprint of every file _build_local_registry reads.
+    base_dir = _REGISTRY_BASE_DIR
+    entries: List[Tuple[str, int, int]] = []
+    candidates = [base_dir / "version.json"]
+    schema_dir = _registry_schema_dir(base_dir)
+    if schema_dir is not None:
+        candidates.extend(sorted(schema_dir.glob("*.json")))
+    for path in candidates:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return (str(base_dir.resolve()), tuple(entries))
 
-    schema_marker = asset.get("$schema")
-    if not isinstance(schema_marker, str) or not schema_marker.strip():
-        return _validation_error("/$schema", "top-level $schema is required")
+
+class _LocalRegistry:
+    """Shared ``referencing`` registry, rebuilt only when the schema tree changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signature: Tuple[Any, ...] | None = None
+        self._registry: Any = None
+        self.generation = 0
+        self._epoch = 0
+        self._synced: int | None = None
+        self._pinned = False
+
+    def get(self) -> Tuple[Any, int]:
+        with self._lock:
+            if self._pinned:
+                return self._registry, self.generation
+            if watching() and self._signature is not None and self._synced == self._epoch:
+                return self._registry, self.generation
+            epoch = self._epoch
+        signature = _registry_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._registry = _build_local_registry()
+                self._signature = signature
+                self.generation += 1
+            self._synced = epoch
+            return self._registry, self.generation
+
+    def notify(self) -> None:
+        with self._lock:
+            self._epoch += 1
+
+    def pin(self, contents: Dict[str, Any] | None) -> None:
+        registry = _registry_from_contents(contents) if contents is not None else None
+        with self._lock:
+            self._pinned = contents is not None
+            self._registry = registry
+            self._signature = None
+            self.generation += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            files = len(self._signature[1]) if self._signature else 0
+            return {"generation": self.generation, "files": files, "pinned": self._pinned}
+
+
+_LOCAL_REGISTRY = _LocalRegistry()
+
+
+def local_registry():
+    """Return the shared local ``$ref`` registry, rebuilding it if files changed."""
+    return _LOCAL_REGISTRY.get()[0]
+
+
+def invalidate_local_registry() -> None:
+    _LOCAL_REGISTRY.invalidate()
+
+
+def pin_local_registry(contents: Dict[str, Any] | None) -> None:
+    """Build the registry from bundled ``uri -> schema`` contents instead of
+    the submodule tree; ``None`` goes back to the tree."""
+    _LOCAL_REGISTRY.pin(contents)
+
+
+def notify_local_registry() -> None:
+    """Re-check the registry's files on next use (watcher hook)."""
+    _LOCAL_REGISTRY.notify()
+
+
+def registry_stats() -> Dict[str, Any]:
+    return _LOCAL_REGISTRY.stats()
+
+
+def _validator_cache_key(
+    name: str, requested_url: str, canonical_url: str
+) -> Tuple[Any, ...]:
+    # Local schema files are fingerprinted by content hash (or mtime and size
+    # outside the catalog) so edits are picked up; remote schemas by the hash
+    # of the copy last fetched or revalidated.
+    canonical = _SCHEMA_ALIASES.get(name, name)
+    entry = schema_entry(canonical)
+    if entry is not None and entry.inside:
+        # Indexed schemas carry a content hash, which survives same-tick edits.
+        return (canonical_url, str(entry.path), entry.sha256, entry.size)
+    path = _schema_file_path(canonical)
+    try:
+        stat = path.stat()
+    except OSError:
+        digest = _remote_digest(canonical_url, requested_url)
+        return (canonical_url, requested_url, digest, None)
+    return (canonical_url, str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _build_validator(
+    schema_obj: Dict[str, Any],
+    schema_path: Path | None,
+    registry: Any,
+    engine: str = "reference",
+):
+    # Establish base_uri for $ref resolution from file path if $id missing
+    base_uri = None
+    if schema_path and schema_path.exists():
+        base_uri = schema_path.resolve().as_uri()
+    schema_copy = dict(schema_obj)
+    if base_uri and "$id" not in schema_copy:
+        schema_copy["$id"] = base_uri
+
+    from jsonschema import Draft202012Validator
+
+    if registry is not None:
+        validator = Draft202012Validator(schema_copy, registry=registry)
+    else:
+        validator = Draft202012Validator(schema_copy)
+    if engine == "compiled":
+        from .codegen import CompileError, compile_validator
+
+        try:
+            return compile_validator(validator)
+        except CompileError:
+            return validator
+    return validator
+
+
+def _validator_entry(
+    name: str,
+    canonical_filename: str,
+    requested_url: str,
+    canonical_url: str,
+) -> Tuple[Tuple[Any, ...], Any]:
+    """Return ``(schema fingerprint, validator)`` for a resolved schema target."""
+    engine = _validator_engine()
+    registry, generation = _LOCAL_REGISTRY.get()
+    fingerprint = _validator_cache_key(name, requested_url, canonical_url) + (
+        generation,
+    )
+    key = fingerprint + (engine,)
+    validator = _VALIDATORS.get(key)
+    if validator is not None:
+        return fingerprint, validator
+    schema_obj, schema_path = _load_schema(
+        name, canonical_filename, requested_url, canonical_url
+    )
+    if schema_path is None:
+        # Remote fingerprints carry the hash of what was just fetched.
+        fingerprint = _validator_cache_key(name, requested_url, canonical_url) + (
+            generation,
+        )
+        key = fingerprint + (engine,)
+    validator = _build_validator(schema_obj, schema_path, registry, engine)
+    _VALIDATORS.put(key, validator)
+    return fingerprint, validator
+
+
+def _validator_for_target(
+    name: str,
+    canonical_filename: str,
+    requested_url: str,
+    canonical_url: str,
+):
+    return _validator_entry(name, canonical_filename, requested_url, canonical_url)[1]
+
+
+def _marker_target(
+    schema_marker: str,
+) -> Tuple[Tuple[str, str, str, str] | None, Dict[str, Any] | None]:
     try:
-        (
-            schema_name,
-            canonical_filename,
-            requested_url,
-            canonical_url,
-        ) = _schema_target(schema_marker)
+        return _schema_target(schema_marker), None
     except PathOutsideConfiguredRoot:
-        return _validation_error("/$schema", "schema_outside_configured_root")
+        return None, _validation_error("/$schema", "schema_outside_configured_root")
     except ValueError as exc:
         message = str(exc)
         if message == "schema_not_canonical":
-            return _validation_error("/$schema", "schema_must_use_canonical_host")
+            return None, _validation_error("/$schema", "schema_must_use_canonical_host")
         if message == "empty_marker":
-            return _validation_error("/$schema", "top-level $schema is required")
-        return _validation_error("/$schema", "invalid_schema_marker")
+            return None, _validation_error("/$schema", "top-level $schema is required")
+        return None, _validation_error("/$schema", "invalid_schema_marker")
+
+
+def _marker_validator(
+    target: Tuple[str, str, str, str],
+) -> Tuple[Tuple[Tuple[Any, ...], Any] | None, Dict[str, Any] | None]:
+    try:
+        return _validator_entry(*target), None
+    except PathOutsideConfiguredRoot:
+        return None, _validation_error("/$schema", "schema_outside_configured_root")
+    except SchemaResolutionError as exc:
+        return None, {
+            "ok": False,
+            "reason": "validation_failed",
+            "errors": [{"path": "/", "msg": f"schema_resolution_failed: {exc}"}],
+        }
+
+
+def schema_fingerprint(marker: Any) -> Tuple[Any, ...] | None:
+    """Fingerprint of the schema ``marker`` resolves to, without building a validator.
+
+    Matches the fingerprint validation results are cached under; ``None``
+    when the marker does not resolve.
+    """
+    if not isinstance(marker, str) or not marker.strip():
+        return None
+    target, error = _marker_target(marker)
+    if error is not None or target is None:
+        return None
+    name, _, requested_url, canonical_url = target
+    try:
+        generation = _LOCAL_REGISTRY.get()[1]
+        return _validator_cache_key(name, requested_url, canonical_url) + (generation,)
+    except Exception:
+        return None
+
+
+def _resolve_asset(
+    asset: Dict[str, Any],
+    shared: Dict[Any, Any] | None,
+) -> Tuple[Tuple[Dict[str, Any], Tuple[Any, ...], Any] | None, Dict[str, Any] | None]:
+    """``((payload, fingerprint, validator), None)`` for ``asset``, or ``(None, error)``."""
+    if not isinstance(asset, dict):
+        return None, _validation_error("/", "asset must be an object")
+
+    schema_marker = asset.get("$schema")
+    if not isinstance(schema_marker, str) or not schema_marker.strip():
+        return None, _validation_error("/$schema", "top-level $schema is required")
+
+    target_key = ("target", schema_marker)
+    if shared is not None and target_key in shared:
+        target, error = shared[target_key]
+    else:
+        target, error = _marker_target(schema_marker)
+        if shared is not None:
+            shared[target_key] = (target, error)
+    if target is None:
+        return None, error or _validation_error("/$schema", "invalid_schema_marker")
 
     legacy_keys = [key for key in ("schema", "$schemaRef") if key in asset]
     if legacy_keys:
         joined = ",".join(sorted(legacy_keys))
-        return _validation_error(
+        return None, _validation_error(
             "/$schema", f"legacy schema keys not allowed: {joined}"
         )
 
     payload = dict(asset)
     payload.pop("$schema", None)
 
-    try:
-        schema_obj, schema_path = _load_schema(
-            schema_name, canonical_filename, requested_url, canonical_url
-        )
-    except PathOutsideConfiguredRoot:
-        return _validation_error("/$schema", "schema_outside_configured_root")
-    except SchemaResolutionError as exc:
+    validator_key = ("validator", schema_marker)
+    if shared is not None and validator_key in shared:
+        resolved, error = shared[validator_key]
+    else:
+        resolved, error = _marker_validator(target)
+        if shared is not None:
+            shared[validator_key] = (resolved, error)
+    if resolved is None:
+        return None, error or _validation_error("/$schema", "invalid_schema_marker")
+    fingerprint, validator = resolved
+    return (payload, fingerprint, validator), None
+
+
+def _result_key(
+    payload: Dict[str, Any], fingerprint: Tuple[Any, ...]
+) -> Tuple[Any, ...] | None:
+    if not _result_cache_enabled():
+        return None
+    digest = _asset_digest(payload)
+    if digest is None:
+        return None
+    return fingerprint + (digest,)
+
+
+def _validate_with(
+    asset: Dict[str, Any],
+    shared: Dict[Any, Any] | None,
+    size_hint: int | None = None,
+) -> Dict[str, Any]:
+    # ``shared`` memoizes marker resolution and validator lookup across a batch.
+    if not _size_okay(asset, size_hint):
         return {
             "ok": False,
             "reason": "validation_failed",
-            "errors": [{"path": "/", "msg": f"schema_resolution_failed: {exc}"}],
+            "errors": [{"path": "/", "msg": "payload_too_large"}],
         }
+    resolved, error = _resolve_asset(asset, shared)
+    if resolved is None:
+        return error or _validation_error("/$schema", "invalid_schema_marker")
+    payload, fingerprint, validator = resolved
 
-    # Establish base_uri for $ref resolution from file path if $id missing
-    base_uri = None
-    if schema_path and schema_path.exists():
-        base_uri = schema_path.resolve().as_uri()
-    schema_copy = dict(schema_obj)
-    if base_uri and "$id" not in schema_copy:
-        schema_copy["$id"] = base_uri
+    cache_key = _result_key(payload, fingerprint)
+    if cache_key is not None:
+        cached = _RESULTS.get(cache_key)
+        if cached is not None:
+            return cached
 
-    registry = _build_local_registry()
-    if registry is not None:
-        validator = Draft202012Validator(schema_copy, registry=registry)
-    else:
-        validator = Draft202012Validator(schema_copy)
+    result = _run_validator(validator, payload)
+    if cache_key is not None:
+        _RESULTS.put(cache_key, result)
+    return result
+
+
+def _run_validator(validator: Any, payload: Dict[str, Any]) -> Dict[str, Any]:
     errors = []
     for err in validator.iter_errors(payload):
         pointer = _pointer_from_path(err.absolute_path)
@@ -311,7 +921,91 @@ def validate_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
     return {"ok": True, "errors": []}
 
 
-def validate_many(assets: List[Dict[str, Any]] | None) -> Dict[str, Any]:
+def validate_asset(
+    asset: Dict[str, Any], size_hint: int | None = None
+) -> Dict[str, Any]:
+    """Validate ``asset``; ``size_hint`` is its already-measured byte size, if known."""
+    return _validate_with(asset, None, size_hint)
+
+
+def _batch_entry(validation: Dict[str, Any]) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {"ok": validation.get("ok", False)}
+    if "errors" in validation and validation["errors"]:
+        entry["errors"] = validation["errors"]
+    if not entry["ok"] and validation.get("reason"):
+        entry["reason"] = validation["reason"]
+    return entry
+
+
+def prewarm_validators() -> List[str]:
+    """Build and cache validators for every schema in the catalog."""
+    warmed: List[str] = []
+    prefix = labs_schema_prefix()
+    entries = sorted(schema_catalog(), key=lambda entry: entry.name)
+    for entry in entries:
+        if not entry.inside or entry.data is None:
+            continue
+        try:
+            target = _schema_target(f"{prefix}{entry.name}.schema.json")
+            _validator_for_target(*target)
+        except Exception:
+            continue
+        warmed.append(target[0])
+    return warmed
+
+
+def _group_key(asset: Any, targets: Dict[str, str]) -> str | None:
+    if not isinstance(asset, dict):
+        return None
+    marker = asset.get("$schema")
+    if not isinstance(marker, str):
+        return None
+    if marker not in targets:
+        # Aliases and fragments of one schema share a group; markers that do
+        # not resolve are grouped as written.
+        target, _ = _marker_target(marker)
+        targets[marker] = target[3] if target is not None else marker
+    return targets[marker]
+
+
+def _group_indices(assets: List[Any]) -> Dict[str | None, List[int]]:
+    groups: Dict[str | None, List[int]] = {}
+    targets: Dict[str, str] = {}
+    for index, asset in enumerate(assets):
+        groups.setdefault(_group_key(asset, targets), []).append(index)
+    return groups
+
+
+def validate_group(
+    assets: List[Any], size_hint: int | None = None
+) -> List[Dict[str, Any]]:
+    """Validate assets whose ``$schema`` resolves to one schema, resolving it once."""
+    shared: Dict[Any, Any] = {}
+    return [_batch_entry(_validate_with(asset, shared, size_hint)) for asset in assets]
+
+
+def _validate_groups_serial(
+    assets: List[Any],
+    groups: Dict[str | None, List[int]],
+    size_hint: int | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str | None, float]]:
+    results: List[Dict[str, Any]] = [{} for _ in assets]
+    elapsed: Dict[str | None, float] = {}
+    for marker, indices in groups.items():
+        started = time.perf_counter()
+        entries = validate_group([assets[index] for index in indices], size_hint)
+        elapsed[marker] = time.perf_counter() - started
+        for index, entry in zip(indices, entries):
+            results[index] = entry
+    return results, elapsed
+
+
+def validate_many(
+    assets: List[Dict[str, Any]] | None,
+    debug: bool = False,
+    size_hint: int | None = None,
+) -> Dict[str, Any]:
+    # ``size_hint`` bounds the whole request frame, so it bounds every asset too.
     if assets is None:
         assets = []
     if not isinstance(assets, list):
@@ -330,17 +1024,32 @@ def validate_many(assets: List[Dict[str, Any]] | None) -> Dict[str, Any]:
             "limit": limit,
         }
 
-    results: List[Dict[str, Any]] = []
-    all_ok = True
-    for item in assets:
-        validation = validate_asset(item)
-        entry: Dict[str, Any] = {"ok": validation.get("ok", False)}
-        if "errors" in validation and validation["errors"]:
-            entry["errors"] = validation["errors"]
-        if not entry["ok"] and validation.get("reason"):
-            entry["reason"] = validation["reason"]
-        results.append(entry)
-        if not entry["ok"]:
-            all_ok = False
-
-    return {"ok": all_ok, "results": results}
+    groups = _group_indices(assets)
+    outcome: Tuple[List[Dict[str, Any]], Dict[str | None, float]] | None = None
+    workers = validate_workers()
+    if workers > 1 and len(assets) >= _PARALLEL_MIN_BATCH:
+        from .workers import map_batch
+
+        try:
+            outcome = map_batch(assets, groups, workers, size_hint)
+        except Exception:
+            logging.warning(
+                "mcp:warning reason=worker_pool_failed workers=%s", workers, exc_info=True
+            )
+            outcome = None
+    if outcome is None:
+        outcome = _validate_groups_serial(assets, groups, size_hint)
+    results, elapsed = outcome
+
+    all_ok = all(entry["ok"] for entry in results)
+    response: Dict[str, Any] = {"ok": all_ok, "results": results}
+    if debug:
+        response["groups"] = [
+            {
+                "schema": marker,
+                "count": len(indices),
+                "elapsed_ms": round(elapsed.get(marker, 0.0) * 1000, 3),
+            }
+            for marker, indices in groups.items()
+        ]
+    return response
@@ -0,0 +1,415 @@
+"""Filesystem watcher that publishes schema and example changes to the caches.
+
+With ``MCP_WATCH`` enabled, the schemas directory, the examples tree, the
+local ``$ref`` registry and ``LABS_SCHEMA_CACHE_DIR`` are watched with
+inotify (through ``ctypes``) where available, or by polling ``stat`` every
+``MCP_WATCH_INTERVAL`` seconds otherwise. While a watcher runs, the caches
+trust their last refresh and skip per-request ``stat`` calls; every change
+event marks them stale so the next request re-checks the affected files.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+from . import core, remote, validate
+
+_MODES = {"off", "auto", "inotify", "poll"}
+_DEFAULT_INTERVAL = 1.0
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def watch_mode() -> str:
+    raw = os.environ.get("MCP_WATCH")
+    if raw is None or not raw.strip():
+        return "off"
+    value = raw.strip().lower()
+    if value in {"0", "false", "no"}:
+        return "off"
+    if value in {"1", "true", "yes", "on"}:
+        return "auto"
+    if value not in _MODES:
+        raise RuntimeError(f"Invalid MCP_WATCH '{raw}'")
+    return value
+
+
+def watch_interval() -> float:
+    raw = os.environ.get("MCP_WATCH_INTERVAL")
+    if raw is None or not raw.strip():
+        return _DEFAULT_INTERVAL
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid MCP_WATCH_INTERVAL '{raw}'") from exc
+    if not value > 0:
+        raise RuntimeError("MCP_WATCH_INTERVAL must be a positive number")
+    return value
+
+
+def watch_targets() -> Dict[str, Path]:
+    """Directories to watch, keyed by the kind of change they publish."""
+    targets = {
+        "schemas": core._schemas_dir(),
+        "examples": core._examples_dir(),
+    }
+    registry = validate._registry_schema_dir(validate._REGISTRY_BASE_DIR)
+    targets["registry"] = registry or validate._REGISTRY_BASE_DIR
+    cache_dir = core.labs_schema_cache_dir()
+    if cache_dir is not None:
+        targets["labs_cache"] = cache_dir
+    return {kind: Path(os.path.abspath(path)) for kind, path in targets.items()}
+
+
+def publish(kinds: Iterable[str]) -> None:
+    """Tell the caches which watched trees changed."""
+    kinds = set(kinds)
+    if not kinds:
+        return
+    if "schemas" in kinds:
+        core.notify_schema_catalog()
+    if "examples" in kinds:
+        core.notify_example_index()
+    if "registry" in kinds:
+        validate.notify_local_registry()
+    if "labs_cache" in kinds:
+        remote.invalidate_remote_schemas()
+        validate.invalidate_validator_cache()
+    # Cached examples depend on both their files and their schemas.
+    core.notify_example_cache()
+
+
+def _walk(root: Path) -> Iterable[Path]:
+    # Yields the root and every directory under it once, guarding symlink loops.
+    seen: Set[Tuple[int, int]] = set()
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in seen:
+            continue
+        seen.add((stat.st_dev, stat.st_ino))
+        yield Path(directory)
+        try:
+            with os.scandir(directory) as scan:
+                for item in scan:
+                    with contextlib.suppress(OSError):
+                        if item.is_dir():
+                            stack.append(item.path)
+        except OSError:
+            continue
+
+
+def _snapshot(root: Path) -> Tuple[Snapshot, bool]:
+    """``path -> (mtime_ns, size)`` for the tree, and whether any mtime is racy."""
+    state: Snapshot = {}
+    racy = False
+    for directory in _walk(root):
+        try:
+            with os.scandir(directory) as scan:
+                items = list(scan)
+            stat = os.stat(directory)
+        except OSError:
+            continue
+        state[str(directory)] = (stat.st_mtime_ns, stat.st_size)
+        racy = racy or core._racy(stat.st_mtime_ns)
+        for item in items:
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            state[item.path] = (stat.st_mtime_ns, stat.st_size)
+            racy = racy or core._racy(stat.st_mtime_ns)
+    return state, racy
+
+
+def _load_libc():
+    if not hasattr(os, "O_NONBLOCK"):  # pragma: no cover - non-POSIX
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    return _load_libc() is not None
+
+
+class _Poller:
+    """Compares ``stat`` snapshots of every target each interval."""
+
+    name = "poll"
+
+    def __init__(self, targets: Dict[str, Path]) -> None:
+        self._targets = targets
+        self._state: Dict[str, Tuple[Snapshot, bool]] = {}
+
+    def arm(self) -> None:
+        for kind, root in self._targets.items():
+            self._state[kind] = _snapshot(root)
+
+    def poll(self, timeout: float, wakeup: int) -> Set[str]:
+        ready, _, _ = select.select([wakeup], [], [], timeout)
+        if ready:
+            return set()
+        changed = set()
+        for kind, root in self._targets.items():
+            previous, was_racy = self._state.get(kind, ({}, True))
+            current = _snapshot(root)
+            # Racy mtimes may hide a second same-tick write, so they re-publish.
+            if was_racy or current[0] != previous:
+                changed.add(kind)
+            self._state[kind] = current
+        return changed
+
+    def close(self) -> None:
+        self._state.clear()
+
+
+class _Inotify:
+    """inotify watches on every directory of every target."""
+
+    name = "inotify"
+
+    def __init__(self, targets: Dict[str, Path], libc) -> None:
+        self._targets = targets
+        self._libc = libc
+        self._fd = -1
+        self._kinds: Dict[int, Set[str]] = {}
+        self._paths: Dict[int, str] = {}
+        self._roots: Dict[str, Set[int]] = {}
+        self._missing: Set[str] = set()
+
+    def arm(self) -> None:
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        for kind in self._targets:
+            self._arm_kind(kind)
+
+    def _add(self, kind: str, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _IN_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise OSError(err, "inotify watch limit reached")
+            return
+        self._kinds.setdefault(wd, set()).add(kind)
+        self._paths[wd] = str(directory)
+        self._roots.setdefault(kind, set()).add(wd)
+
+    def _arm_kind(self, kind: str) -> bool:
+        root = self._targets[kind]
+        if not root.is_dir():
+            self._missing.add(kind)
+            return False
+        self._missing.discard(kind)
+        for directory in _walk(root):
+            self._add(kind, directory)
+        return True
+
+    def _disarm_kind(self, kind: str) -> None:
+        for wd in self._roots.pop(kind, set()):
+            kinds = self._kinds.get(wd)
+            if kinds is None:
+                continue
+            kinds.discard(kind)
+            if not kinds:
+                del self._kinds[wd]
+                self._paths.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+        self._missing.add(kind)
+
+    def poll(self, timeout: float, wakeup: int) -> Set[str]:
+        changed: Set[str] = set()
+        # Targets that did not exist yet are retried every interval.
+        for kind in sorted(self._missing):
+            if self._arm_kind(kind):
+                changed.add(kind)
+        ready, _, _ = select.select([self._fd, wakeup], [], [], timeout)
+        if self._fd not in ready:
+            return changed
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            raw_name = data[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed.update(self._targets)
+                continue
+            kinds = set(self._kinds.get(wd, ()))
+            changed.update(kinds)
+            if mask & _IN_IGNORED:
+                for kind in kinds:
+                    self._roots.get(kind, set()).discard(wd)
+                self._kinds.pop(wd, None)
+                self._paths.pop(wd, None)
+                continue
+            parent = self._paths.get(wd)
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF) and parent is not None:
+                for kind in kinds:
+                    if str(self._targets[kind]) == parent:
+                        self._disarm_kind(kind)
+                continue
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO) and parent:
+                name = raw_name.split(b"\0", 1)[0]
+                directory = Path(parent) / os.fsdecode(name)
+                for kind in kinds:
+                    for sub in _walk(directory):
+                        self._add(kind, sub)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._kinds.clear()
+        self._paths.clear()
+        self._roots.clear()
+
+
+class Watcher:
+    """Background thread publishing filesystem changes to the caches."""
+
+    def __init__(
+        self,
+        targets: Dict[str, Path] | None = None,
+        mode: str = "auto",
+        interval: float | None = None,
+    ) -> None:
+        if mode not in _MODES - {"off"}:
+            raise ValueError(f"unsupported watch mode {mode!r}")
+        self._targets = dict(targets) if targets is not None else watch_targets()
+        self._mode = mode
+        self._interval = interval if interval is not None else watch_interval()
+        self._backend: _Poller | _Inotify | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._wakeup: Tuple[int, int] | None = None
+
+    @property
+    def backend(self) -> str | None:
+        return self._backend.name if self._backend is not None else None
+
+    def _make_backend(self) -> _Poller | _Inotify:
+        if self._mode != "poll":
+            libc = _load_libc()
+            if libc is not None:
+                backend = _Inotify(self._targets, libc)
+                try:
+                    backend.arm()
+                    return backend
+                except OSError as exc:
+                    backend.close()
+                    if self._mode == "inotify":
+                        raise RuntimeError(f"inotify unavailable: {exc}") from exc
+            elif self._mode == "inotify":
+                raise RuntimeError("inotify unavailable")
+        backend = _Poller(self._targets)
+        backend.arm()
+        return backend
+
+    def start(self) -> "Watcher":
+        if self._thread is not None:
+            return self
+        self._backend = self._make_backend()
+        self._wakeup = os.pipe()
+        self._stop.clear()
+        # Anything cached before the watches existed is re-checked once.
+        publish(self._targets)
+        core.set_watching(True)
+        self._thread = threading.Thread(target=self._run, name="mcp-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        backend = self._backend
+        wakeup = self._wakeup
+        assert backend is not None and wakeup is not None
+        try:
+            while not self._stop.is_set():
+                changed = backend.poll(self._interval, wakeup[0])
+                if changed and not self._stop.is_set():
+                    publish(changed)
+        except Exception:
+            logging.exception("mcp:error reason=watch_failed backend=%s", backend.name)
+        finally:
+            # Without a watcher the caches must go back to checking files.
+            core.set_watching(False)
+            publish(self._targets)
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        wakeup = self._wakeup
+        if wakeup is not None:
+            with contextlib.suppress(OSError):
+                os.write(wakeup[1], b"\0")
+        thread.join()
+        if self._backend is not None:
+            self._backend.close()
+        if wakeup is not None:
+            for fd in wakeup:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+            self._wakeup = None
+
+    def __enter__(self) -> "Watcher":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+
+def start_watcher() -> Watcher | None:
+    """Start a watcher as configured by ``MCP_WATCH``; ``None`` when disabled."""
+    mode = watch_mode()
+    if mode == "off":
+        return None
+    return Watcher(mode=mode).start()
+
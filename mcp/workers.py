@@ -0,0 +1,134 @@
+"""Process pool used by ``validate_many`` to fan batches out across cores."""
+
+from __future__ import annotations
+
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple
+
+# Settings a worker must share with the parent to resolve the same schemas.
+_CONFIG_ENV = (
+    "SYN_SCHEMAS_DIR",
+    "LABS_SCHEMA_BASE",
+    "LABS_SCHEMA_VERSION",
+    "LABS_SCHEMA_CACHE_DIR",
+    "MCP_SCHEMA_BUNDLE",
+    "MCP_REMOTE_SCHEMA_TTL",
+    "MCP_VALIDATOR_ENGINE",
+    "MCP_VALIDATOR_CACHE_SIZE",
+)
+
+
+def _config() -> Tuple[Any, ...]:
+    return (os.getcwd(),) + tuple(os.environ.get(key) for key in _CONFIG_ENV)
+
+
+def _warm_worker(config: Tuple[Any, ...]) -> None:
+    cwd, *values = config
+    os.chdir(cwd)
+    for key, value in zip(_CONFIG_ENV, values):
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+    # Workers never fan out again.
+    os.environ["MCP_VALIDATE_WORKERS"] = "0"
+
+    from .bundle import load_configured_bundle
+    from .validate import prewarm_validators
+
+    load_configured_bundle()
+    prewarm_validators()
+
+
+def _validate_chunk(
+    assets: List[Any], size_hint: int | None = None
+) -> Tuple[List[Dict[str, Any]], float]:
+    from .validate import validate_group
+
+    started = time.perf_counter()
+    entries = validate_group(assets, size_hint)
+    return entries, time.perf_counter() - started
+
+
+class _WorkerPool:
+    """Lazily created process pool, rebuilt when its size or config changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._key: Tuple[Any, ...] | None = None
+
+    def get(self, workers: int) -> ProcessPoolExecutor:
+        config = _config()
+        key = (workers,) + config
+        with self._lock:
+            if self._executor is not None and self._key == key:
+                return self._executor
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            # spawn: the servers are multi-threaded, so forking is unsafe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+                initargs=(config,),
+            )
+            self._key = key
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor, self._key = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_POOL = _WorkerPool()
+atexit.register(_POOL.shutdown)
+
+
+def shutdown_worker_pool() -> None:
+    _POOL.shutdown()
+
+
+def map_batch(
+    assets: List[Any],
+    groups: Dict[Any, List[int]],
+    workers: int,
+    size_hint: int | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[Any, float]]:
+    """Validate ``assets`` on the worker pool and scatter results back in order.
+
+    Chunks never mix ``$schema`` groups, so each worker resolves one validator
+    per chunk. Returns the ordered entries and the summed time per group.
+    """
+    executor = _POOL.get(workers)
+    # A few chunks per worker keeps pickling overhead low while balancing load.
+    size = max(1, math.ceil(len(assets) / (workers * 4)))
+    chunks: List[Tuple[Any, List[int]]] = []
+    for marker, indices in groups.items():
+        for start in range(0, len(indices), size):
+            chunks.append((marker, indices[start : start + size]))
+    payloads = [[assets[index] for index in indices] for _, indices in chunks]
+    try:
+        outputs = list(
+            executor.map(_validate_chunk, payloads, [size_hint] * len(payloads))
+        )
+    except BrokenProcessPool:
+        _POOL.shutdown()
+        raise
+
+    results: List[Dict[str, Any]] = [{} for _ in assets]
+    elapsed: Dict[Any, float] = {}
+    for (marker, indices), (entries, seconds) in zip(chunks, outputs):
+        elapsed[marker] = elapsed.get(marker, 0.0) + seconds
+        for index, entry in zip(indices, entries):
+            results[index] = entry
+    return results, elapsed
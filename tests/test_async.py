@@ -0,0 +1,184 @@
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from mcp.async_main import AsyncSocketServer, AsyncTCPServer, _AsyncServer
+from mcp.stdio_main import dispatch
+from mcp.transport import process_line
+from mcp.validate import MAX_BYTES
+
+
+def _start(server):
+    try:
+        server.start()
+    except PermissionError as exc:  # pragma: no cover - sandbox limitation
+        pytest.skip(f"sockets unavailable: {exc}")
+    thread = threading.Thread(target=server.serve_forever, args=(dispatch,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _request(sock, payload) -> dict:
+    sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data.decode("utf-8"))
+
+
+def test_async_tcp_matches_process_line_frames():
+    server = AsyncTCPServer("127.0.0.1", 0)
+    thread = _start(server)
+    host, port = server.address
+    try:
+        with socket.create_connection((host, port), timeout=5) as conn:
+            request = {"jsonrpc": "2.0", "id": 1, "method": "list_schemas", "params": {}}
+            expected = json.loads(process_line(json.dumps(request), dispatch))
+            assert _request(conn, request) == expected
+
+            conn.sendall(b"\n{not json}\n")
+            malformed = json.loads(conn.recv(65536).decode("utf-8"))
+            assert malformed["error"]["code"] == -32603
+
+            blob = {"jsonrpc": "2.0", "id": 2, "method": "validate_asset",
+                    "params": {"blob": "x" * (MAX_BYTES + 1)}}
+            too_large = _request(conn, blob)
+            assert too_large["id"] is None
+            assert too_large["result"]["errors"] == [{"path": "", "msg": "payload_too_large"}]
+    finally:
+        server.close()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_async_tcp_serves_many_concurrent_connections():
+    server = AsyncTCPServer("127.0.0.1", 0)
+    thread = _start(server)
+    host, port = server.address
+    clients = []
+    try:
+        for _ in range(200):
+            clients.append(socket.create_connection((host, port), timeout=5))
+        for index, conn in enumerate(clients):
+            conn.sendall(
+                (json.dumps({"jsonrpc": "2.0", "id": index, "method": "get_schema",
+                             "params": {"name": "missing"}}) + "\n").encode("utf-8")
+            )
+        for index, conn in enumerate(clients):
+            response = json.loads(conn.makefile("rb").readline())
+            assert response["id"] == index
+            assert response["result"]["reason"] == "not_found"
+    finally:
+        for conn in clients:
+            conn.close()
+        server.close()
+        thread.join(timeout=5)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets unavailable")
+def test_async_socket_round_trip_and_cleanup(tmp_path):
+    path = tmp_path / "mcp.sock"
+    server = AsyncSocketServer(path, 0o600)
+    thread = _start(server)
+    assert (path.stat().st_mode & 0o777) == 0o600
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(path))
+            conn.settimeout(5)
+            response = _request(conn, {"jsonrpc": "2.0", "id": 7, "method": "nope"})
+            assert response["result"]["reason"] == "unsupported"
+    finally:
+        server.close()
+        thread.join(timeout=5)
+    assert not path.exists()
+
+
+def test_tcp_async_mode_entrypoint(tmp_path):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    schemas_dir = tmp_path / "schemas"
+    schemas_dir.mkdir()
+    env = os.environ.copy()
+    env.update(
+        {
+            "PYTHONUNBUFFERED": "1",
+            "SYN_SCHEMAS_DIR": str(schemas_dir),
+            "MCP_MODE": "tcp-async",
+            "MCP_HOST": "127.0.0.1",
+            "MCP_PORT": str(port),
+            "MCP_READY_FILE": str(tmp_path / "mcp.ready"),
+        }
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mcp"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    try:
+        assert proc.stderr is not None
+        ready = proc.stderr.readline()
+        assert "mcp:ready" in ready and "mode=tcp-async" in ready
+        deadline = time.time() + 5
+        while not (tmp_path / "mcp.ready").exists() and time.time() < deadline:
+            time.sleep(0.05)
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+            response = _request(conn, {"jsonrpc": "2.0", "id": 3, "method": "list_schemas"})
+            assert response["id"] == 3
+            assert response["result"]["ok"] is True
+        proc.terminate()
+        proc.wait(timeout=10)
+        assert "mcp:shutdown" in proc.stderr.read()
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            with contextlib.suppress(subprocess.TimeoutExpired):
+                proc.wait(timeout=5)
+    assert not (tmp_path / "mcp.ready").exists()
+
+
+def test_async_pipelined_out_of_order(monkeypatch):
+    monkeypatch.setenv("MCP_PIPELINE", "1")
+    release = threading.Event()
+
+    def handler(method, params):
+        if method == "slow":
+            release.wait(timeout=5)
+        return {"ok": True}
+
+    server = AsyncTCPServer("127.0.0.1", 0)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, args=(handler,), daemon=True)
+    thread.start()
+    try:
+        with socket.create_connection(server.address, timeout=5) as conn:
+            for rid, method in ((1, "slow"), (2, "fast")):
+                conn.sendall((json.dumps({"jsonrpc": "2.0", "id": rid, "method": method}) + "\n").encode())
+            reader = conn.makefile("rb")
+            assert json.loads(reader.readline())["id"] == 2
+            release.set()
+            assert json.loads(reader.readline())["id"] == 1
+    finally:
+        server.close()
+        thread.join(timeout=5)
+
+
+def test_async_server_subclasses_must_bind_and_listen():
+    class BindOnly(_AsyncServer):
+        def _bind(self):
+            return socket.socket()
+
+    with pytest.raises(TypeError, match="_listen"):
+        BindOnly()
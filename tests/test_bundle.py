@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import mcp.remote as remote
+import mcp.validate as validate
+from mcp.bundle import (
+    build_bundle,
+    install_bundle,
+    read_bundle,
+    uninstall_bundle,
+    write_bundle,
+)
+from mcp.core import get_schema, invalidate_schema_catalog, list_schemas
+
+PREFIX = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/"
+
+
+@pytest.fixture
+def trees(tmp_path, monkeypatch):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "asset.schema.json").write_text(json.dumps({
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "version": "0.7.3",
+        "type": "object",
+        "properties": {"id": {"$ref": "https://schemas.synesthetic.dev/0.7.3/id.json"}},
+        "required": ["id"],
+    }))
+    registry = tmp_path / "registry"
+    (registry / "schemas").mkdir(parents=True)
+    (registry / "version.json").write_text(json.dumps({"schemaVersion": "0.7.3"}))
+    (registry / "schemas" / "id.json").write_text(json.dumps({
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "string",
+        "minLength": 3,
+    }))
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "control.schema.json").write_text(json.dumps({"type": "object", "required": ["x"]}))
+
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas))
+    monkeypatch.setenv("LABS_SCHEMA_CACHE_DIR", str(cache))
+    monkeypatch.setattr(validate, "_REGISTRY_BASE_DIR", registry)
+    invalidate_schema_catalog()
+    validate.invalidate_local_registry()
+    validate.invalidate_validator_cache()
+    yield tmp_path
+    uninstall_bundle()
+
+
+def test_bundle_serves_schemas_without_the_trees(trees, monkeypatch):
+    bundle = build_bundle()
+    assert [record["name"] for record in bundle["schemas"]] == ["asset"]
+    assert bundle["aliases"] == validate._SCHEMA_ALIASES
+    assert build_bundle()["fingerprint"] == bundle["fingerprint"]
+    expected = list_schemas()
+    assert validate.validate_asset({"$schema": f"{PREFIX}asset.schema.json", "id": "ab"})["ok"] is False
+
+    path = trees / "out" / "bundle.json"
+    summary = write_bundle(path)
+    assert summary["schemas"] == 1 and summary["remote"] == 1
+    for name in ("schemas", "registry", "cache"):
+        shutil.rmtree(trees / name)
+
+    def offline(*_args, **_kwargs):
+        raise AssertionError("network access")
+
+    monkeypatch.setattr(remote._CLIENT, "get", offline)
+    install_bundle(read_bundle(path))
+    assert list_schemas() == expected
+    assert get_schema("asset")["version"] == "0.7.3"
+    assert validate.validate_asset({"$schema": f"{PREFIX}asset.schema.json", "id": "abc"})["ok"] is True
+    assert validate.validate_asset({"$schema": f"{PREFIX}asset.schema.json", "id": "ab"})["ok"] is False
+    assert validate.validate_asset({"$schema": f"{PREFIX}control.schema.json", "x": 1})["ok"] is True
+
+
+def test_read_bundle_rejects_mismatched_version_or_base(trees, monkeypatch):
+    path = trees / "bundle.json"
+    write_bundle(path)
+    monkeypatch.setenv("LABS_SCHEMA_VERSION", "0.8.0")
+    with pytest.raises(RuntimeError):
+        read_bundle(path)
+    monkeypatch.delenv("LABS_SCHEMA_VERSION")
+    monkeypatch.setenv("LABS_SCHEMA_BASE", "https://mirror.example.com/schema/")
+    with pytest.raises(RuntimeError, match="LABS_SCHEMA_BASE"):
+        read_bundle(path)
+    monkeypatch.delenv("LABS_SCHEMA_BASE")
+    assert read_bundle(path)["schemas_base"] == PREFIX.rsplit("0.7.3/", 1)[0]
+    (trees / "other.json").write_text("{}")
+    with pytest.raises(RuntimeError):
+        read_bundle(trees / "other.json")
+
+
+def test_build_bundle_cli(tmp_path):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "asset.schema.json").write_text(json.dumps({"type": "object"}))
+    env = os.environ.copy()
+    env.update({"SYN_SCHEMAS_DIR": str(schemas), "LABS_SCHEMA_CACHE_DIR": ""})
+    out = tmp_path / "bundle.json"
+    proc = subprocess.run(
+        [sys.executable, "-m", "mcp", "--build-bundle", str(out)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert proc.returncode == 0, proc.stderr
+    summary = json.loads(proc.stdout)
+    assert summary["ok"] is True and summary["schemas"] == 1
+    assert json.loads(out.read_text())["fingerprint"] == summary["fingerprint"]
+
+
+def test_uninstall_restores_schema_aliases(trees):
+    before = dict(validate._SCHEMA_ALIASES)
+    bundle = build_bundle()
+    bundle["aliases"] = {"urn:first": "asset"}
+    install_bundle(bundle)
+    bundle["aliases"] = {"urn:second": "asset"}
+    install_bundle(bundle)
+    assert "urn:first" not in validate._SCHEMA_ALIASES
+    assert validate._SCHEMA_ALIASES["urn:second"] == "asset"
+    uninstall_bundle()
+    assert validate._SCHEMA_ALIASES == before
@@ -0,0 +1,229 @@
+import json
+import os
+
+from mcp import codec
+from mcp.core import (
+    catalog_stats,
+    get_schema,
+    invalidate_schema_catalog,
+    list_schemas,
+)
+
+
+def _write(path, version):
+    path.write_text(json.dumps({"$id": f"urn:{path.name}", "version": version, "type": "object"}))
+    # Push mtimes out of the racy window so the index trusts them.
+    old = 1_600_000_000_000_000_000
+    os.utime(path, ns=(old, old + len(version)))
+    os.utime(path.parent, ns=(old, old))
+
+
+def test_catalog_serves_repeat_calls_from_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path))
+    _write(tmp_path / "asset.schema.json", "1")
+    _write(tmp_path / "control.schema.json", "2")
+    invalidate_schema_catalog()
+
+    first = list_schemas()
+    reads = catalog_stats()["reads"]
+    assert [s["name"] for s in first["schemas"]] == ["asset", "control"]
+    assert first["schemas"][0]["path"] == str(tmp_path / "asset.json")
+    for _ in range(3):
+        assert list_schemas() == first
+        assert get_schema("asset")["version"] == "1"
+    assert catalog_stats()["reads"] == reads
+
+
+def test_catalog_refreshes_changed_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path))
+    _write(tmp_path / "asset.schema.json", "1")
+    invalidate_schema_catalog()
+    assert get_schema("asset")["version"] == "1"
+    reads = catalog_stats()["reads"]
+
+    _write(tmp_path / "asset.schema.json", "22")
+    assert get_schema("asset")["version"] == "22"
+    assert catalog_stats()["reads"] == reads + 1
+
+    (tmp_path / "extra.schema.json").write_text(json.dumps({"version": "3"}))
+    assert [s["name"] for s in list_schemas()["schemas"]] == ["asset", "extra"]
+
+    (tmp_path / "asset.schema.json").unlink()
+    assert [s["name"] for s in list_schemas()["schemas"]] == ["extra"]
+    assert get_schema("asset") == {"ok": False, "reason": "not_found"}
+
+
+def test_get_schema_hands_out_copies(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path))
+    _write(tmp_path / "asset.schema.json", "1")
+    invalidate_schema_catalog()
+
+    schema = get_schema("asset")["schema"]
+    schema["type"] = "array"
+    schema.setdefault("required", []).append("x")
+    assert get_schema("asset")["schema"] == {
+        "$id": "urn:asset.schema.json",
+        "version": "1",
+        "type": "object",
+    }
+
+
+def test_catalog_keeps_path_checks(tmp_path, monkeypatch):
+    root = tmp_path / "schemas"
+    (root / "nested").mkdir(parents=True)
+    outside = tmp_path / "secret.schema.json"
+    outside.write_text(json.dumps({"version": "x"}))
+    (root / "leak.schema.json").symlink_to(outside)
+    (root / "nested" / "inner.schema.json").write_text(json.dumps({"version": "n"}))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(root))
+    invalidate_schema_catalog()
+
+    leaked = get_schema("leak")
+    assert leaked["ok"] is False
+    assert leaked["errors"] == [{"path": "/name", "msg": "invalid_path"}]
+    assert get_schema("nested/inner")["version"] == "n"
+    assert get_schema("../secret")["reason"] == "validation_failed"
+
+
+def _seed_examples(root, names):
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}")
+
+
+def test_list_examples_paginates_with_stable_cursors(tmp_path, monkeypatch):
+    from mcp.core import list_examples
+
+    monkeypatch.setenv("SYN_EXAMPLES_DIR", str(tmp_path))
+    _seed_examples(tmp_path, ["b.json", "a.one.json", "nested/a.two.json", "c.json", "skip.txt"])
+
+    full = list_examples()
+    assert "next_cursor" not in full
+    keys = [(e["component"], e["path"]) for e in full["examples"]]
+    assert keys == sorted(keys) and len(keys) == 4
+
+    pages, cursor = [], None
+    while True:
+        page = list_examples(limit=3, cursor=cursor)
+        pages.extend(page["examples"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == full["examples"]
+
+    first = list_examples("a", limit=1)
+    assert first["examples"] == [{"component": "a", "path": str(tmp_path / "a.one.json")}]
+    # Adding a file ahead of the cursor does not shift the next page.
+    _seed_examples(tmp_path, ["a.0.json"])
+    second = list_examples("a", limit=5, cursor=first["next_cursor"])
+    assert second["examples"] == [{"component": "a", "path": str(tmp_path / "nested" / "a.two.json")}]
+    assert second["next_cursor"] is None
+
+
+def test_list_examples_rejects_bad_paging_params(tmp_path, monkeypatch):
+    from mcp.core import list_examples
+
+    monkeypatch.setenv("SYN_EXAMPLES_DIR", str(tmp_path))
+    assert list_examples(limit=0)["errors"][0]["path"] == "/limit"
+    assert list_examples(limit="5")["errors"][0]["path"] == "/limit"
+    assert list_examples(cursor="%%%")["errors"] == [{"path": "/cursor", "msg": "invalid_cursor"}]
+
+
+CANONICAL_ASSET_SCHEMA = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/asset.schema.json"
+
+
+def _example_setup(tmp_path, monkeypatch, min_length=1):
+    import mcp.validate as validate
+
+    schemas = tmp_path / "schemas"
+    schemas.mkdir(exist_ok=True)
+    schema = schemas / "asset.schema.json"
+    schema.write_text(json.dumps({
+        "type": "object",
+        "properties": {"id": {"type": "string", "minLength": min_length}},
+        "required": ["id"],
+    }))
+    old = 1_600_000_000_000_000_000
+    os.utime(schema, ns=(old, old + min_length))
+    examples = tmp_path / "examples"
+    examples.mkdir(exist_ok=True)
+    example = examples / "asset.basic.json"
+    example.write_text(json.dumps({"$schema": CANONICAL_ASSET_SCHEMA, "id": "abc"}))
+    os.utime(example, ns=(old, old))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas))
+    monkeypatch.setenv("SYN_EXAMPLES_DIR", str(examples))
+
+    calls = []
+    original = validate.validate_asset
+
+    def counting(asset, *args, **kwargs):
+        calls.append(asset)
+        return original(asset, *args, **kwargs)
+
+    monkeypatch.setattr(validate, "validate_asset", counting)
+    return schema, example, calls
+
+
+def test_get_example_served_from_cache(tmp_path, monkeypatch):
+    from mcp.core import example_cache_stats, get_example, invalidate_example_cache
+
+    _, example, calls = _example_setup(tmp_path, monkeypatch)
+    invalidate_example_cache()
+
+    first = get_example(example.name)
+    assert first["ok"] is True and first["schema"] == "asset"
+    for _ in range(3):
+        assert get_example(example.name) == first
+    assert len(calls) == 1
+    assert example_cache_stats()["hits"] == 3
+
+
+def test_get_example_cache_tracks_file_and_schema_edits(tmp_path, monkeypatch):
+    from mcp.core import get_example, invalidate_example_cache
+
+    _, example, calls = _example_setup(tmp_path, monkeypatch)
+    invalidate_example_cache()
+    assert get_example(example.name)["example"]["id"] == "abc"
+
+    example.write_text(json.dumps({"$schema": CANONICAL_ASSET_SCHEMA, "id": "abcdef"}))
+    old = 1_600_000_000_000_000_000
+    os.utime(example, ns=(old, old + 1))
+    assert get_example(example.name)["example"]["id"] == "abcdef"
+    assert len(calls) == 2
+
+    # Tightening the schema changes its fingerprint, so the verdict is recomputed.
+    _example_setup(tmp_path, monkeypatch, min_length=10)
+    example.write_text(json.dumps({"$schema": CANONICAL_ASSET_SCHEMA, "id": "abcdef"}))
+    os.utime(example, ns=(old, old + 1))
+    assert get_example(example.name)["ok"] is False
+
+
+def test_get_example_cache_can_be_disabled(tmp_path, monkeypatch):
+    from mcp.core import example_cache_stats, get_example, invalidate_example_cache
+
+    _, example, calls = _example_setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("MCP_EXAMPLE_CACHE_BYTES", "0")
+    invalidate_example_cache()
+    get_example(example.name)
+    get_example(example.name)
+    assert len(calls) == 2
+    assert example_cache_stats()["size"] == 0
+
+
+def test_get_example_cache_hands_out_private_copies(tmp_path, monkeypatch):
+    from mcp.core import get_example, invalidate_example_cache
+
+    _, example, _ = _example_setup(tmp_path, monkeypatch)
+    invalidate_example_cache()
+    get_example(example.name)["example"]["id"] = "mutated"
+    hit = get_example(example.name)
+    assert hit["example"]["id"] == "abc"
+    hit["example"]["id"] = "mutated"
+
+    # Hits copy the decoded example instead of parsing the file again.
+    def no_decode(*args, **kwargs):
+        raise AssertionError("cache hit decoded the example")
+
+    monkeypatch.setattr(codec, "loads", no_decode)
+    assert get_example(example.name)["example"]["id"] == "abc"
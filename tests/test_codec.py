@@ -0,0 +1,77 @@
+import json
+import math
+
+import pytest
+
+from mcp import codec
+from mcp.transport import process_frame
+
+CODECS = ["json", pytest.param("orjson", marks=pytest.mark.skipif(codec.orjson is None, reason="orjson not installed"))]
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_round_trip_and_fallbacks(monkeypatch, name):
+    monkeypatch.setenv("MCP_JSON_CODEC", name)
+    value = {"s": "é ☃", "n": [1, 2.5, True, None], "big": 2**70, 1: "int key"}
+    encoded = codec.dumps(value, newline=True)
+    assert encoded.endswith(b"\n")
+    assert json.loads(encoded) == {"s": "é ☃", "n": [1, 2.5, True, None], "big": 2**70, "1": "int key"}
+
+    assert math.isnan(codec.loads(b'{"x": NaN}')["x"])
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        codec.loads("not json")
+    assert str(excinfo.value) == "Expecting value: line 1 column 1 (char 0)"
+    with pytest.raises(UnicodeDecodeError):
+        codec.loads(b'{"x": "\xff"}')
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_keeps_numbers_exact(monkeypatch, name):
+    monkeypatch.setenv("MCP_JSON_CODEC", name)
+    for text in ("123456789012345678901234567890", "-9223372036854775809", "18446744073709551616"):
+        value = codec.loads(f'{{"n": {text}}}'.encode())["n"]
+        assert value == int(text) and isinstance(value, int)
+    floats = [1e16, 1.5e-07, 0.1, -2.5, 1e300, 5e-324]
+    assert codec.loads(codec.dumps(floats)) == floats
+    assert codec.loads(codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_default_codec_emits_stdlib_bytes(monkeypatch):
+    monkeypatch.delenv("MCP_JSON_CODEC", raising=False)
+    value = {"s": "é ☃", "f": [1e16, 1.5e-07, 2.5], "big": 2**70, "b": True}
+    assert codec.dumps(value) == json.dumps(value).encode("ascii")
+    assert codec.dumps(value, newline=True, sort_keys=True) == (json.dumps(value, sort_keys=True) + "\n").encode()
+
+
+def test_diff_sees_big_integers(monkeypatch):
+    from mcp.diff import diff_assets
+    from mcp.stdio_main import dispatch
+    from mcp.transport import process_line
+
+    params = {"base": {"n": 2**70}, "new": {"n": 2**70 + 1}}
+    expected = [{"op": "replace", "path": "/n", "value": 2**70 + 1}]
+    assert diff_assets(**params)["patch"] == expected
+    request = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "diff_assets", "params": params})
+    for name in ("json", "orjson") if codec.orjson is not None else ("json",):
+        monkeypatch.setenv("MCP_JSON_CODEC", name)
+        assert json.loads(process_line(request, dispatch))["result"]["patch"] == expected
+
+
+def test_process_frame_returns_wire_bytes(monkeypatch):
+    monkeypatch.delenv("MCP_JSON_CODEC", raising=False)
+    handler = lambda method, params: {"ok": True, "method": method}  # noqa: E731
+    frame = process_frame(b'  {"jsonrpc": "2.0", "id": 1, "method": "m"}\r', handler)
+    assert frame == b'{"jsonrpc": "2.0", "id": 1, "result": {"ok": true, "method": "m"}}\n'
+    if codec.orjson is not None:
+        monkeypatch.setenv("MCP_JSON_CODEC", "orjson")
+        frame = process_frame(b'{"jsonrpc": "2.0", "id": 1, "method": "m"}', handler)
+        assert frame == b'{"jsonrpc":"2.0","id":1,"result":{"ok":true,"method":"m"}}\n'
+    assert process_frame(b"   ", handler) is None
+    bad = json.loads(process_frame(b"\xff\xfe", handler))
+    assert bad["error"]["message"].startswith("decode_error:")
+
+
+def test_codec_rejects_unknown_name(monkeypatch):
+    monkeypatch.setenv("MCP_JSON_CODEC", "simdjson")
+    with pytest.raises(RuntimeError):
+        codec.dumps({})
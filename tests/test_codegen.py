@@ -0,0 +1,208 @@
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from mcp.codegen import compile_validator
+from mcp.validate import invalidate_validator_cache, validate_asset, validate_many
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+GOLDEN_PATH = FIXTURES / "golden.jsonl"
+SUBMODULE_EXAMPLES = Path("libs/synesthetic-schemas/examples")
+
+KEYWORD_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.test/keywords.schema.json",
+    "type": "object",
+    "required": ["id", "kind"],
+    "minProperties": 2,
+    "maxProperties": 8,
+    "properties": {
+        "id": {"type": "string", "pattern": "^[a-z]{2,5}$"},
+        "kind": {"enum": ["shader", "tone", 3, None]},
+        "version": {"const": "1.0"},
+        "count": {"type": "integer", "minimum": 0, "exclusiveMaximum": 10},
+        "ratio": {"type": "number", "multipleOf": 0.25, "maximum": 2},
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1, "maxLength": 4},
+            "uniqueItems": True,
+            "maxItems": 3,
+        },
+        "pair": {
+            "type": "array",
+            "prefixItems": [{"type": "string"}, {"type": "number"}],
+            "items": False,
+        },
+        "nested": {"$ref": "#/$defs/node"},
+        "choice": {"oneOf": [{"type": "string"}, {"type": "integer", "minimum": 5}]},
+        "either": {"anyOf": [{"type": "null"}, {"type": "boolean"}]},
+        "negated": {"not": {"type": "string"}},
+        "controls": {
+            "type": "array",
+            "contains": {"const": "main"},
+            "minContains": 1,
+            "maxContains": 2,
+        },
+    },
+    "patternProperties": {"^x-": {"type": "string"}},
+    "additionalProperties": False,
+    "dependentRequired": {"count": ["ratio"]},
+    "if": {"properties": {"kind": {"const": "tone"}}},
+    "then": {"required": ["ratio"]},
+    "$defs": {
+        "node": {
+            "type": "object",
+            "properties": {"child": {"$ref": "#/$defs/node"}, "value": {"type": "integer"}},
+            "additionalProperties": False,
+        }
+    },
+}
+
+KEYWORD_INSTANCES = [
+    {"id": "ab", "kind": "shader"},
+    {"id": "ab"},
+    {"id": "A1", "kind": "shader"},
+    {"id": "ab", "kind": "unknown"},
+    {"id": "ab", "kind": 3, "version": "1.0"},
+    {"id": "ab", "kind": 3, "version": "2.0"},
+    {"id": "ab", "kind": True},
+    {"id": "ab", "kind": "shader", "count": 3, "ratio": 0.5},
+    {"id": "ab", "kind": "shader", "count": 3},
+    {"id": "ab", "kind": "shader", "count": 10, "ratio": 1},
+    {"id": "ab", "kind": "shader", "count": 2.0, "ratio": 1},
+    {"id": "ab", "kind": "shader", "count": True, "ratio": 1},
+    {"id": "ab", "kind": "shader", "ratio": 0.3},
+    {"id": "ab", "kind": "shader", "tags": ["a", "b"]},
+    {"id": "ab", "kind": "shader", "tags": ["a", "a"]},
+    {"id": "ab", "kind": "shader", "tags": ["", "toolong"]},
+    {"id": "ab", "kind": "shader", "tags": ["a", "b", "c", "d"]},
+    {"id": "ab", "kind": "shader", "pair": ["a", 1]},
+    {"id": "ab", "kind": "shader", "pair": ["a", 1, 2]},
+    {"id": "ab", "kind": "shader", "pair": [1]},
+    {"id": "ab", "kind": "shader", "nested": {"child": {"child": {"value": 1}}}},
+    {"id": "ab", "kind": "shader", "nested": {"child": {"child": {"value": "x"}}}},
+    {"id": "ab", "kind": "shader", "choice": "x"},
+    {"id": "ab", "kind": "shader", "choice": 7},
+    {"id": "ab", "kind": "shader", "choice": 2},
+    {"id": "ab", "kind": "shader", "either": None},
+    {"id": "ab", "kind": "shader", "either": 0},
+    {"id": "ab", "kind": "shader", "negated": 1},
+    {"id": "ab", "kind": "shader", "negated": "no"},
+    {"id": "ab", "kind": "shader", "controls": ["main", "aux"]},
+    {"id": "ab", "kind": "shader", "controls": ["aux"]},
+    {"id": "ab", "kind": "shader", "controls": ["main", "main", "main"]},
+    {"id": "ab", "kind": "shader", "x-note": "ok"},
+    {"id": "ab", "kind": "shader", "x-note": 1},
+    {"id": "ab", "kind": "shader", "extra": 1},
+    {"id": "ab", "kind": "tone"},
+    {"id": "ab", "kind": "tone", "ratio": 1.25},
+    [],
+    "not-an-object",
+]
+
+
+def _errors(validator, instance):
+    return sorted(
+        (list(err.absolute_path), err.message) for err in validator.iter_errors(instance)
+    )
+
+
+@pytest.mark.parametrize("instance", KEYWORD_INSTANCES)
+def test_compiled_predicate_matches_reference(instance):
+    reference = Draft202012Validator(KEYWORD_SCHEMA)
+    compiled = compile_validator(reference)
+
+    assert compiled.fallbacks == 0
+    assert compiled.is_valid(instance) == reference.is_valid(instance)
+    assert _errors(compiled, instance) == _errors(reference, instance)
+
+
+def test_uncompilable_keywords_fall_back_per_subschema():
+    schema = {
+        "type": "object",
+        "properties": {
+            "meta": {
+                "type": "object",
+                "properties": {"a": {"type": "string"}},
+                "unevaluatedProperties": False,
+            },
+            "id": {"type": "string"},
+        },
+    }
+    reference = Draft202012Validator(schema)
+    compiled = compile_validator(reference)
+
+    assert compiled.fallbacks == 1
+    for instance in (
+        {"id": "x", "meta": {"a": "b"}},
+        {"id": "x", "meta": {"a": "b", "c": 1}},
+        {"id": 1, "meta": {"a": "b"}},
+    ):
+        assert compiled.is_valid(instance) == reference.is_valid(instance)
+        assert _errors(compiled, instance) == _errors(reference, instance)
+
+
+def _golden_assets():
+    assets = []
+    for raw in GOLDEN_PATH.read_text().splitlines():
+        record = json.loads(raw)
+        request = record.get("request") or {}
+        params = request.get("params") or {}
+        if request.get("method") in {"validate", "validate_asset", "populate_backend"}:
+            assets.append(params["asset"])
+        if request.get("method") == "validate_many":
+            assets.extend(params["assets"])
+    for path in sorted((FIXTURES / "examples").glob("*.json")):
+        assets.append(json.loads(path.read_text()))
+    return assets
+
+
+def _mutations(asset):
+    yield asset
+    if isinstance(asset, dict):
+        yield {**asset, "id": "X"}
+        yield {**asset, "name": ""}
+        yield {**asset, "tags": ["a", "a"]}
+        yield {**asset, "unexpected": True}
+        yield {key: value for key, value in asset.items() if key != "name"}
+
+
+def _run_both(monkeypatch, runner):
+    results = {}
+    for engine in ("reference", "compiled"):
+        monkeypatch.setenv("MCP_VALIDATOR_ENGINE", engine)
+        invalidate_validator_cache()
+        results[engine] = runner()
+    return results
+
+
+def test_golden_fixture_parity(monkeypatch):
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(FIXTURES / "schemas"))
+    assets = [variant for asset in _golden_assets() for variant in _mutations(asset)]
+    assert assets
+
+    results = _run_both(monkeypatch, lambda: [validate_asset(a) for a in assets])
+    assert results["compiled"] == results["reference"]
+    assert any(not res["ok"] for res in results["reference"])
+    assert any(res["ok"] for res in results["reference"])
+
+    batches = _run_both(monkeypatch, lambda: validate_many(assets[:10]))
+    assert batches["compiled"] == batches["reference"]
+
+
+@pytest.mark.skipif(not SUBMODULE_EXAMPLES.is_dir(), reason="schemas submodule not initialised")
+def test_submodule_example_parity(monkeypatch):
+    assets = [
+        json.loads(path.read_text())
+        for path in sorted(SUBMODULE_EXAMPLES.glob("SynestheticAsset_*.json"))
+    ]
+    results = _run_both(monkeypatch, lambda: [validate_asset(a) for a in assets])
+    assert results["compiled"] == results["reference"]
+
+
+def test_invalid_engine_rejected(monkeypatch):
+    monkeypatch.setenv("MCP_VALIDATOR_ENGINE", "turbo")
+    with pytest.raises(RuntimeError):
+        validate_asset({"$schema": "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/asset.schema.json"})
@@ -1,4 +1,7 @@
+import pytest
+
 from mcp.diff import diff_assets
+from mcp.patch import patch_document
 
 
 def test_idempotent_diff():
@@ -18,3 +21,101 @@ def test_list_replacement_single_replace():
         {"op": "replace", "path": "/tags", "value": new["tags"]},
     ]
 
+
+def test_lcs_arrays_emit_element_ops_in_application_order():
+    base = {"tags": ["a", "b", "c"], "z": 1}
+    new = {"tags": ["a", "x", "c", "d"], "z": 2}
+    patch = diff_assets(base, new, arrays="lcs")["patch"]
+    assert patch == [
+        {"op": "replace", "path": "/tags/1", "value": "x"},
+        {"op": "add", "path": "/tags/3", "value": "d"},
+        {"op": "replace", "path": "/z", "value": 2},
+    ]
+    assert patch_document(base, patch) == new
+
+    base = {"xs": [1, 2, 3, 4, 5, 6]}
+    new = {"xs": [0, 1, 3, 4, 7, 6, 8]}
+    patch = diff_assets(base, new, arrays="lcs")["patch"]
+    assert patch_document(base, patch) == new
+    assert patch == diff_assets(base, new, arrays="lcs")["patch"]
+
+
+def test_lcs_recurses_into_changed_elements():
+    base = {"controls": [{"id": i, "value": i} for i in range(2000)]}
+    new = {"controls": [dict(c) for c in base["controls"]]}
+    new["controls"][1234]["value"] = -1
+    patch = diff_assets(base, new, arrays="lcs")["patch"]
+    assert patch == [{"op": "replace", "path": "/controls/1234/value", "value": -1}]
+
+
+def test_lcs_falls_back_to_whole_replace(monkeypatch):
+    base = {"xs": list(range(10))}
+    new = {"xs": list(range(10, 20))}
+    patch = diff_assets(base, new, arrays="lcs", array_max=5)["patch"]
+    assert patch == [{"op": "replace", "path": "/xs", "value": new["xs"]}]
+
+    monkeypatch.setenv("MCP_DIFF_ARRAYS", "lcs")
+    monkeypatch.setenv("MCP_DIFF_ARRAY_MAX", "4")
+    assert diff_assets({"xs": [1, 2, 3]}, {"xs": [1, 9, 3]})["patch"] == [
+        {"op": "replace", "path": "/xs/1", "value": 9}
+    ]
+    assert diff_assets(base, new)["patch"] == patch
+    assert diff_assets(base, new, arrays="bogus")["reason"] == "validation_failed"
+
+
+def test_lcs_budget_covers_the_whole_diff():
+    base = {f"k{i}": list(range(10)) for i in range(5)}
+    new = {f"k{i}": list(range(10, 20)) for i in range(5)}
+    patch = diff_assets(base, new, arrays="lcs", array_max=20)["patch"]
+    # The first array spends most of the budget; the rest are replaced whole.
+    assert [op["path"] for op in patch[10:]] == ["/k1", "/k2", "/k3", "/k4"]
+    assert all(op["path"].startswith("/k0/") for op in patch[:10])
+    assert patch_document(base, patch) == new
+
+
+def test_hashed_matching_gives_the_same_patch(monkeypatch):
+    def control(i):
+        return {"id": i, "params": {"gain": {"min": 0, "max": 1}}}
+
+    base = {"controls": [control(i) for i in range(50)], "meta": control(-1)}
+    new = {"controls": [control(i) for i in range(50) if i % 7], "meta": control(-1)}
+    new["controls"].insert(3, {"id": "new", "params": {}})
+    new["controls"][10]["params"] = {"gain": {"min": 0, "max": 2}}
+    expected = diff_assets(base, new, arrays="lcs")["patch"]
+    assert diff_assets(base, new, arrays="lcs", hashed=True)["patch"] == expected
+    assert patch_document(base, expected) == new
+
+    monkeypatch.setenv("MCP_DIFF_HASH", "1")
+    assert diff_assets(base, new, arrays="lcs")["patch"] == expected
+    monkeypatch.setenv("MCP_DIFF_HASH", "maybe")
+    with pytest.raises(RuntimeError):
+        diff_assets(base, new)
+
+
+def test_moves_relocate_subtrees(monkeypatch):
+    shader = {"code": "void main() { gl_FragColor = vec4(1.0); }", "uniforms": {"time": 0}}
+    control = {"id": 1, "label": "brightness", "range": {"min": 0, "max": 255}}
+    base = {"shader": shader, "controls": [control], "tags": {"a": 1}}
+    new = {
+        "render": {"shader": shader, "mode": "2d"},
+        "controls": [control, control],
+        "tags": {"b": 1},
+    }
+    patch = diff_assets(base, new, arrays="lcs", moves=True)["patch"]
+    assert patch == [
+        {"op": "copy", "from": "/controls/0", "path": "/controls/1"},
+        {"op": "add", "path": "/render", "value": {"mode": "2d"}},
+        {"op": "move", "from": "/shader", "path": "/render/shader"},
+        # Too small to be worth a move.
+        {"op": "remove", "path": "/tags/a"},
+        {"op": "add", "path": "/tags/b", "value": 1},
+    ]
+    assert patch_document(base, patch) == new
+
+    plain = diff_assets(base, new, arrays="lcs")["patch"]
+    assert all(op["op"] in ("add", "remove", "replace") for op in plain)
+    monkeypatch.setenv("MCP_DIFF_MOVES", "1")
+    assert diff_assets(base, new, arrays="lcs")["patch"] == patch
+    monkeypatch.setenv("MCP_DIFF_MOVES", "maybe")
+    with pytest.raises(RuntimeError):
+        diff_assets(base, new)
@@ -15,6 +15,7 @@ import pytest
 
 CANONICAL_PREFIX = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/"
 CANONICAL_ASSET_SCHEMA = f"{CANONICAL_PREFIX}asset.schema.json"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
 
 
 def _wait_for_line(stream: TextIO, proc: subprocess.Popen, needle: str, timeout: float = 10.0) -> str:
@@ -303,3 +304,65 @@ def _assert_iso_timestamp(line: str) -> None:
             break
     assert token, f"timestamp field missing in log: {line}"
     datetime.fromisoformat(token)
+
+
+def test_entrypoint_prewarm_before_ready():
+    # The fixture examples are matched to asset.schema.json by their $schema
+    # marker, not by file name.
+    env = os.environ.copy()
+    env.update(
+        {
+            "SYN_SCHEMAS_DIR": str(FIXTURES / "schemas"),
+            "SYN_EXAMPLES_DIR": str(FIXTURES / "examples"),
+            "PYTHONUNBUFFERED": "1",
+            "MCP_READY_FILE": "",
+            "MCP_MODE": "stdio",
+            "MCP_PREWARM": "1",
+        }
+    )
+    request = {"jsonrpc": "2.0", "id": 1, "method": "cache_stats"}
+    proc = subprocess.run(
+        [sys.executable, "-m", "mcp"],
+        input=json.dumps(request) + "\n",
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=30,
+    )
+    ready_line = next(line for line in proc.stderr.splitlines() if "mcp:ready" in line)
+    assert "prewarm_ms=" in ready_line
+    assert "prewarm_validators=1" in ready_line
+    assert "prewarm_examples=1" in ready_line
+    stats = json.loads(proc.stdout)["result"]
+    assert stats["validators"]["size"] >= 1
+    assert stats["example_cache"]["size"] == 1
+
+    env.pop("MCP_PREWARM")
+    proc = subprocess.run(
+        [sys.executable, "-m", "mcp"], input="", capture_output=True, text=True, env=env, timeout=30
+    )
+    assert "prewarm_ms" not in proc.stderr
+
+
+def test_cli_and_stdio_defer_heavy_imports(tmp_path):
+    schemas_dir = tmp_path / "schemas"
+    schemas_dir.mkdir()
+    (schemas_dir / "asset.schema.json").write_text(json.dumps({"type": "object"}))
+    asset = tmp_path / "asset.json"
+    asset.write_text(json.dumps({"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"}))
+    env = os.environ.copy()
+    env.update({"SYN_SCHEMAS_DIR": str(schemas_dir), "LABS_SCHEMA_CACHE_DIR": str(tmp_path / "cache")})
+    heavy = ("httpx", "asyncio", "mcp.async_main", "mcp.socket_main", "mcp.tcp_main", "mcp.watch")
+    cases = {
+        "import mcp.__main__, mcp.stdio_main": heavy + ("jsonschema", "referencing"),
+        f"import mcp.__main__ as m; m._run_validation({str(asset)!r})": heavy,
+    }
+    for code, forbidden in cases.items():
+        proc = subprocess.run(
+            [sys.executable, "-c", f"{code}\nimport sys; print(sorted(m for m in {forbidden!r} if m in sys.modules))"],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip().splitlines()[-1] == "[]", code
@@ -0,0 +1,155 @@
+import json
+import socket
+import threading
+
+from mcp.framing import FRAME_TOO_LARGE, FrameBuffer, read_frames, serve_connection
+
+
+def test_frame_buffer_splits_across_chunks():
+    frames = FrameBuffer()
+    stream = b'{"a": 1}\n\n  {"b": 2}  \n{"c"'
+    out = []
+    for index in range(len(stream)):
+        out.extend(frames.feed(stream[index : index + 1]))
+    assert out == [b'{"a": 1}', b"", b'  {"b": 2}  ']
+    assert frames.feed(b": 3}\n") == [b'{"c": 3}']
+
+
+def test_frame_buffer_rejects_oversize_before_newline():
+    frames = FrameBuffer(limit=16)
+    assert frames.feed(b"x" * 10) == []
+    assert frames.feed(b"x" * 10) == [FRAME_TOO_LARGE]
+    # The rest of the oversize line is dropped, the next one survives.
+    assert frames.feed(b"y" * 1000) == []
+    assert frames.feed(b"yy\nok\n") == [b"ok"]
+
+
+def test_frame_buffer_ignores_surrounding_whitespace_for_limit():
+    frames = FrameBuffer(limit=4)
+    assert frames.feed(b"    abcd    ") == []
+    assert frames.feed(b"\n") == [b"    abcd    "]
+
+
+def test_frame_buffer_bounds_whitespace_padding():
+    frames = FrameBuffer(limit=8)
+    assert frames.feed(b" " * 100) == []
+    assert frames.feed(b"ab") == []
+    # Blank padding is not buffered and trailing padding is capped at the limit.
+    assert len(frames._buffer) <= 8 + 2
+    assert frames.feed(b" " * 14) == [FRAME_TOO_LARGE]
+    assert frames.feed(b"  \n ok \n") == [b" ok "]
+
+
+def test_read_frames_small_recv_size():
+    left, right = socket.socketpair()
+    with left, right:
+        right.sendall(b"one\ntwo\nthree")
+        right.shutdown(socket.SHUT_WR)
+        assert list(read_frames(left, size=3)) == [b"one", b"two"]
+
+
+def test_serve_connection_answers_oversize_early():
+    left, right = socket.socketpair()
+    calls = []
+
+    def handler(method, params):
+        calls.append(method)
+        return {"ok": True}
+
+    thread = threading.Thread(target=serve_connection, args=(left, handler), daemon=True)
+    thread.start()
+    with left, right:
+        right.sendall(b"x" * (1024 * 1024 + 10))
+        reply = json.loads(right.makefile("rb").readline())
+        assert reply["result"]["errors"] == [{"path": "", "msg": "payload_too_large"}]
+        right.sendall(b"tail\n" + json.dumps({"jsonrpc": "2.0", "id": 1, "method": "m"}).encode() + b"\n")
+        reply = json.loads(right.makefile("rb").readline())
+        assert reply == {"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}
+        right.shutdown(socket.SHUT_WR)
+        thread.join(timeout=5)
+    assert calls == ["m"]
+
+
+def _pipelined_replies(conn, count):
+    reader = conn.makefile("rb")
+    return [json.loads(reader.readline())["id"] for _ in range(count)]
+
+
+def _slow_handler(release):
+    def handler(method, params):
+        if method == "slow":
+            release.wait(timeout=5)
+        return {"ok": True}
+
+    return handler
+
+
+def _send_slow_then_fast(conn):
+    for rid, method in ((1, "slow"), (2, "fast"), (3, "fast")):
+        conn.sendall(json.dumps({"jsonrpc": "2.0", "id": rid, "method": method}).encode() + b"\n")
+
+
+def test_pipelined_responses_do_not_wait_for_slow_frames(monkeypatch):
+    monkeypatch.setenv("MCP_PIPELINE", "1")
+    release = threading.Event()
+    left, right = socket.socketpair()
+    thread = threading.Thread(
+        target=serve_connection, args=(left, _slow_handler(release)), daemon=True
+    )
+    thread.start()
+    with left, right:
+        _send_slow_then_fast(right)
+        reader = right.makefile("rb")
+        first = [json.loads(reader.readline())["id"] for _ in range(2)]
+        release.set()
+        assert first == [2, 3]
+        assert json.loads(reader.readline())["id"] == 1
+        right.shutdown(socket.SHUT_WR)
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_pipeline_depth_one_keeps_order(monkeypatch):
+    monkeypatch.setenv("MCP_PIPELINE", "1")
+    monkeypatch.setenv("MCP_PIPELINE_DEPTH", "1")
+    release = threading.Event()
+    release.set()
+    left, right = socket.socketpair()
+    thread = threading.Thread(
+        target=serve_connection, args=(left, _slow_handler(release)), daemon=True
+    )
+    thread.start()
+    with left, right:
+        _send_slow_then_fast(right)
+        assert _pipelined_replies(right, 3) == [1, 2, 3]
+        right.shutdown(socket.SHUT_WR)
+        thread.join(timeout=5)
+
+
+def test_pipeline_resize_keeps_live_connections_working(monkeypatch):
+    monkeypatch.setenv("MCP_PIPELINE", "1")
+    monkeypatch.setenv("MCP_PIPELINE_WORKERS", "2")
+    release = threading.Event()
+    first, first_peer = socket.socketpair()
+    second, second_peer = socket.socketpair()
+    handler = _slow_handler(release)
+    threads = [threading.Thread(target=serve_connection, args=(first, handler), daemon=True)]
+    threads[0].start()
+    with first, first_peer, second, second_peer:
+        first_peer.sendall(b'{"jsonrpc": "2.0", "id": 1, "method": "slow"}\n')
+        reader = first_peer.makefile("rb")
+        # A connection opened with a new pool size must not strand the first.
+        monkeypatch.setenv("MCP_PIPELINE_WORKERS", "3")
+        threads.append(threading.Thread(target=serve_connection, args=(second, handler), daemon=True))
+        threads[1].start()
+        second_peer.sendall(b'{"jsonrpc": "2.0", "id": 9, "method": "fast"}\n')
+        assert _pipelined_replies(second_peer, 1) == [9]
+        first_peer.sendall(b'{"jsonrpc": "2.0", "id": 2, "method": "fast"}\n')
+        assert json.loads(reader.readline())["id"] == 2
+        release.set()
+        assert json.loads(reader.readline())["id"] == 1
+        for peer in (first_peer, second_peer):
+            peer.shutdown(socket.SHUT_WR)
+        for thread in threads:
+            thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
@@ -10,6 +10,8 @@ from pathlib import Path
 
 import pytest
 
+from mcp import codec
+
 GOLDEN_PATH = Path(__file__).resolve().parent / "fixtures" / "golden.jsonl"
 SCHEMAS_DIR = Path("tests/fixtures/schemas")
 EXAMPLES_DIR = Path("tests/fixtures/examples")
@@ -105,3 +107,26 @@ def test_golden_requests():
             proc.terminate()
             with contextlib.suppress(subprocess.TimeoutExpired):
                 proc.wait(timeout=5)
+
+
+def test_golden_frames_across_codecs(monkeypatch):
+    from mcp.stdio_main import dispatch
+    from mcp.transport import process_line
+
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(SCHEMAS_DIR))
+    monkeypatch.setenv("SYN_EXAMPLES_DIR", str(EXAMPLES_DIR))
+    monkeypatch.delenv("SYN_BACKEND_URL", raising=False)
+
+    for raw in GOLDEN_PATH.read_text().splitlines():
+        if not raw:
+            continue
+        record = json.loads(raw)
+        payload = record.get("raw_request") or json.dumps(record["request"])
+        monkeypatch.delenv("MCP_JSON_CODEC", raising=False)
+        frame = process_line(payload, dispatch)
+        # The default codec keeps the stdlib ``json.dumps`` bytes.
+        assert frame == json.dumps(json.loads(frame)), record["description"]
+        assert json.loads(frame) == record["response"]
+        if codec.orjson is not None:
+            monkeypatch.setenv("MCP_JSON_CODEC", "orjson")
+            assert json.loads(process_line(payload, dispatch)) == record["response"]
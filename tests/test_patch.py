@@ -0,0 +1,218 @@
+import copy
+import json
+
+from mcp.diff import diff_assets
+from mcp.patch import apply_patch, validate_patch
+from mcp.stdio_main import dispatch
+from mcp.validate import invalidate_result_cache, validate_asset
+
+CANONICAL_ASSET_SCHEMA = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/asset.schema.json"
+
+
+def _asset():
+    return {
+        "id": "a",
+        "controls": [{"id": i, "params": {"gain": i}} for i in range(100)],
+        "shader": {"code": "void main() {}", "uniforms": {"time": 0}},
+        "meta": {"tags": ["x", "y"]},
+    }
+
+
+def test_apply_patch_round_trips_diffs():
+    base = _asset()
+    new = copy.deepcopy(base)
+    new["controls"].insert(5, {"id": "new"})
+    del new["controls"][40]
+    new["controls"][70]["params"]["gain"] = -1
+    new["shader"]["uniforms"]["speed"] = 2
+    del new["meta"]
+    for arrays in ("replace", "lcs"):
+        patch = diff_assets(base, new, arrays=arrays)["patch"]
+        assert apply_patch(base, patch) == {"ok": True, "asset": new}
+
+
+def test_apply_patch_copies_only_the_written_path():
+    base = _asset()
+    snapshot = json.dumps(base)
+    patch = [
+        {"op": "replace", "path": "/controls/3/params/gain", "value": 9},
+        {"op": "add", "path": "/controls/3/params/bias", "value": 1},
+        {"op": "copy", "from": "/shader/uniforms", "path": "/uniforms"},
+        {"op": "add", "path": "/uniforms/extra", "value": True},
+        {"op": "move", "from": "/meta/tags", "path": "/tags"},
+        {"op": "test", "path": "/tags", "value": ["x", "y"]},
+    ]
+    result = apply_patch(base, patch)["asset"]
+    assert json.dumps(base) == snapshot
+    assert result["controls"][3]["params"] == {"gain": 9, "bias": 1}
+    assert result["uniforms"] == {"time": 0, "extra": True}
+    assert result["shader"]["uniforms"] == {"time": 0}
+    assert result["meta"] == {}
+    # Untouched subtrees are shared with the base rather than copied.
+    assert result["controls"][4] is base["controls"][4]
+    assert result["shader"] is base["shader"]
+    assert result["controls"] is not base["controls"]
+
+
+def test_apply_patch_root_is_the_empty_pointer():
+    assert apply_patch({"a": 1}, [{"op": "add", "path": "/", "value": 5}])["asset"] == {"a": 1, "": 5}
+    assert apply_patch({"a": 1}, [{"op": "replace", "path": "", "value": 5}])["asset"] == 5
+    for base, new in (({"": 1}, {"": 2}), ({"a": 1}, [1]), ({"": {"x": 1}}, {"": {"x": 2}, "y": 0})):
+        patch = diff_assets(base, new)["patch"]
+        assert apply_patch(base, patch)["asset"] == new
+    assert diff_assets({"": 1}, {"": 2})["patch"] == [{"op": "replace", "path": "/", "value": 2}]
+    assert diff_assets({"a": 1}, [1])["patch"] == [{"op": "replace", "path": "", "value": [1]}]
+
+
+def test_apply_patch_reports_the_failing_op():
+    base = _asset()
+    snapshot = json.dumps(base)
+    cases = [
+        ([{"op": "replace", "path": "/id", "value": "b"}, {"op": "remove", "path": "/missing"}], "/patch/1"),
+        ([{"op": "test", "path": "/id", "value": "b"}], "/patch/0"),
+        ([{"op": "add", "path": "/controls/01", "value": 1}], "/patch/0"),
+        ([{"op": "move", "from": "/shader", "path": "/shader/uniforms/x"}], "/patch/0"),
+        ([{"op": "frobnicate", "path": "/id"}], "/patch/0"),
+        ({"op": "add"}, "/patch"),
+    ]
+    for patch, where in cases:
+        result = apply_patch(base, patch)
+        assert result["ok"] is False and result["reason"] == "validation_failed"
+        assert result["errors"][0]["path"] == where
+    assert json.dumps(base) == snapshot
+
+
+def test_apply_patch_validates_the_result(tmp_path, monkeypatch):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "asset.schema.json").write_text(json.dumps({"type": "object", "required": ["id"]}))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas))
+    def base():
+        return {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"}
+
+    patch = [{"op": "remove", "path": "/id"}]
+    assert apply_patch(base(), patch)["ok"] is True
+    result = dispatch("apply_patch", {"base": base(), "patch": patch, "validate": True})
+    assert result["ok"] is False and result["reason"] == "validation_failed"
+    replace = [{"op": "replace", "path": "/id", "value": "b"}]
+    result = dispatch("apply_patch", {"base": base(), "patch": replace, "validate": True})
+    assert result == {"ok": True, "asset": {"$schema": CANONICAL_ASSET_SCHEMA, "id": "b"}}
+
+
+_CONTROLS_SCHEMA = {
+    "type": "object",
+    "required": ["id", "controls"],
+    "properties": {
+        "id": {"type": "string"},
+        "controls": {"type": "array", "maxItems": 4, "items": {"$ref": "#/$defs/control"}},
+    },
+    "$defs": {
+        "control": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer", "minimum": 0}, "gain": {"type": "number"}},
+            "additionalProperties": False,
+        }
+    },
+}
+
+
+def _schema_dir(tmp_path, monkeypatch, schema):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir(parents=True)
+    (schemas / "asset.schema.json").write_text(json.dumps(schema))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas))
+    invalidate_result_cache()
+
+
+def test_validate_patch_revalidates_touched_subtrees(tmp_path, monkeypatch):
+    _schema_dir(tmp_path, monkeypatch, _CONTROLS_SCHEMA)
+    base = {
+        "$schema": CANONICAL_ASSET_SCHEMA,
+        "id": "a",
+        "controls": [{"id": 0}, {"id": -1}, {"id": 2, "gain": "x"}],
+    }
+    assert validate_asset(base)["ok"] is False
+    patches = [
+        [{"op": "replace", "path": "/controls/1/id", "value": 1}],
+        [
+            {"op": "replace", "path": "/controls/2/gain", "value": 0.5},
+            {"op": "add", "path": "/controls/-", "value": {"id": 3, "mute": True}},
+        ],
+        [
+            {"op": "add", "path": "/controls/0", "value": {"id": 9}},
+            {"op": "add", "path": "/controls/0", "value": {"id": 8}},
+        ],
+        [{"op": "remove", "path": "/controls/0/id"}, {"op": "replace", "path": "/id", "value": 7}],
+    ]
+    for patch in patches:
+        result = validate_patch(base, patch)
+        assert result.pop("scope") == "local"
+        asset = apply_patch(base, patch)["asset"]
+        invalidate_result_cache()
+        assert result == validate_asset(asset)
+        validate_asset(base)
+
+
+def test_validate_patch_resolves_refs_under_nested_ids(tmp_path, monkeypatch):
+    schema = {
+        "properties": {
+            "a": {
+                "$id": "https://example.com/a",
+                "$defs": {"q": {"type": "integer"}},
+                "additionalProperties": {"$ref": "#/$defs/q"},
+            }
+        }
+    }
+    _schema_dir(tmp_path, monkeypatch, schema)
+    base = {"$schema": CANONICAL_ASSET_SCHEMA, "a": {"x": 1}}
+    patches = [
+        [{"op": "replace", "path": "/a", "value": {"x": "s"}}],
+        [{"op": "add", "path": "/a/y", "value": "s"}],
+        [{"op": "replace", "path": "/a/x", "value": 2}],
+    ]
+    for patch in patches:
+        validate_asset(base)
+        result = validate_patch(base, patch)
+        assert result.pop("scope") == "local"
+        invalidate_result_cache()
+        assert result == validate_asset(apply_patch(base, patch)["asset"])
+
+
+def test_validate_patch_falls_back_to_full_validation(tmp_path, monkeypatch):
+    _schema_dir(tmp_path, monkeypatch, _CONTROLS_SCHEMA)
+    base = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a", "controls": [{"id": 0}]}
+    patch = [{"op": "replace", "path": "/controls/0/id", "value": -1}]
+    # Nothing cached for ``base`` yet.
+    result = validate_patch(base, patch)
+    assert result["scope"] == "full" and result["errors"][0]["path"] == "/controls/0/id"
+    validate_asset(base)
+    assert validate_patch(base, patch)["scope"] == "local"
+    # Edits at the root revalidate everything.
+    assert validate_patch(base, [{"op": "add", "path": "/x", "value": 1}])["scope"] == "full"
+
+
+def test_validate_patch_needs_full_validation_for_subtree_keywords(tmp_path, monkeypatch):
+    schema = copy.deepcopy(_CONTROLS_SCHEMA)
+    schema["properties"]["controls"]["uniqueItems"] = True
+    _schema_dir(tmp_path, monkeypatch, schema)
+    base = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a", "controls": [{"id": 0}, {"id": 1}]}
+    validate_asset(base)
+    # The array itself is revalidated whole when an element is added ...
+    result = validate_patch(base, [{"op": "add", "path": "/controls/-", "value": {"id": 0}}])
+    assert result["scope"] == "local" and result["reason"] == "validation_failed"
+    # ... but an edit inside an element cannot be checked against its siblings.
+    result = validate_patch(base, [{"op": "replace", "path": "/controls/1/id", "value": 0}])
+    assert result["scope"] == "full" and result["errors"][0]["msg"].endswith("has non-unique elements")
+
+
+def test_validate_patch_over_stdio(tmp_path, monkeypatch):
+    _schema_dir(tmp_path, monkeypatch, _CONTROLS_SCHEMA)
+    base = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a", "controls": []}
+    dispatch("validate_asset", {"asset": base})
+    result = dispatch("validate_patch", {"base": base, "patch": [{"op": "add", "path": "/controls/-", "value": {"id": 1}}]})
+    assert result == {"ok": True, "errors": [], "scope": "local"}
+    result = dispatch("validate_patch", {"base": base, "patch": [{"op": "remove", "path": "/id"}]})
+    assert result["scope"] == "full" and result["errors"][0]["msg"] == "'id' is a required property"
+    result = dispatch("validate_patch", {"base": base, "patch": [{"op": "remove", "path": "/nope"}]})
+    assert result["errors"][0]["path"] == "/patch/0"
@@ -0,0 +1,111 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import mcp.remote as remote
+from mcp.validate import invalidate_validator_cache, validate_asset
+
+
+class _SchemaServer:
+    """Serves one schema with an ETag, counting requests."""
+
+    def __init__(self):
+        self.body = {"type": "object", "required": ["id"]}
+        self.requests = []
+        self.delay = threading.Event()
+        self.delay.set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.delay.wait(timeout=5)
+                server.requests.append(dict(self.headers))
+                payload = json.dumps(server.body).encode()
+                etag = f'"{len(payload)}-{hash(payload) & 0xffff}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *_args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.httpd.server_address[:2]
+        self.base = f"http://{host}:{port}/schema/"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    stub = _SchemaServer()
+    monkeypatch.setenv("LABS_SCHEMA_BASE", stub.base)
+    monkeypatch.setenv("LABS_SCHEMA_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    remote.invalidate_remote_schemas()
+    invalidate_validator_cache()
+    yield stub
+    stub.close()
+    remote.invalidate_remote_schemas()
+    remote.close_http_client()
+
+
+def _marker(stub):
+    return f"{stub.base}0.7.3/remote.schema.json"
+
+
+def test_concurrent_misses_share_one_fetch(server):
+    server.delay.clear()
+    marker = _marker(server)
+    with ThreadPoolExecutor(max_workers=50) as pool:
+        futures = [pool.submit(validate_asset, {"$schema": marker, "id": str(i)}) for i in range(200)]
+        threading.Timer(0.2, server.delay.set).start()
+        results = [future.result(timeout=10) for future in futures]
+    assert all(result["ok"] for result in results)
+    assert len(server.requests) == 1
+
+
+def test_expired_schema_is_revalidated(server, monkeypatch):
+    marker = _marker(server)
+    assert validate_asset({"$schema": marker, "id": "a"})["ok"] is True
+    assert validate_asset({"$schema": marker, "id": "a"})["ok"] is True
+    assert len(server.requests) == 1
+
+    monkeypatch.setenv("MCP_REMOTE_SCHEMA_TTL", "0")
+    assert validate_asset({"$schema": marker, "id": "a"})["ok"] is True
+    assert server.requests[-1].get("If-None-Match")
+    assert remote.remote_schema_stats()["not_modified"] >= 1
+
+    # Upstream changes are picked up on the next revalidation.
+    server.body = {"type": "object", "required": ["id", "name"]}
+    assert validate_asset({"$schema": marker, "id": "a"})["ok"] is False
+
+
+def test_disk_tier_and_stale_on_error(server, monkeypatch):
+    marker = _marker(server)
+    assert validate_asset({"$schema": marker, "id": "a"})["ok"] is True
+    remote.invalidate_remote_schemas()
+    invalidate_validator_cache()
+    assert validate_asset({"$schema": marker, "id": "b"})["ok"] is True
+    assert len(server.requests) == 1
+    assert remote.remote_schema_stats()["disk_reads"] >= 1
+
+    server.close()
+    monkeypatch.setenv("MCP_REMOTE_SCHEMA_TTL", "0")
+    invalidate_validator_cache()
+    assert validate_asset({"$schema": marker, "id": "c"})["ok"] is True
+    assert remote.remote_schema_stats()["stale"] >= 1
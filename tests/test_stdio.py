@@ -325,6 +325,18 @@ def test_stdio_unsupported_uses_detail(monkeypatch):
     assert result.get("detail") == "tool not implemented"
 
 
+def test_dispatch_coerces_diff_flags(monkeypatch):
+    import mcp.stdio_main as stdio
+
+    seen = []
+    monkeypatch.setattr(stdio, "diff_assets", lambda *args, **kwargs: seen.append(kwargs) or {"ok": True})
+    stdio.dispatch("diff_assets", {"hashed": [1], "moves": "yes"})
+    stdio.dispatch("diff_assets", {"hashed": 0, "moves": []})
+    stdio.dispatch("diff_assets", {})
+    assert [kwargs["hashed"] for kwargs in seen] == [True, False, None]
+    assert [kwargs["moves"] for kwargs in seen] == [True, False, None]
+
+
 def test_parse_line_rejects_wrong_jsonrpc():
     bad = json.dumps({
         "jsonrpc": "1.0",
@@ -393,3 +405,60 @@ def test_stdio_rejects_oversized_request(monkeypatch):
     assert result.get("reason") == "validation_failed"
     errors = result.get("errors", [])
     assert errors and errors[0].get("msg") == "payload_too_large"
+
+
+def test_process_line_handles_batches(monkeypatch):
+    calls = []
+
+    def handler(method, params):
+        calls.append((method, transport.current_frame_size()))
+        return {"ok": True, "method": method}
+
+    line = json.dumps([
+        {"jsonrpc": "2.0", "id": 1, "method": "list_schemas"},
+        {"jsonrpc": "1.0", "id": 2, "method": "list_schemas"},
+        "not a request",
+        {"jsonrpc": "2.0", "id": 4, "method": "get_schema", "params": {"name": "x"}},
+    ])
+    size = len(line.encode("utf-8"))
+    responses = json.loads(transport.process_line(line, handler))
+    assert [r["id"] for r in responses] == [1, 2, None, 4]
+    assert responses[0]["result"] == {"ok": True, "method": "list_schemas"}
+    assert responses[1]["result"]["reason"] == "invalid_jsonrpc_version"
+    assert responses[2]["result"]["errors"] == [{"path": "/", "msg": "request must be an object"}]
+    assert calls == [("list_schemas", size), ("get_schema", size)]
+
+    monkeypatch.setenv("MCP_BATCH_WORKERS", "4")
+    calls.clear()
+    assert json.loads(transport.process_line(line, handler)) == responses
+    assert sorted(calls) == [("get_schema", size), ("list_schemas", size)]
+
+
+def test_shared_thread_pool_resizes_without_breaking_leases():
+    pool = transport.SharedThreadPool("mcp-test")
+    with pool.lease(2) as old:
+        with pool.lease(3) as new:
+            assert new is not old
+            assert old.submit(int, "1").result() == 1
+        assert old.submit(int, "2").result() == 2
+    # The old executor is shut down once its last lease is returned.
+    with pytest.raises(RuntimeError):
+        old.submit(int, "3")
+    with pool.lease(3) as again:
+        assert again is new
+    new.shutdown()
+
+
+def test_process_line_rejects_empty_and_oversized_batches():
+    empty = json.loads(transport.process_line("[]", lambda _m, _p: {"ok": True}))
+    assert empty["id"] is None
+    assert empty["result"]["reason"] == "validation_failed"
+    assert empty["result"]["errors"] == [
+        {"path": "/", "msg": "batch must contain at least one request"}
+    ]
+
+    item = {"jsonrpc": "2.0", "id": 1, "method": "m", "params": {"blob": "x" * 1024}}
+    line = json.dumps([item] * (MAX_BYTES // 1024))
+    assert len(line.encode("utf-8")) > MAX_BYTES
+    frame = json.loads(transport.process_line(line, lambda _m, _p: {"ok": True}))
+    assert frame["result"]["errors"] == [{"path": "", "msg": "payload_too_large"}]
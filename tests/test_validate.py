@@ -1,4 +1,6 @@
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -218,3 +220,321 @@ def test_validate_asset_rejects_legacy_keys(payload):
     assert res["ok"] is False
     assert res["reason"] == "validation_failed"
     assert res["errors"][0]["path"] == "/$schema"
+
+
+def _write_minimal_schema(schemas_dir: Path, min_length: int = 1) -> Path:
+    schemas_dir.mkdir(exist_ok=True)
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {"id": {"type": "string", "minLength": min_length}},
+        "required": ["id"],
+    }
+    path = schemas_dir / "asset.schema.json"
+    path.write_text(json.dumps(schema))
+    return path
+
+
+def test_validator_cache_reuses_compiled_validator(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_validator_cache, validator_cache_stats
+
+    _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    invalidate_validator_cache()
+
+    before = validator_cache_stats()
+    assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"})["ok"] is True
+    assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "b"})["ok"] is True
+    after = validator_cache_stats()
+
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+def test_validator_cache_picks_up_schema_edits(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_validator_cache
+
+    path = _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    invalidate_validator_cache()
+
+    asset = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "abc"}
+    assert validate_asset(asset)["ok"] is True
+
+    _write_minimal_schema(tmp_path / "schemas", min_length=5)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    res = validate_asset(asset)
+    assert res["ok"] is False
+    assert res["errors"][0]["path"] == "/id"
+
+
+def test_validator_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_validator_cache, validator_cache_stats
+
+    monkeypatch.setenv("MCP_VALIDATOR_CACHE_SIZE", "1")
+    invalidate_validator_cache()
+    before = validator_cache_stats()
+
+    for index in range(3):
+        schemas_dir = tmp_path / f"schemas-{index}"
+        _write_minimal_schema(schemas_dir)
+        monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas_dir))
+        assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"})["ok"] is True
+
+    after = validator_cache_stats()
+    assert after["size"] == 1
+    assert after["evictions"] - before["evictions"] == 2
+    assert invalidate_validator_cache() == 1
+    assert validator_cache_stats()["size"] == 0
+
+
+def test_local_registry_is_shared_until_schema_tree_changes(tmp_path, monkeypatch):
+    from mcp import validate as validate_module
+
+    base_dir = tmp_path / "synesthetic-schemas"
+    registry_dir = base_dir / "jsonschema"
+    registry_dir.mkdir(parents=True)
+    (base_dir / "version.json").write_text(json.dumps({"schemaVersion": "0.7.3"}))
+    shared = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": "https://example.test/shared.schema.json",
+        "type": "string",
+        "minLength": 2,
+    }
+    (registry_dir / "shared.schema.json").write_text(json.dumps(shared))
+
+    schemas_dir = tmp_path / "schemas"
+    schemas_dir.mkdir()
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {"id": {"$ref": "https://example.test/shared.schema.json"}},
+    }
+    (schemas_dir / "asset.schema.json").write_text(json.dumps(schema))
+
+    monkeypatch.setattr(validate_module, "_REGISTRY_BASE_DIR", base_dir)
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas_dir))
+    validate_module.invalidate_local_registry()
+
+    assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "ok"})["ok"] is True
+    generation = validate_module.registry_stats()["generation"]
+    assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "x"})["ok"] is False
+    assert validate_module.registry_stats()["generation"] == generation
+    assert validate_module.registry_stats()["files"] == 2
+
+    (registry_dir / "other.schema.json").write_text(json.dumps({"type": "object"}))
+    assert validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": "ok"})["ok"] is True
+    assert validate_module.registry_stats()["generation"] == generation + 1
+
+
+def test_validate_many_worker_pool_preserves_order(tmp_path, monkeypatch, caplog):
+    from mcp.workers import shutdown_worker_pool
+
+    _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    assets = [
+        {"$schema": CANONICAL_ASSET_SCHEMA, "id": "" if index % 3 == 0 else f"a{index}"}
+        for index in range(24)
+    ]
+    assets.append({"id": "missing-marker"})
+
+    serial = validate_many(assets)
+
+    monkeypatch.setenv("MCP_VALIDATE_WORKERS", "2")
+    try:
+        parallel = validate_many(assets)
+    finally:
+        shutdown_worker_pool()
+
+    assert "worker_pool_failed" not in caplog.text
+    assert parallel == serial
+    assert [entry["ok"] for entry in parallel["results"][:4]] == [False, True, True, False]
+    assert parallel["results"][-1]["errors"][0]["path"] == "/$schema"
+
+
+def test_validate_many_resolves_each_schema_once(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_validator_cache, validator_cache_stats
+
+    schemas_dir = tmp_path / "schemas"
+    _write_minimal_schema(schemas_dir)
+    (schemas_dir / "tone.schema.json").write_text(
+        json.dumps({"type": "object", "required": ["tone"]})
+    )
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas_dir))
+    invalidate_validator_cache()
+    tone_schema = f"{CANONICAL_PREFIX}tone.schema.json"
+
+    assets = [
+        {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"},
+        {"$schema": tone_schema, "tone": 1},
+        {"$schema": CANONICAL_ASSET_SCHEMA, "id": ""},
+        {"$schema": tone_schema},
+        "not-an-object",
+        {"$schema": CANONICAL_ASSET_SCHEMA, "id": "b"},
+    ]
+    before = validator_cache_stats()
+    res = validate_many(assets, debug=True)
+    after = validator_cache_stats()
+
+    lookups = (after["hits"] + after["misses"]) - (before["hits"] + before["misses"])
+    assert lookups == 2
+    assert [entry["ok"] for entry in res["results"]] == [True, True, False, False, False, True]
+    assert res["results"][3]["errors"][0]["msg"] == "'tone' is a required property"
+    groups = {group["schema"]: group for group in res["groups"]}
+    assert groups[CANONICAL_ASSET_SCHEMA]["count"] == 3
+    assert groups[tone_schema]["count"] == 2
+    assert groups[None]["count"] == 1
+    assert all(group["elapsed_ms"] >= 0 for group in res["groups"])
+    assert "groups" not in validate_many(assets)
+
+
+def test_validate_many_groups_by_resolved_schema(tmp_path, monkeypatch):
+    from mcp import validate
+
+    schemas_dir = tmp_path / "schemas"
+    _write_minimal_schema(schemas_dir)
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas_dir))
+    monkeypatch.setitem(validate._SCHEMA_ALIASES, "asset-alias", "asset")
+
+    assets = [
+        {"$schema": CANONICAL_ASSET_SCHEMA, "id": "a"},
+        {"$schema": f"{CANONICAL_ASSET_SCHEMA}#", "id": "b"},
+        {"$schema": f"{CANONICAL_PREFIX}asset-alias.schema.json", "id": "c"},
+        {"$schema": "https://example.com/asset.schema.json", "id": "d"},
+    ]
+    res = validate_many(assets, debug=True)
+    assert [entry["ok"] for entry in res["results"]] == [True, True, True, False]
+    assert {group["schema"]: group["count"] for group in res["groups"]} == {
+        CANONICAL_ASSET_SCHEMA: 3,
+        "https://example.com/asset.schema.json": 1,
+    }
+
+
+def test_result_cache_memoizes_repeat_validations(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_result_cache, result_cache_stats
+
+    path = _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    invalidate_result_cache()
+
+    asset = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "abc", "extra": {"b": 1, "a": 2}}
+    reordered = {"extra": {"a": 2, "b": 1}, "id": "abc", "$schema": CANONICAL_ASSET_SCHEMA}
+    before = result_cache_stats()
+    first = validate_asset(asset)
+    second = validate_asset(reordered)
+    after = result_cache_stats()
+    assert first == second == {"ok": True, "errors": []}
+    assert after["hits"] - before["hits"] == 1
+
+    # Editing the schema changes its fingerprint, so the memoized verdict is not reused.
+    _write_minimal_schema(tmp_path / "schemas", min_length=5)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert validate_asset(asset)["ok"] is False
+
+    monkeypatch.setenv("MCP_RESULT_CACHE", "0")
+    hits = result_cache_stats()["hits"]
+    validate_asset(asset)
+    validate_asset(asset)
+    assert result_cache_stats()["hits"] == hits
+
+
+def test_result_cache_handles_lone_surrogates(tmp_path, monkeypatch):
+    from mcp.stdio_main import dispatch
+    from mcp.transport import process_line
+    from mcp.validate import invalidate_result_cache, result_cache_stats
+
+    _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    invalidate_result_cache()
+
+    line = (
+        '{"jsonrpc": "2.0", "id": 1, "method": "validate_asset", "params": {"asset": '
+        f'{{"$schema": "{CANONICAL_ASSET_SCHEMA}", "id": "\\ud800"}}}}}}'
+    )
+    asset = json.loads(line)["params"]["asset"]
+    assert asset["id"] == "\ud800"
+    before = result_cache_stats()
+    assert validate_asset(asset) == {"ok": True, "errors": []}
+    assert json.loads(process_line(line, dispatch))["result"] == {"ok": True, "errors": []}
+    assert result_cache_stats()["hits"] - before["hits"] == 1
+    other = dict(asset, id="\udfff")
+    assert validate_asset(other)["ok"] is True
+    assert result_cache_stats()["hits"] - before["hits"] == 1
+
+def test_result_cache_honours_budget_and_ttl(tmp_path, monkeypatch):
+    from mcp.validate import invalidate_result_cache, result_cache_stats
+
+    _write_minimal_schema(tmp_path / "schemas")
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(tmp_path / "schemas"))
+    monkeypatch.setenv("MCP_RESULT_CACHE_BYTES", "600")
+    invalidate_result_cache()
+
+    for index in range(5):
+        validate_asset({"$schema": CANONICAL_ASSET_SCHEMA, "id": f"id-{index}"})
+    stats = result_cache_stats()
+    assert stats["bytes"] <= 600
+    assert stats["size"] == 2
+
+    monkeypatch.setenv("MCP_RESULT_CACHE_TTL", "0.01")
+    invalidate_result_cache()
+    asset = {"$schema": CANONICAL_ASSET_SCHEMA, "id": "ttl"}
+    validate_asset(asset)
+    time.sleep(0.05)
+    before = result_cache_stats()["expirations"]
+    validate_asset(asset)
+    assert result_cache_stats()["expirations"] == before + 1
+
+
+def test_encoded_size_matches_json_dumps():
+    from mcp.validate import _encoded_size
+
+    samples = [
+        {},
+        [],
+        {"a": [1, 2.5, -0.0, True, False, None], "b": {"c": "d"}},
+        {"uni": "é ☃ \U0001f600", "ctl": "tab\tnl\n\"q\"\\"},
+        {1: "int key", 2.5: "float key", True: "bool", None: "none"},
+        [float("nan"), float("inf"), float("-inf"), 10**30, 1e-7],
+        ("tuple", ["nested", ("deep", {"k": []})]),
+    ]
+    for sample in samples:
+        expected = len(json.dumps(sample).encode("utf-8"))
+        assert _encoded_size(sample, 10**9) == expected
+
+
+def test_encoded_size_aborts_past_limit():
+    from mcp.validate import _encoded_size
+
+    looped: list = []
+    looped.append(looped)
+    assert _encoded_size(looped, 1024) > 1024
+    assert 5000 < _encoded_size(["x" * 100] * 1000, 5000) < 6000
+    with pytest.raises(TypeError):
+        _encoded_size({"bad": object()}, 1024)
+
+
+def test_validate_asset_trusts_transport_size_hint():
+    oversized = {"$schema": CANONICAL_SYNESTHETIC_SCHEMA, "blob": "x" * 16}
+    res = validate_asset(oversized, size_hint=MAX_BYTES + 1)
+    assert res["errors"] == [{"path": "/", "msg": "payload_too_large"}]
+    many = validate_many([oversized], size_hint=MAX_BYTES + 1)
+    assert many["results"][0]["errors"][0]["msg"] == "payload_too_large"
+
+
+def test_process_line_exposes_frame_size():
+    from mcp.transport import current_frame_size, process_line
+
+    seen = []
+
+    def handler(method, params):
+        seen.append(current_frame_size())
+        return {"ok": True}
+
+    line = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping", "params": {"s": "é"}})
+    process_line(line, handler)
+    process_line(line, handler, size=123)
+    assert seen == [len(line.encode("utf-8")), 123]
+    assert current_frame_size() is None
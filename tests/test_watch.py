@@ -0,0 +1,120 @@
+import json
+import os
+import time
+
+import pytest
+
+from mcp.core import (
+    get_example,
+    get_schema,
+    invalidate_example_cache,
+    invalidate_example_index,
+    invalidate_schema_catalog,
+    list_examples,
+    list_schemas,
+    watching,
+)
+from mcp.watch import Watcher, inotify_available, watch_interval, watch_mode
+
+CANONICAL_ASSET_SCHEMA = "https://delk73.github.io/synesthetic-schemas/schema/0.7.3/asset.schema.json"
+
+BACKENDS = ["poll", pytest.param("inotify", marks=pytest.mark.skipif(
+    not inotify_available(), reason="inotify unavailable"))]
+
+
+def _schema(path, min_length):
+    path.write_text(json.dumps({
+        "version": str(min_length),
+        "type": "object",
+        "properties": {"id": {"type": "string", "minLength": min_length}},
+        "required": ["id"],
+    }))
+
+
+def _setup(tmp_path, monkeypatch):
+    schemas = tmp_path / "schemas"
+    examples = tmp_path / "examples"
+    schemas.mkdir()
+    examples.mkdir()
+    _schema(schemas / "asset.schema.json", 1)
+    (examples / "asset.basic.json").write_text(
+        json.dumps({"$schema": CANONICAL_ASSET_SCHEMA, "id": "abc"})
+    )
+    old = 1_600_000_000_000_000_000
+    for path in (schemas / "asset.schema.json", examples / "asset.basic.json", schemas, examples):
+        os.utime(path, ns=(old, old))
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(schemas))
+    monkeypatch.setenv("SYN_EXAMPLES_DIR", str(examples))
+    monkeypatch.setenv("LABS_SCHEMA_CACHE_DIR", str(tmp_path / "cache"))
+    invalidate_schema_catalog()
+    invalidate_example_index()
+    invalidate_example_cache()
+    targets = {"schemas": schemas, "examples": examples}
+    return schemas, examples, targets
+
+
+def _eventually(check, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if check():
+            return True
+        time.sleep(0.02)
+    return check()
+
+
+@pytest.mark.parametrize("mode", BACKENDS)
+def test_watcher_publishes_schema_and_example_edits(tmp_path, monkeypatch, mode):
+    schemas, examples, targets = _setup(tmp_path, monkeypatch)
+    with Watcher(targets, mode=mode, interval=0.05) as watcher:
+        assert watcher.backend == mode
+        assert watching()
+        assert get_schema("asset")["version"] == "1"
+        assert get_example("asset.basic.json")["ok"] is True
+
+        _schema(schemas / "asset.schema.json", 10)
+        assert _eventually(lambda: get_schema("asset")["version"] == "10")
+        assert _eventually(lambda: get_example("asset.basic.json")["ok"] is False)
+
+        (examples / "nested").mkdir()
+        (examples / "nested" / "asset.extra.json").write_text("{}")
+        assert _eventually(lambda: len(list_examples("asset")["examples"]) == 2)
+    assert not watching()
+
+
+def test_watcher_skips_per_request_stat_calls(tmp_path, monkeypatch):
+    _, _, targets = _setup(tmp_path, monkeypatch)
+    with Watcher(targets, mode="poll", interval=60):
+        list_schemas()
+        list_examples()
+        get_example("asset.basic.json")
+
+        calls = []
+        real_stat = os.stat
+
+        def counting(*args, **kwargs):
+            calls.append(args[0])
+            return real_stat(*args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", counting)
+        for _ in range(3):
+            list_schemas()
+            get_schema("asset")
+            list_examples()
+            get_example("asset.basic.json")
+        monkeypatch.setattr(os, "stat", real_stat)
+    assert calls == []
+
+
+def test_watch_env_parsing(monkeypatch):
+    monkeypatch.delenv("MCP_WATCH", raising=False)
+    assert watch_mode() == "off"
+    monkeypatch.setenv("MCP_WATCH", "1")
+    assert watch_mode() == "auto"
+    monkeypatch.setenv("MCP_WATCH", "poll")
+    assert watch_mode() == "poll"
+    monkeypatch.setenv("MCP_WATCH", "fanotify")
+    with pytest.raises(RuntimeError):
+        watch_mode()
+    monkeypatch.setenv("MCP_WATCH_INTERVAL", "0")
+    with pytest.raises(RuntimeError):
+        watch_interval()